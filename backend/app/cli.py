@@ -0,0 +1,114 @@
+"""
+Command-line tasks for the backend, run from the backend directory:
+
+    python -m app.cli build-snapshots [--years 2023-2026]
+    python -m app.cli refresh-store [--years 2025-2026] [--every 900]
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from .services.barttorvik_service import BULK_LOAD_THREADS, BULK_PARSE_PROCESSES, BartTorvik
+from .services.season_cache import season_year
+
+
+def parse_years(value: str) -> List[int]:
+    """Accept "2025", "2023-2026" or "2021,2023,2025" """
+    years = []
+    for part in value.split(","):
+        if "-" in part:
+            start, end = part.split("-", 1)
+            years.extend(range(int(start), int(end) + 1))
+        else:
+            years.append(int(part))
+    return sorted(set(years))
+
+
+def build_snapshots(args: argparse.Namespace) -> int:
+    """Download each season and write its snapshot, so new instances start warm"""
+    # A one-off backfill: fetch seasons concurrently and parse them in a process pool
+    service = BartTorvik(snapshot_dir=args.snapshot_dir, parse_processes=BULK_PARSE_PROCESSES)
+    if not service.snapshots.enabled:
+        return 1
+
+    def refresh(year: int):
+        try:
+            return service.refresh_season(year)
+        except Exception as e:
+            return e
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(len(args.years), BULK_LOAD_THREADS))) as pool:
+            results = list(pool.map(refresh, args.years))
+    finally:
+        service.shutdown_parser(wait=True)
+
+    failed = []
+    for year, entry in zip(args.years, results):
+        if isinstance(entry, Exception):
+            print(f"{year}: failed ({entry})")
+            failed.append(year)
+            continue
+
+        if entry.data.empty:
+            print(f"{year}: no data")
+            failed.append(year)
+        else:
+            print(f"{year}: {len(entry.data)} teams, version {entry.version} -> {service.snapshots.path(year)}")
+
+    return 1 if failed else 0
+
+
+def refresh_store(args: argparse.Namespace) -> int:
+    """Keep the shared season store current so web workers never download seasons themselves"""
+    service = BartTorvik(snapshot_dir=args.snapshot_dir)
+    if not service.snapshots.enabled:
+        return 1
+
+    while True:
+        for year in args.years:
+            started = time.perf_counter()
+            try:
+                entry = service.refresh_season(year)
+                print(f"{year}: version {entry.version} ({time.perf_counter() - started:.2f}s)")
+            except Exception as e:
+                print(f"{year}: refresh failed ({e})")
+        if not args.every:
+            return 0
+        time.sleep(args.every)
+
+
+def main(argv=None) -> int:
+    current_year = season_year()
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Backend maintenance tasks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build-snapshots", help="pre-build on-disk season snapshots")
+    build.add_argument(
+        "--years",
+        type=parse_years,
+        default=list(range(current_year - 2, current_year + 1)),
+        help="seasons to build, e.g. 2025 or 2023-2026 (default: current and two previous)",
+    )
+    build.add_argument("--snapshot-dir", help="override BARTTORVIK_SNAPSHOT_DIR")
+    build.set_defaults(handler=build_snapshots)
+
+    refresh = commands.add_parser("refresh-store", help="refresh the shared season store, optionally in a loop")
+    refresh.add_argument(
+        "--years",
+        type=parse_years,
+        default=[current_year],
+        help="seasons to keep current (default: current season)",
+    )
+    refresh.add_argument("--every", type=float, help="seconds between passes; omit for a single pass")
+    refresh.add_argument("--snapshot-dir", help="override BARTTORVIK_SNAPSHOT_DIR")
+    refresh.set_defaults(handler=refresh_store)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
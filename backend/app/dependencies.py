@@ -0,0 +1,15 @@
+"""
+Shared FastAPI dependencies.
+
+The BartTorvik service is created in the app lifespan and kept on
+``app.state``; routes receive it through ``Depends`` instead of importing a
+module-level instance, so importing a router builds nothing.
+"""
+from fastapi import Request
+
+from .services.barttorvik_service import AsyncBartTorvik
+
+
+def get_bt_service(request: Request) -> AsyncBartTorvik:
+    """The application's BartTorvik client"""
+    return request.app.state.bt_service
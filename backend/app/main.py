@@ -1,18 +1,40 @@
 """
 Main FastAPI application for College Basketball Opponent Scouting Dashboard.
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from .routers import teams
+from fastapi.responses import JSONResponse
+from .routers import conferences, predict, scouting, seasons, teams
+from .services.barttorvik_service import AsyncBartTorvik
+from .services.refresh_scheduler import RefreshScheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the BartTorvik client, then warm and refresh seasons in the background until shutdown."""
+    app.state.bt_service = AsyncBartTorvik()
+    app.state.scheduler = RefreshScheduler(app.state.bt_service)
+    app.state.scheduler.start()
+    yield
+    await app.state.scheduler.stop()
+    await app.state.bt_service.aclose()
+
 
 app = FastAPI(
     title="College Basketball Scouting API",
     description="API for college basketball opponent scouting dashboard",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Include routers
 app.include_router(teams.router)
+app.include_router(predict.router)
+app.include_router(seasons.router)
+app.include_router(conferences.router)
+app.include_router(scouting.router)
 
 # Configure CORS
 app.add_middleware(
@@ -35,9 +57,15 @@ async def root():
 
 
 @app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy"}
+async def health_check(request: Request):
+    """Health check endpoint; 503 until the startup warmup has loaded the current season."""
+    scheduler = request.app.state.scheduler
+    body = {
+        "status": "healthy" if scheduler.ready else "warming",
+        "refresh": scheduler.status(),
+        "cache": request.app.state.bt_service.cache_stats(),
+    }
+    return body if scheduler.ready else JSONResponse(body, status_code=503)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+"""
+Request bodies for the /teams endpoints.
+"""
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ComparisonMatrixRequest(BaseModel):
+    """Teams to compare pairwise: explicit names, a whole conference, or both"""
+    teams: List[str] = Field(default_factory=list, description="Team names, ids or aliases")
+    conference: Optional[str] = Field(None, description="Add every team in this conference, e.g. B10")
+    metrics: Optional[List[str]] = Field(None, description="Metrics to compare (default: all comparable metrics)")
+
+
+# Names accepted by one /teams/batch request; a full schedule is ~35 teams
+MAX_BATCH_TEAMS = 500
+
+
+class BatchTeamsRequest(BaseModel):
+    """Teams to fetch in one call, returned in the order given"""
+    teams: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_TEAMS, description="Team names, ids or aliases")
+    fields: Optional[List[str]] = Field(None, description="Columns to return, e.g. [\"team_id\", \"team\", \"barthag\"] (default: all)")
@@ -0,0 +1,35 @@
+"""
+HTTP responses for bodies the service has already serialized.
+"""
+from typing import Set
+
+from fastapi import Request, Response
+
+from .services.response_cache import CachedBody
+
+
+def accepted_encodings(accept_encoding: str) -> Set[str]:
+    """Content codings an ``Accept-Encoding`` header allows (q=0 excludes one)"""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if params and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        if coding:
+            accepted.add(coding.strip())
+    return accepted
+
+
+def cached_response(request: Request, cached: CachedBody) -> Response:
+    """Send the cached bytes, compressed if the client accepts it, or an empty 304 if it already has them"""
+    encoding = cached.encoding_for(accepted_encodings(request.headers.get("accept-encoding", "")))
+    headers = {"ETag": cached.etag_for(encoding), "Cache-Control": cached.cache_control, "Vary": "Accept-Encoding"}
+    if cached.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=cached.encoded(encoding), media_type=cached.media_type, headers=headers)
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import Optional
+from ..dependencies import get_bt_service
+from ..responses import cached_response
+from ..services.barttorvik_service import AsyncBartTorvik
+
+router = APIRouter(prefix="/conferences", tags=["conferences"])
+
+@router.get("")
+async def get_conferences(
+    request: Request,
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """Every conference's metric means, medians, spread and range, win totals, top and bottom teams and strength rank"""
+    try:
+        conferences = await bt_service.get_conferences_json(year)
+        return cached_response(request, conferences) if conferences else {"conferences": []}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching conferences: {str(e)}")
+
+@router.get("/{conf}")
+async def get_conference(
+    request: Request,
+    conf: str,
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """Aggregates for one conference, by code (e.g. B10)"""
+    try:
+        conference = await bt_service.get_conference_json(conf, year)
+        
+        if not conference:
+            raise HTTPException(status_code=404, detail=f"Conference '{conf}' not found")
+            
+        return cached_response(request, conference)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching conference data: {str(e)}")
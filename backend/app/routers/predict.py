@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from ..dependencies import get_bt_service
+from ..services.barttorvik_service import AsyncBartTorvik
+from ..services.team_identity import AmbiguousTeamError
+from .teams import ambiguous_team
+
+router = APIRouter(prefix="/predict", tags=["predict"])
+
+@router.get("")
+async def predict_game(
+    team1: str = Query(..., description="Team name, id or alias"),
+    team2: Optional[str] = Query(None, description="Opponent (default: every team in the season)"),
+    venue: str = Query("neutral", pattern="^(home|away|neutral)$", description="Where team1 plays: home, away or neutral"),
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """Win probability, expected score and margin for team1 against one opponent or all of them"""
+    try:
+        prediction = await bt_service.get_prediction(team1, team2, venue, year)
+
+        if not prediction:
+            raise HTTPException(
+                status_code=404,
+                detail=f"One or both teams not found: '{team1}', '{team2}'" if team2 else f"Team '{team1}' not found"
+            )
+            
+        return prediction
+    except HTTPException:
+        raise
+    except AmbiguousTeamError as e:
+        raise ambiguous_team(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error predicting game: {str(e)}")
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import Optional
+from ..dependencies import get_bt_service
+from ..responses import cached_response
+from ..services.barttorvik_service import AsyncBartTorvik
+from ..services.team_identity import AmbiguousTeamError
+from .teams import ambiguous_team
+
+router = APIRouter(prefix="/scouting", tags=["scouting"])
+
+@router.get("/{our_team}/{opponent}")
+async def get_scouting_report(
+    request: Request,
+    our_team: str,
+    opponent: str,
+    venue: str = Query("neutral", pattern="^(home|away|neutral)$", description="Where our_team plays: home, away or neutral"),
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """Everything a game preparation page needs in one call
+    
+    The opponent's profile, percentiles and scouting notes, both teams' stats, their
+    metric comparison and the win probability and expected score at ``venue``.
+    """
+    try:
+        report = await bt_service.get_scouting_json(our_team, opponent, venue, year)
+        
+        if not report:
+            raise HTTPException(status_code=404, detail=f"One or both teams not found: '{our_team}', '{opponent}'")
+            
+        return cached_response(request, report)
+    except HTTPException:
+        raise
+    except AmbiguousTeamError as e:
+        raise ambiguous_team(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error building scouting report: {str(e)}")
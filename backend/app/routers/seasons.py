@@ -0,0 +1,84 @@
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from ..dependencies import get_bt_service
+from ..responses import cached_response
+from ..services.barttorvik_service import AsyncBartTorvik
+from .teams import FIELDS_DESCRIPTION, split_fields
+
+router = APIRouter(prefix="/seasons", tags=["seasons"])
+
+# Media types per export format; kept here so importing the router stays light
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+async def stream_export(
+    bt_service: AsyncBartTorvik,
+    start: Optional[int],
+    end: Optional[int],
+    fmt: str,
+    fields: Optional[str]
+) -> StreamingResponse:
+    """Stream the seasons' rows chunk by chunk; 400 for a bad range or field, 404 if no season loads"""
+    try:
+        export = await bt_service.export_seasons(start, end, fmt, split_fields(fields))
+        
+        if export is None:
+            raise HTTPException(status_code=404, detail="No season data found for the requested range")
+            
+        # Named for the range the service resolved, defaults included
+        years, chunks = export
+        filename = f"barttorvik_{years[0]}" if len(years) == 1 else f"barttorvik_{years[0]}-{years[-1]}"
+        return StreamingResponse(
+            chunks,
+            media_type=EXPORT_MEDIA_TYPES[fmt],
+            headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error exporting seasons: {str(e)}")
+
+@router.get("/export")
+async def export_season_range(
+    from_year: Optional[int] = Query(None, alias="from", description="First season (default: four seasons before 'to')"),
+    to_year: Optional[int] = Query(None, alias="to", description="Last season (default: current year)"),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """Stream every team row of a range of seasons; each row carries its season"""
+    return await stream_export(bt_service, from_year, to_year, format, fields)
+
+@router.get("/{year}/export")
+async def export_season(
+    year: int,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """Stream every team row of one season as NDJSON or CSV"""
+    return await stream_export(bt_service, year, year, format, fields)
+
+@router.get("/{year}.{fmt}")
+async def get_season_file(
+    request: Request,
+    year: int,
+    fmt: str = Path(..., pattern="^(arrow|parquet)$", description="arrow (Arrow IPC file) or parquet"),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """The whole season as one columnar file, for loading straight into pandas or another Arrow reader"""
+    try:
+        season_file = await bt_service.get_season_file(year, fmt)
+        
+        if season_file is None:
+            raise HTTPException(status_code=404, detail=f"No data found for {year}")
+            
+        response = cached_response(request, season_file)
+        response.headers["Content-Disposition"] = f'attachment; filename="barttorvik_{year}.{fmt}"'
+        return response
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error building season file: {str(e)}")
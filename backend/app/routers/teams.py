@@ -1,60 +1,227 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import Optional, List
-from ..services.barttorvik_service import BartTorvik
+from ..dependencies import get_bt_service
+from ..responses import cached_response
+from ..services.barttorvik_service import AsyncBartTorvik
+from ..models.teams import BatchTeamsRequest, ComparisonMatrixRequest
+from ..services.metrics import UnknownMetricError
+from ..services.team_identity import AmbiguousTeamError, UnknownTeamError
 
 router = APIRouter(prefix="/teams", tags=["teams"])
-bt_service = BartTorvik()
+
+FIELDS_DESCRIPTION = "Comma-separated columns to return, e.g. team_id,team,conf,record,barthag (default: all)"
+
+def split_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """``"team,conf,barthag"`` -> ``["team", "conf", "barthag"]``"""
+    return [name.strip() for name in fields.split(",") if name.strip()] if fields else None
+
+def ambiguous_team(e: AmbiguousTeamError) -> HTTPException:
+    """409 listing the teams a name could mean, so the client can ask which one"""
+    return HTTPException(
+        status_code=409,
+        detail={"message": str(e), "name": e.name, "candidates": e.candidates}
+    )
 
 @router.get("/search")
 async def search_teams(
+    request: Request,
     query: str = Query(..., description="Team name to search for"),
-    year: Optional[int] = Query(None, description="Year (default: current year)")
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
 ):
     """Search for teams by name"""
     try:
-        results = bt_service.search_teams(query, year)
-        return {"teams": results}
+        results = await bt_service.search_teams_json(query, year, split_fields(fields))
+        return cached_response(request, results) if results else {"teams": []}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching teams: {str(e)}")
 
 @router.get("/list")
 async def get_all_teams(
-    year: Optional[int] = Query(None, description="Year (default: current year)")
+    request: Request,
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
 ):
     """Get list of all available teams"""
     try:
-        teams = bt_service.get_available_teams(year)
-        return {"teams": teams}
+        teams = await bt_service.get_available_teams_json(year)
+        return cached_response(request, teams) if teams else {"teams": []}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching teams: {str(e)}")
 
+# Parameters of /teams/query that are not filters
+QUERY_OPTIONS = {"year", "sort", "limit", "offset", "fields"}
+
+@router.get("/query")
+async def query_teams(
+    request: Request,
+    sort: Optional[str] = Query(None, description="Comma-separated sort keys, '-' for descending, e.g. conf,-barthag (default: rank)"),
+    limit: Optional[int] = Query(None, description="Teams per page (default 50, at most 500)"),
+    offset: Optional[int] = Query(None, description="Teams to skip"),
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """Filter, sort and page the season's teams
+    
+    Any other parameter is a filter: ``conf=B10`` (or ``conf=B10,SEC``) matches conferences,
+    ``<column>_gt``, ``_gte``, ``_lt`` and ``_lte`` compare a numeric column with a number, and
+    ``<column>_between=low,high`` keeps an inclusive range, e.g. ``adjoe_gt=115&barthag_between=0.8,0.95``.
+    """
+    filters = {key: value for key, value in request.query_params.items() if key not in QUERY_OPTIONS}
+    try:
+        results = await bt_service.query_teams_json(filters, sort, limit, offset, year, split_fields(fields))
+        return cached_response(request, results) if results else {"total": 0, "offset": offset or 0, "limit": limit, "teams": []}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error querying teams: {str(e)}")
+
 @router.get("/{team_name}")
 async def get_team_stats(
+    request: Request,
     team_name: str,
-    year: Optional[int] = Query(None, description="Year (default: current year)")
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
 ):
-    """Get detailed statistics for a specific team"""
+    """Get detailed statistics and scouting tags for a team, by name, team id or alias (e.g. UIUC)"""
     try:
-        team_data = bt_service.get_team_by_name(team_name, year)
+        team_data = await bt_service.get_team_json(team_name, year, split_fields(fields))
         
         if not team_data:
             raise HTTPException(status_code=404, detail=f"Team '{team_name}' not found")
             
-        return {"team": team_data}
+        return cached_response(request, team_data)
     except HTTPException:
         raise
+    except AmbiguousTeamError as e:
+        raise ambiguous_team(e)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching team data: {str(e)}")
 
+@router.get("/{team_name}/percentiles")
+async def get_team_percentiles(
+    team_name: str,
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """Get a team's percentile among all teams in each metric, plus the season's quartiles and deciles"""
+    try:
+        percentiles = await bt_service.get_team_percentiles(team_name, year)
+        
+        if not percentiles:
+            raise HTTPException(status_code=404, detail=f"Team '{team_name}' not found")
+            
+        return percentiles
+    except HTTPException:
+        raise
+    except AmbiguousTeamError as e:
+        raise ambiguous_team(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching team percentiles: {str(e)}")
+
+@router.get("/{team_name}/history")
+async def get_team_history(
+    team_name: str,
+    from_year: Optional[int] = Query(None, alias="from", description="First season (default: four seasons before 'to')"),
+    to_year: Optional[int] = Query(None, alias="to", description="Last season (default: current year)"),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """Get a team's rank, adjoe, adjde, barthag and WAB in each season of a range"""
+    try:
+        history = await bt_service.get_team_history(team_name, from_year, to_year)
+        
+        if not history:
+            raise HTTPException(status_code=404, detail=f"Team '{team_name}' not found in the requested seasons")
+            
+        return history
+    except HTTPException:
+        raise
+    except AmbiguousTeamError as e:
+        raise ambiguous_team(e)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching team history: {str(e)}")
+
+@router.post("/batch")
+async def get_teams_batch(
+    request: Request,
+    body: BatchTeamsRequest,
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """Get many teams' statistics in one call
+    
+    ``teams`` holds the records in request order (repeats dropped), ``resolved`` maps each
+    name given to its team id, and names that matched nothing or several teams are listed
+    in ``missing`` and ``ambiguous`` rather than failing the whole batch.
+    """
+    try:
+        teams = await bt_service.get_teams_json(body.teams, year, body.fields)
+        
+        if not teams:
+            raise HTTPException(status_code=404, detail="No season data found")
+            
+        return cached_response(request, teams)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching teams: {str(e)}")
+
+@router.post("/compare/matrix")
+async def compare_matrix(
+    request: ComparisonMatrixRequest,
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
+):
+    """Compare every pair among a list of teams and/or a conference in one call
+    
+    For each metric, ``difference[i][j]`` is team i minus team j and ``advantage[i][j]``
+    is 1 if team i is better, -1 if team j is, 0 if level.
+    """
+    if not request.teams and not request.conference:
+        raise HTTPException(status_code=400, detail="Provide 'teams', 'conference' or both")
+        
+    try:
+        matrix = await bt_service.get_comparison_matrix(request.teams, request.conference, request.metrics, year)
+        
+        if not matrix or not matrix["teams"]:
+            raise HTTPException(status_code=404, detail="No teams found to compare")
+            
+        return {"matrix": matrix}
+    except HTTPException:
+        raise
+    except AmbiguousTeamError as e:
+        raise ambiguous_team(e)
+    except UnknownTeamError as e:
+        raise HTTPException(status_code=404, detail={"message": str(e), "names": e.names})
+    except UnknownMetricError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": str(e), "names": e.names, "metrics": e.available},
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error comparing teams: {str(e)}")
+
 @router.get("/compare/{team1}/{team2}")
 async def compare_teams(
     team1: str,
     team2: str,
-    year: Optional[int] = Query(None, description="Year (default: current year)")
+    year: Optional[int] = Query(None, description="Year (default: current year)"),
+    bt_service: AsyncBartTorvik = Depends(get_bt_service)
 ):
     """Compare statistics between two teams"""
     try:
-        comparison = bt_service.get_opponent_comparison(team1, team2, year)
+        comparison = await bt_service.get_opponent_comparison(team1, team2, year)
         
         if not comparison:
             raise HTTPException(
@@ -65,5 +232,7 @@ async def compare_teams(
         return {"comparison": comparison}
     except HTTPException:
         raise
+    except AmbiguousTeamError as e:
+        raise ambiguous_team(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error comparing teams: {str(e)}")
\ No newline at end of file
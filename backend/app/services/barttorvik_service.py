@@ -1,101 +1,331 @@
-import requests
-import pandas as pd
-from typing import Optional, Dict, List
+import asyncio
+import hashlib
+import multiprocessing
+from typing import TYPE_CHECKING, Optional, Dict, Iterator, List, Tuple
 import os
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from .season_cache import SeasonCache, SeasonEntry, FRESH, STALE
+from .singleflight import SingleFlight, AsyncSingleFlight
+from .snapshots import SnapshotStore
+from .team_identity import AmbiguousTeamError, TeamDirectory, UnknownTeamError
+from .team_index import normalize_name
+from .response_cache import CachedBody, CachedJSON, ResponseCache
+from .metrics import COMPARISON_METRICS, advantage, higher_is_better
 
-class BartTorvik:
-    def __init__(self):
+# pandas, numpy and the HTTP clients are imported where first used, so
+# importing the app (and answering /health) does not wait for them
+if TYPE_CHECKING:
+    import httpx
+    import pandas as pd
+    from .conferences import ConferenceTable
+    from .matchups import MetricMatrix
+    from .percentiles import PercentileTable
+    from .predictions import MatchupPredictor
+    from .scouting import ScoutingTags
+    from .team_history import TeamHistory
+    from .team_query import SortOrders
+    from .team_rows import SeasonColumns
+
+# How often a worker checks the shared store for a version written by another process
+STORE_POLL_SECONDS = float(os.getenv("BARTTORVIK_STORE_POLL_SECONDS", "1"))
+
+# Processes that parse downloaded seasons; 0 parses in-process. A season parses in a few
+# milliseconds, so web workers default to 0 rather than each carrying a pool of ~120 MB children
+PARSE_PROCESSES = int(os.getenv("BARTTORVIK_PARSE_PROCESSES", "0"))
+
+# Parse pool for bulk backfills (app.cli build-snapshots), which parse many seasons at once
+BULK_PARSE_PROCESSES = min(4, os.cpu_count() or 1)
+
+# Seasons fetched at once by the sync bulk loader
+BULK_LOAD_THREADS = 8
+
+# Seconds a cold load waits for another worker's download of the same season before giving up
+SEASON_LOCK_TIMEOUT = float(os.getenv("BARTTORVIK_SEASON_LOCK_TIMEOUT", "60"))
+
+# Seconds clients and CDNs may reuse a current-season response before revalidating it
+RESPONSE_MAX_AGE = int(os.getenv("BARTTORVIK_RESPONSE_MAX_AGE", "60"))
+
+# Cross-season histories kept, keyed by the versions of the seasons they span
+HISTORY_CACHE_SIZE = 8
+
+class BaseBartTorvik:
+    """Configuration, caching and DataFrame-level queries shared by the sync and async clients"""
+    
+    def __init__(self, cache_ttl: Optional[float] = None, snapshot_dir: Optional[str] = None, parse_processes: Optional[int] = None):
         self.base_url = os.getenv("BARTTORVIK_BASE_URL", "https://barttorvik.com")
-        self.current_year = datetime.now().year
+        self.cache = SeasonCache(ttl=cache_ttl)
+        self.snapshots = SnapshotStore(snapshot_dir)
+        self._store_checked: Dict[int, float] = {}
+        self.parse_processes = PARSE_PROCESSES if parse_processes is None else parse_processes
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
+        self._histories: "OrderedDict[tuple, TeamHistory]" = OrderedDict()
+        self._histories_lock = threading.Lock()
         
-    def get_team_results(self, year: Optional[int] = None) -> pd.DataFrame:
-        """Fetch team results from BartTorvik for a given year"""
-        if year is None:
-            year = self.current_year
-            
-        url = f"{self.base_url}/{year}_team_results.csv"
+    @property
+    def current_year(self) -> int:
+        """The season in progress, named by the year it ends in"""
+        return self.cache.current_year
+    
+    def cache_stats(self) -> Dict:
+        """Cache counters for the health endpoint"""
+        return self.cache.stats()
+    
+    def _lookup(self, year: int):
+        """Cache lookup that first picks up any newer version in the shared store"""
+        self._sync_from_store(year)
+        return self.cache.lookup(year)
+    
+    def _sync_from_store(self, year: int, force: bool = False) -> None:
+        """Adopt a season another worker refreshed: reload a replaced file, or extend freshness on a touched one"""
+        if self._store_replaced(year, force):
+            self._reload_from_store(year)
+    
+    def _store_replaced(self, year: int, force: bool = False) -> bool:
+        """Poll the shared store: extend freshness on a touched season, True if another worker replaced it"""
+        now = time.monotonic()
+        if not force and now - self._store_checked.get(year, 0) < STORE_POLL_SECONDS:
+            return False
+        self._store_checked[year] = now
         
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            # Parse CSV manually to handle column alignment issues
-            lines = response.text.strip().split('\n')
-            data_rows = []
-            
-            for line in lines[1:]:  # Skip header
-                if line.strip():
-                    cols = line.split(',')
-                    if len(cols) >= 44:  # Ensure we have enough columns
-                        # Map the correct columns based on our analysis
-                        row = {
-                            'rank': int(cols[0]) if cols[0].isdigit() else 999,
-                            'team': cols[1],
-                            'conf': cols[2], 
-                            'record': cols[3],
-                            'adjoe': float(cols[4]) if cols[4].replace('.','').replace('-','').isdigit() else 0.0,
-                            'oe_rank': int(cols[5]) if cols[5].replace('.','').isdigit() else 999,
-                            'adjde': float(cols[6]) if cols[6].replace('.','').replace('-','').isdigit() else 0.0,
-                            'de_rank': int(cols[7]) if cols[7].replace('.','').isdigit() else 999,
-                            'barthag': float(cols[8]) if cols[8].replace('.','').replace('-','').isdigit() else 0.0,
-                            'sos': float(cols[15]) if len(cols) > 15 and cols[15].replace('.','').replace('-','').isdigit() else 0.0,
-                            'ncsos': float(cols[16]) if len(cols) > 16 and cols[16].replace('.','').replace('-','').isdigit() else 0.0,
-                            'WAB': float(cols[41]) if len(cols) > 41 and cols[41].replace('.','').replace('-','').isdigit() else 0.0,
-                        }
-                        
-                        # Parse wins and losses from record
-                        if '-' in row['record']:
-                            try:
-                                wins, losses = row['record'].split('-')
-                                row['wins'] = int(wins)
-                                row['losses'] = int(losses)
-                            except:
-                                row['wins'] = 0
-                                row['losses'] = 0
-                        else:
-                            row['wins'] = 0
-                            row['losses'] = 0
-                        
-                        data_rows.append(row)
-            
-            df = pd.DataFrame(data_rows)
-            return df
+        entry = self.cache.peek(year)
+        stat = self.snapshots.stat(year) if entry is not None else None
+        if stat is None:
+            return False
             
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching data from BartTorvik: {e}")
-            return pd.DataFrame()
+        store_id, validated_at = stat
+        if store_id != entry.store_id:
+            return True
+        if validated_at > entry.fetched_at:
+            entry.fetched_at = validated_at
+        return False
     
-    def get_team_by_name(self, team_name: str, year: Optional[int] = None) -> Optional[Dict]:
-        """Get specific team data by name"""
-        df = self.get_team_results(year)
-        
-        if df.empty:
+    def _reload_from_store(self, year: int) -> None:
+        """Load and prepare the store's version of a season in place of the cached one"""
+        reloaded = self.snapshots.load(year)
+        if reloaded is not None:
+            self._prepare(reloaded)
+            self.cache.put(reloaded)
+    
+    def _refreshed_elsewhere(self, year: int) -> bool:
+        """True if another worker refreshed the season while we waited for its lock"""
+        self._sync_from_store(year, force=True)
+        entry = self.cache.peek(year)
+        return entry is not None and self.cache.is_fresh(entry)
+    
+    def _season_url(self, year: int) -> str:
+        return f"{self.base_url}/{year}_team_results.csv"
+    
+    def _conditional_headers(self, previous: Optional[SeasonEntry]) -> Dict[str, str]:
+        """Validators that let the upstream answer 304 when a cached season is unchanged"""
+        headers = {}
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+        return headers
+    
+    def _keep_season(self, previous: SeasonEntry, headers, outcome: str) -> SeasonEntry:
+        """Mark an unchanged season fresh again without re-parsing it"""
+        previous.etag = headers.get("ETag") or previous.etag
+        previous.last_modified = headers.get("Last-Modified") or previous.last_modified
+        previous.fetched_at = time.time()
+        self.cache.put(previous)
+        self.snapshots.touch(previous.year)
+        self.cache.record_refresh(outcome)
+        return previous
+    
+    def _unchanged_season(self, previous: Optional[SeasonEntry], status: int, headers, content: bytes) -> Optional[SeasonEntry]:
+        """Return the cached season if the upstream response shows it has not changed"""
+        if previous is None:
             return None
+        if status == 304:
+            return self._keep_season(previous, headers, "not_modified")
+        if previous.content_hash == hashlib.sha256(content).hexdigest():
+            return self._keep_season(previous, headers, "unchanged")
+        return None
+    
+    def _store_season(self, year: int, df: "pd.DataFrame", headers, content: bytes) -> SeasonEntry:
+        """Wrap a parsed season in a cache entry and store it"""
+        entry = SeasonEntry(
+            year=year,
+            data=df,
+            fetched_at=time.time(),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            content_hash=hashlib.sha256(content).hexdigest(),
+        )
+        
+        # Don't pin an empty parse (e.g. an error page) for the life of the process
+        if not entry.data.empty:
+            self._prepare(entry)
+            self.cache.put(entry)
+            self.cache.record_refresh("updated")
+        return entry
+    
+    def _season_from_response(self, year: int, previous: Optional[SeasonEntry], status: int, headers, content: bytes) -> SeasonEntry:
+        """Turn an upstream response into the cached season, parsing and snapshotting only when it changed"""
+        unchanged = self._unchanged_season(previous, status, headers, content)
+        if unchanged is not None:
+            return unchanged
             
-        # Search for team (case insensitive)
-        team_data = df[df['team'].str.contains(team_name, case=False, na=False)]
+        entry = self._store_season(year, self._parse_team_results(content), headers, content)
+        if self.cache.peek(year) is entry:
+            try:
+                self.snapshots.save(entry)
+            except OSError as e:
+                print(f"Could not write snapshot for {year}: {e}")
+        return entry
+    
+    def _load_snapshot(self, year: int) -> Optional[SeasonEntry]:
+        """Seed the cache from the season's on-disk snapshot, if there is one"""
+        entry = self.snapshots.load(year)
+        if entry is not None:
+            self._prepare(entry)
+            self.cache.put(entry)
+        return entry
+    
+    def _parse_team_results(self, content: bytes) -> "pd.DataFrame":
+        """Parse the raw team results CSV into a DataFrame, in the parse pool when there is one"""
+        from .team_results_parser import parse_team_results
         
-        if team_data.empty:
+        pool = self._parser_pool()
+        if pool is not None:
+            try:
+                return pool.submit(parse_team_results, content).result()
+            except BrokenProcessPool as e:
+                print(f"Parse pool failed, parsing in-process: {e}")
+                self.shutdown_parser()
+        return parse_team_results(content)
+    
+    def load_modules(self) -> None:
+        """Import everything the data path uses (pandas, numpy, the parser and index builders) ahead of first use"""
+        import httpx  # noqa: F401
+        import requests  # noqa: F401
+        from . import matchups, percentiles, predictions, team_history, team_results_parser, team_rows  # noqa: F401
+    
+    def _parser_pool(self) -> Optional[ProcessPoolExecutor]:
+        """The process pool seasons are parsed in, started on first use"""
+        if self.parse_processes <= 0:
+            return None
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                # Not fork: the parent has event loop and refresh threads running
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._parse_pool = ProcessPoolExecutor(self.parse_processes, mp_context=multiprocessing.get_context(method))
+            return self._parse_pool
+    
+    def shutdown_parser(self, wait: bool = False) -> None:
+        """Stop the parse pool's processes, waiting for them to exit if ``wait``; the next parse starts a new pool"""
+        with self._parse_pool_lock:
+            pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+    
+    def _prepare(self, entry: SeasonEntry) -> None:
+        """Build a new version's lookup structures now, off the request path"""
+        self._teams(entry)
+        self._columns(entry)
+        self._percentiles(entry)
+        self._matrix(entry)
+        self._predictor(entry)
+        self._orders(entry)
+        self._conferences(entry)
+        self._tags(entry)
+    
+    def _teams(self, entry: SeasonEntry) -> TeamDirectory:
+        """The season's team ids, aliases and search index, built once per version"""
+        return entry.memo("teams", lambda df: TeamDirectory(df["team"] if "team" in df else []))
+    
+    def _find_team(self, entry: Optional[SeasonEntry], team_name: str) -> Optional[int]:
+        """Row position of the team a name, id or alias refers to; raises AmbiguousTeamError"""
+        if entry is None or entry.data.empty:
+            return None
+        return self._teams(entry).resolve(team_name)
+    
+    def _columns(self, entry: SeasonEntry) -> "SeasonColumns":
+        """The season's column arrays for row views, pulled out of the DataFrame once per version"""
+        from .team_rows import SeasonColumns
+        return entry.memo("columns", SeasonColumns)
+    
+    def _percentiles(self, entry: SeasonEntry) -> "PercentileTable":
+        """The season's sorted metric arrays and quantile cut points, built once per version"""
+        from .percentiles import PercentileTable
+        return entry.memo("percentiles", PercentileTable)
+    
+    def _matrix(self, entry: SeasonEntry) -> "MetricMatrix":
+        """The season's comparable metrics stacked for all-pairs comparisons, built once per version"""
+        from .matchups import MetricMatrix
+        return entry.memo("matrix", MetricMatrix)
+    
+    def _predictor(self, entry: SeasonEntry) -> "MatchupPredictor":
+        """The season's all-pairs win probabilities, scores and tempo, built once per version"""
+        from .predictions import MatchupPredictor
+        return entry.memo("predictor", MatchupPredictor)
+    
+    def _orders(self, entry: SeasonEntry) -> "SortOrders":
+        """The season's per-column sort orders for filtered queries, built once per version"""
+        from .team_query import SortOrders
+        return entry.memo("orders", lambda df: SortOrders(self._columns(entry)))
+    
+    def _conferences(self, entry: SeasonEntry) -> "ConferenceTable":
+        """The season's per-conference aggregates, built once per version"""
+        from .conferences import ConferenceTable
+        return entry.memo("conferences", lambda df: ConferenceTable(df, self._teams(entry).ids))
+    
+    def _tags(self, entry: SeasonEntry) -> "ScoutingTags":
+        """Every team's scouting tags, evaluated over the whole season once per version"""
+        from .scouting import ScoutingTags
+        return entry.memo("tags", lambda df: ScoutingTags(self._columns(entry), self._percentiles(entry)))
+    
+    def _responses(self, entry: SeasonEntry) -> ResponseCache:
+        """The season's serialized responses, dropped along with the version"""
+        if self.cache.is_pinned(entry.year):
+            cache_control = "public, max-age=86400, immutable"
+        else:
+            cache_control = f"public, max-age={RESPONSE_MAX_AGE}"
+        return entry.memo("responses", lambda df: ResponseCache(cache_control))
+    
+    def _team_row(self, entry: SeasonEntry, row: int) -> Dict:
+        from .team_rows import TeamRow
+        return TeamRow.at(self._columns(entry), row, self._teams(entry).ids[row]).to_dict()
+    
+    def _team_by_name(self, entry: Optional[SeasonEntry], team_name: str) -> Optional[Dict]:
+        row = self._find_team(entry, team_name)
+        if row is None:
             return None
             
-        return team_data.iloc[0].to_dict()
+        return self._team_row(entry, row)
     
-    def get_opponent_comparison(self, team1: str, team2: str, year: Optional[int] = None) -> Dict:
-        """Compare two teams' statistics"""
-        df = self.get_team_results(year)
-        
-        if df.empty:
-            return {}
+    def _team_percentiles(self, entry: Optional[SeasonEntry], team_name: str) -> Optional[Dict]:
+        row = self._find_team(entry, team_name)
+        if row is None:
+            return None
             
-        team1_data = df[df['team'].str.contains(team1, case=False, na=False)]
-        team2_data = df[df['team'].str.contains(team2, case=False, na=False)]
+        table = self._percentiles(entry)
+        columns = self._columns(entry)
+        return {
+            "team_id": self._teams(entry).ids[row],
+            "team": columns.value("team", row),
+            "teams": table.teams,
+            "percentiles": {metric: table.percentile(metric, columns.arrays[metric][row]) for metric in table.metrics()},
+            "quantiles": {metric: table.quantiles(metric) for metric in table.metrics()},
+        }
+    
+    def _comparison(self, entry: Optional[SeasonEntry], team1: str, team2: str) -> Dict:
+        row1 = self._find_team(entry, team1)
+        row2 = self._find_team(entry, team2)
         
-        if team1_data.empty or team2_data.empty:
+        if row1 is None or row2 is None:
             return {}
             
-        team1_stats = team1_data.iloc[0].to_dict()
-        team2_stats = team2_data.iloc[0].to_dict()
+        team1_stats = self._team_row(entry, row1)
+        team2_stats = self._team_row(entry, row2)
         
         return {
             "team1": team1_stats,
@@ -107,13 +337,8 @@ class BartTorvik:
         """Generate comparison metrics between two teams"""
         comparison = {}
         
-        # Key metrics to compare
-        metrics = [
-            'barthag', 'adjoe', 'adjde', 'adjte', 'efg_o', 'efg_d', 
-            'tov_o', 'tov_d', 'or_o', 'or_d', 'ftr_o', 'ftr_d'
-        ]
-        
-        for metric in metrics:
+        # Same metrics, in the same order, as the comparison matrix
+        for metric in COMPARISON_METRICS:
             if metric in team1 and metric in team2:
                 try:
                     val1 = float(team1[metric])
@@ -121,38 +346,725 @@ class BartTorvik:
                     comparison[metric] = {
                         "team1_value": val1,
                         "team2_value": val2,
-                        "difference": val1 - val2,
-                        "advantage": "team1" if val1 > val2 else "team2"
+                        "difference": round(val1 - val2, 4),
+                        "higher_is_better": higher_is_better(metric),
+                        "advantage": advantage(metric, val1, val2)
                     }
                 except (ValueError, TypeError):
                     continue
                     
         return comparison
     
-    def get_available_teams(self, year: Optional[int] = None) -> List[str]:
-        """Get list of all available teams"""
-        df = self.get_team_results(year)
+    def _comparison_matrix(
+        self,
+        entry: Optional[SeasonEntry],
+        teams: List[str],
+        conference: Optional[str] = None,
+        metrics: Optional[List[str]] = None,
+    ) -> Optional[Dict]:
+        if entry is None or entry.data.empty:
+            return None
+            
+        directory = self._teams(entry)
+        rows, missing = [], []
+        for name in teams:
+            row = directory.resolve(name)
+            if row is None:
+                missing.append(name)
+            else:
+                rows.append(row)
+        if missing:
+            raise UnknownTeamError(missing)
+            
+        if conference:
+            in_conference = entry.data["conf"].astype(str).str.casefold() == conference.casefold()
+            rows.extend(in_conference.to_numpy().nonzero()[0].tolist())
+            
+        # Keep the caller's order, dropping repeats
+        rows = list(dict.fromkeys(rows))
+        return {
+            "teams": [{"team_id": directory.ids[row], "team": directory.names[row]} for row in rows],
+            "metrics": self._matrix(entry).compare(rows, metrics),
+        }
+    
+    def _prediction(self, entry: Optional[SeasonEntry], team1: str, team2: Optional[str] = None, venue: str = "neutral") -> Optional[Dict]:
+        row = self._find_team(entry, team1)
+        if row is None:
+            return None
+            
+        directory = self._teams(entry)
+        opponents = None
+        if team2 is not None:
+            opponent = directory.resolve(team2)
+            if opponent is None:
+                return None
+            opponents = [opponent]
+            
+        predicted = self._predictor(entry).predict(row, opponents, venue)
+        games = [
+            {
+                "opponent": {"team_id": directory.ids[column], "team": directory.names[column]},
+                "win_probability": probability,
+                "expected_score": {"team": points_for, "opponent": points_against},
+                "margin": margin,
+                "tempo": tempo,
+            }
+            for column, probability, points_for, points_against, margin, tempo in zip(
+                predicted["opponents"].tolist(),
+                predicted["win_probability"].tolist(),
+                predicted["points_for"].tolist(),
+                predicted["points_against"].tolist(),
+                predicted["margin"].tolist(),
+                predicted["tempo"].tolist(),
+            )
+            if column != row
+        ]
         
-        if df.empty:
-            return []
+        return {
+            "team": {"team_id": directory.ids[row], "team": directory.names[row]},
+            "venue": venue,
+            "predictions": games,
+        }
+    
+    def _scouting_json(self, entry: Optional[SeasonEntry], our_team: str, opponent: str, venue: str = "neutral") -> Optional[CachedJSON]:
+        row = self._find_team(entry, our_team)
+        opponent_row = self._find_team(entry, opponent)
+        if row is None or opponent_row is None:
+            return None
             
-        return df['team'].tolist()
+        def build():
+            # Everything from this one entry, so the parts always describe the same season version
+            ids = self._teams(entry).ids
+            team, opponent_stats = self._team_row(entry, row), self._team_row(entry, opponent_row)
+            games = self._prediction(entry, ids[row], ids[opponent_row], venue)["predictions"]
+            return {
+                "season": entry.year,
+                "version": entry.version,
+                "venue": venue,
+                "team": team,
+                "opponent": opponent_stats,
+                "percentiles": self._team_percentiles(entry, ids[opponent_row])["percentiles"],
+                "comparison": self._generate_comparison(team, opponent_stats),
+                "prediction": games[0] if games else None,
+                "scouting": self._tags(entry).tags(opponent_row),
+            }
+            
+        return self._responses(entry).get(("scouting", row, opponent_row, venue), build)
     
-    def search_teams(self, query: str, year: Optional[int] = None) -> List[Dict]:
-        """Search for teams by partial name match"""
-        df = self.get_team_results(year)
+    def _season_range(self, start: Optional[int], end: Optional[int]) -> List[int]:
+        """Seasons a history or export covers: the last five by default; raises ValueError for an unusable range"""
+        from .team_history import FIRST_SEASON, MAX_HISTORY_SEASONS
         
-        if df.empty:
+        end = self.current_year if end is None else end
+        # Only the default start is clamped; an explicit season before the first is an error
+        start = max(end - 4, FIRST_SEASON) if start is None else start
+        if start < FIRST_SEASON or end < FIRST_SEASON:
+            raise ValueError(f"Seasons start in {FIRST_SEASON}; got 'from'={start}, 'to'={end}")
+        if start > end:
+            raise ValueError("'from' must not be after 'to'")
+        if end - start + 1 > MAX_HISTORY_SEASONS:
+            raise ValueError(f"At most {MAX_HISTORY_SEASONS} seasons per request")
+        return list(range(start, end + 1))
+    
+    def _team_history(self, seasons: Dict[int, SeasonEntry], team_name: str) -> Optional[Dict]:
+        seasons = {year: entry for year, entry in seasons.items() if entry is not None and not entry.data.empty}
+        if not seasons:
+            return None
+            
+        # The newest season that knows the name decides which team it means
+        for year in sorted(seasons, reverse=True):
+            row = self._find_team(seasons[year], team_name)
+            if row is not None:
+                team_id = self._teams(seasons[year]).ids[row]
+                break
+        else:
+            return None
+            
+        return self._history(seasons).trajectory(team_id)
+    
+    def _history(self, seasons: Dict[int, SeasonEntry]) -> "TeamHistory":
+        """Every team's metrics across ``seasons``, built once per combination of season versions"""
+        from .team_history import TeamHistory
+        
+        key = tuple((year, entry.version or id(entry)) for year, entry in sorted(seasons.items()))
+        with self._histories_lock:
+            history = self._histories.get(key)
+            if history is not None:
+                self._histories.move_to_end(key)
+                return history
+                
+        history = TeamHistory([(year, self._teams(entry).ids, entry.data) for year, entry in seasons.items()])
+        with self._histories_lock:
+            self._histories[key] = history
+            if len(self._histories) > HISTORY_CACHE_SIZE:
+                self._histories.popitem(last=False)
+        return history
+    
+    def _available_teams_json(self, entry: Optional[SeasonEntry]) -> Optional[CachedJSON]:
+        if entry is None or entry.data.empty:
+            return None
+            
+        return self._responses(entry).get(("list",), lambda: {"teams": self._available_teams(entry)})
+    
+    def _fields(self, fields: Optional[List[str]]) -> Optional[tuple]:
+        """Requested projection, de-duplicated in request order; raises ValueError for unknown columns"""
+        if not fields:
+            return None
+            
+        from .team_rows import FIELDS
+        
+        unknown = [name for name in fields if name not in FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(FIELDS)}")
+        return tuple(dict.fromkeys(fields))
+    
+    def _team_json(self, entry: Optional[SeasonEntry], team_name: str, fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        fields = self._fields(fields)
+        row = self._find_team(entry, team_name)
+        if row is None:
+            return None
+            
+        def build():
+            tags = self._tags(entry).tags(row)
+            if fields is None:
+                return {"team": self._team_row(entry, row), "tags": tags}
+            return {"team": self._columns(entry).project([row], fields, self._teams(entry).ids)[0], "tags": tags}
+            
+        # Keyed by row, so a name, its id and its aliases share one body
+        return self._responses(entry).get(("team", row, fields), build)
+    
+    def _search_json(self, entry: Optional[SeasonEntry], query: str, fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        """Search results for ``query``; raises ValueError for a blank query, which would match every team"""
+        if not query.strip():
+            raise ValueError("Search query must not be empty")
+        fields = self._fields(fields)
+        if entry is None or entry.data.empty:
+            return None
+            
+        def build():
+            if fields is None:
+                return {"teams": self._search(entry, query)}
+            teams = self._teams(entry)
+            return {"teams": self._columns(entry).project(teams.search(query), fields, teams.ids)}
+            
+        # Results depend only on the normalized query, so "St. John's" and "st johns" share one body
+        key = ("search", normalize_name(query), fields)
+        return self._responses(entry).get(key, build)
+    
+    def _batch_json(self, entry: Optional[SeasonEntry], teams: List[str], fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        fields = self._fields(fields)
+        if entry is None or entry.data.empty:
+            return None
+            
+        from .team_rows import FIELDS
+        
+        def build():
+            directory = self._teams(entry)
+            rows, resolved, missing, ambiguous = [], {}, [], []
+            for name in teams:
+                try:
+                    row = directory.resolve(name)
+                except AmbiguousTeamError as e:
+                    ambiguous.append({"name": e.name, "candidates": e.candidates})
+                    continue
+                if row is None:
+                    missing.append(name)
+                    continue
+                resolved[name] = directory.ids[row]
+                rows.append(row)
+                
+            # One gather per column for every team asked for, in request order without repeats
+            rows = list(dict.fromkeys(rows))
+            return {
+                "teams": self._columns(entry).project(rows, fields or FIELDS, directory.ids),
+                "resolved": resolved,
+                "missing": missing,
+                "ambiguous": ambiguous,
+            }
+            
+        # Not cached: the key would be whatever list of up to 500 names a client sends, and
+        # the per-team rows it gathers from are already precomputed for the version
+        return self._responses(entry).encode(build)
+    
+    def _query_json(self, entry: Optional[SeasonEntry], filters: Dict[str, str], sort: Optional[str], limit: Optional[int], offset: Optional[int], fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        from .team_query import parse_query
+        from .team_rows import FIELDS
+        
+        query = parse_query(filters, sort, limit, offset)
+        fields = self._fields(fields)
+        if entry is None or entry.data.empty:
+            return None
+            
+        def build():
+            return self._orders(entry).run(query, fields or FIELDS, self._teams(entry).ids)
+            
+        # Filters and paging are client-chosen, so each body is built per request and never cached
+        return self._responses(entry).encode(build)
+    
+    def _conferences_json(self, entry: Optional[SeasonEntry]) -> Optional[CachedJSON]:
+        if entry is None or entry.data.empty:
+            return None
+            
+        return self._responses(entry).get(("conferences",), lambda: {"conferences": self._conferences(entry).all()})
+    
+    def _conference_json(self, entry: Optional[SeasonEntry], conf: str) -> Optional[CachedJSON]:
+        if entry is None or entry.data.empty:
+            return None
+            
+        summary = self._conferences(entry).get(conf)
+        if summary is None:
+            return None
+            
+        return self._responses(entry).get(("conference", summary["conf"]), lambda: {"conference": summary})
+    
+    def _season_file(self, entry: Optional[SeasonEntry], fmt: str) -> Optional[CachedBody]:
+        if entry is None or entry.data.empty:
+            return None
+            
+        from .columnar import COLUMNAR_FORMATS, encode_table, season_table
+        
+        responses = self._responses(entry)
+        
+        def build():
+            table = season_table(entry.data, self._teams(entry).ids, entry.year, entry.version)
+            # Parquet pages are already compressed, so only the Arrow file gets gzip/brotli
+            return CachedBody(encode_table(table, fmt), responses.cache_control, COLUMNAR_FORMATS[fmt], compressible=fmt == "arrow")
+            
+        return responses.body(("season_file", fmt), build)
+    
+    def _export(self, seasons: Dict[int, SeasonEntry], fmt: str, fields: Optional[tuple]) -> Optional[Iterator[bytes]]:
+        from .exports import export_chunks
+        from .team_rows import FIELDS
+        
+        seasons = [(year, entry) for year, entry in sorted(seasons.items()) if not entry.data.empty]
+        if not seasons:
+            return None
+            
+        return export_chunks(
+            [(year, self._columns(entry), self._teams(entry).ids) for year, entry in seasons],
+            fields or FIELDS,
+            fmt,
+        )
+    
+    def _available_teams(self, entry: Optional[SeasonEntry]) -> List[str]:
+        if entry is None or entry.data.empty:
             return []
             
-        matching_teams = df[df['team'].str.contains(query, case=False, na=False)]
+        return entry.data['team'].tolist()
+    
+    def _search(self, entry: Optional[SeasonEntry], query: str) -> List[Dict]:
+        if entry is None or entry.data.empty:
+            return []
+            
+        # Ranked: alias or exact name, then name prefix, word prefix, substring
+        teams = self._teams(entry)
+        matching_teams = self._columns(entry).rows(teams.search(query), teams.ids)
         
         return [
             {
-                "team": row['team'],
+                "team_id": row.team_id,
+                "team": row.team,
                 "conference": row.get('conf', 'Unknown'),
                 "record": row.get('record', '0-0'),
                 "barthag": row.get('barthag', 0)
             }
-            for _, row in matching_teams.iterrows()
-        ]
\ No newline at end of file
+            for row in matching_teams
+        ]
+
+
+class BartTorvik(BaseBartTorvik):
+    """Blocking client, for scripts and anything running outside the event loop"""
+    
+    def __init__(self, cache_ttl: Optional[float] = None, snapshot_dir: Optional[str] = None, parse_processes: Optional[int] = None):
+        super().__init__(cache_ttl, snapshot_dir, parse_processes)
+        self._flight = SingleFlight()
+        
+    def get_team_results(self, year: Optional[int] = None) -> "pd.DataFrame":
+        """Fetch team results from BartTorvik for a given year"""
+        import pandas as pd
+        entry = self._query_season(year)
+        return entry.data if entry is not None else pd.DataFrame()
+    
+    def _query_season(self, year: Optional[int]) -> Optional[SeasonEntry]:
+        """The season a query runs against, or None if it could not be fetched"""
+        import requests
+        if year is None:
+            year = self.current_year
+            
+        try:
+            return self.get_season(year)
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching data from BartTorvik: {e}")
+            return None
+    
+    def get_seasons(self, years: List[int]) -> Dict[int, SeasonEntry]:
+        """Load several seasons at once; seasons that could not be fetched are left out"""
+        with ThreadPoolExecutor(max_workers=max(1, min(len(years), BULK_LOAD_THREADS))) as pool:
+            entries = dict(zip(years, pool.map(self._query_season, years)))
+        return {year: entry for year, entry in entries.items() if entry is not None}
+    
+    def get_season(self, year: int) -> SeasonEntry:
+        """Return the cached season, loading it on a miss and refreshing it in the background when stale"""
+        entry, state = self._lookup(year)
+        
+        if state == FRESH:
+            return entry
+        if state == STALE:
+            self._refresh_in_background(year)
+            return entry
+            
+        # Only one load per season is ever in flight; concurrent callers share it
+        entry = self._flight.do(year, lambda: self._load_cold(year))
+        if not self.cache.is_fresh(entry):
+            # Served from an old snapshot; revalidate it against the upstream
+            self._refresh_in_background(year)
+        return entry
+    
+    def refresh_season(self, year: int) -> SeasonEntry:
+        """Revalidate a season against the upstream now, regardless of its freshness"""
+        if self.cache.peek(year) is None:
+            # Seed validators from the store so the refresh can be a cheap 304
+            self._load_snapshot(year)
+            
+        def refresh():
+            with self.snapshots.lock(year):
+                return self._load_season(year)
+                
+        # Never join the season's cold load while holding its lock: that load waits for the lock
+        return self._flight.do(("refresh", year), refresh)
+    
+    def _load_cold(self, year: int) -> SeasonEntry:
+        """Load a season missing from memory, preferring its snapshot over the upstream"""
+        entry = self._load_snapshot(year)
+        if entry is not None:
+            return entry
+            
+        # If another worker is already downloading this season, wait for its file instead
+        with self.snapshots.lock(year):
+            entry = self._load_snapshot(year)
+            if entry is not None:
+                return entry
+            return self._load_season(year)
+    
+    def _load_season(self, year: int) -> SeasonEntry:
+        """Download and parse a season, then store it in the cache"""
+        import requests
+        previous = self.cache.peek(year)
+        response = requests.get(self._season_url(year), headers=self._conditional_headers(previous), timeout=30)
+        if response.status_code != 304:
+            response.raise_for_status()
+            
+        return self._season_from_response(year, previous, response.status_code, response.headers, response.content)
+    
+    def _refresh_in_background(self, year: int) -> None:
+        if self._flight.in_flight(year) or self._flight.in_flight(("refresh", year)):
+            return
+            
+        def refresh():
+            with self.snapshots.lock(year, blocking=False) as acquired:
+                # Only one worker per host refreshes; the rest pick the result up from the store
+                if not acquired or self._refreshed_elsewhere(year):
+                    return
+                try:
+                    # Already holding the lock, so load directly rather than join a flight that may wait for it
+                    self._load_season(year)
+                except Exception as e:
+                    print(f"Background refresh of {year} season failed: {e}")
+                    
+        threading.Thread(target=refresh, name=f"barttorvik-refresh-{year}", daemon=True).start()
+    
+    def get_team_by_name(self, team_name: str, year: Optional[int] = None) -> Optional[Dict]:
+        """Get specific team data by name"""
+        return self._team_by_name(self._query_season(year), team_name)
+    
+    def get_team_percentiles(self, team_name: str, year: Optional[int] = None) -> Optional[Dict]:
+        """Get a team's percentile in every metric, plus the season's quantile cut points"""
+        return self._team_percentiles(self._query_season(year), team_name)
+    
+    def get_opponent_comparison(self, team1: str, team2: str, year: Optional[int] = None) -> Dict:
+        """Compare two teams' statistics"""
+        return self._comparison(self._query_season(year), team1, team2)
+    
+    def get_comparison_matrix(self, teams: List[str], conference: Optional[str] = None, metrics: Optional[List[str]] = None, year: Optional[int] = None) -> Optional[Dict]:
+        """Compare every pair among a set of teams in one pass"""
+        return self._comparison_matrix(self._query_season(year), teams, conference, metrics)
+    
+    def get_prediction(self, team1: str, team2: Optional[str] = None, venue: str = "neutral", year: Optional[int] = None) -> Optional[Dict]:
+        """Win probability and expected score for team1 against team2, or against every team"""
+        return self._prediction(self._query_season(year), team1, team2, venue)
+    
+    def get_team_history(self, team_name: str, start: Optional[int] = None, end: Optional[int] = None) -> Optional[Dict]:
+        """A team's rank, efficiencies, barthag and WAB in each season from start to end"""
+        return self._team_history(self.get_seasons(self._season_range(start, end)), team_name)
+    
+    def export_seasons(self, start: Optional[int] = None, end: Optional[int] = None, fmt: str = "ndjson", fields: Optional[List[str]] = None) -> Optional[Tuple[List[int], Iterator[bytes]]]:
+        """The seasons from start to end and every team row of them as NDJSON or CSV chunks, generated lazily"""
+        fields = self._fields(fields)
+        years = self._season_range(start, end)
+        chunks = self._export(self.get_seasons(years), fmt, fields)
+        return (years, chunks) if chunks is not None else None
+    
+    def get_teams_json(self, teams: List[str], year: Optional[int] = None, fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        """``{"teams", "resolved", "missing", "ambiguous"}`` for many names, ids or aliases at once, gathered from the version's column arrays"""
+        return self._batch_json(self._query_season(year), teams, fields)
+    
+    def query_teams_json(self, filters: Dict[str, str], sort: Optional[str] = None, limit: Optional[int] = None, offset: Optional[int] = None, year: Optional[int] = None, fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        """``{"total", "offset", "limit", "teams"}`` for teams passing ``filters`` in ``sort`` order, serialized once per season version and query"""
+        return self._query_json(self._query_season(year), filters, sort, limit, offset, fields)
+    
+    def get_conferences_json(self, year: Optional[int] = None) -> Optional[CachedJSON]:
+        """``{"conferences": [...]}`` with every conference's aggregates, strongest first, serialized once per season version"""
+        return self._conferences_json(self._query_season(year))
+    
+    def get_conference_json(self, conf: str, year: Optional[int] = None) -> Optional[CachedJSON]:
+        """``{"conference": ...}`` aggregates for one conference code, serialized once per season version"""
+        return self._conference_json(self._query_season(year), conf)
+    
+    def get_scouting_json(self, our_team: str, opponent: str, venue: str = "neutral", year: Optional[int] = None) -> Optional[CachedJSON]:
+        """Opponent profile, percentiles, comparison, prediction and scouting notes in one body, serialized once per season version"""
+        return self._scouting_json(self._query_season(year), our_team, opponent, venue)
+    
+    def get_season_file(self, year: Optional[int] = None, fmt: str = "arrow") -> Optional[CachedBody]:
+        """The whole season as an Arrow IPC or Parquet file, encoded once per season version"""
+        return self._season_file(self._query_season(year), fmt)
+    
+    def get_available_teams(self, year: Optional[int] = None) -> List[str]:
+        """Get list of all available teams"""
+        return self._available_teams(self._query_season(year))
+    
+    def search_teams(self, query: str, year: Optional[int] = None) -> List[Dict]:
+        """Search for teams by partial name match"""
+        return self._search(self._query_season(year), query)
+    
+    def get_team_json(self, team_name: str, year: Optional[int] = None, fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        """``{"team": ..., "tags": [...]}`` for one team, optionally only ``fields``, serialized once per season version"""
+        return self._team_json(self._query_season(year), team_name, fields)
+    
+    def get_available_teams_json(self, year: Optional[int] = None) -> Optional[CachedJSON]:
+        """``{"teams": [...]}`` with every team name, serialized once per season version"""
+        return self._available_teams_json(self._query_season(year))
+    
+    def search_teams_json(self, query: str, year: Optional[int] = None, fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        """``{"teams": [...]}`` search results, optionally only ``fields``, serialized once per season version and query"""
+        return self._search_json(self._query_season(year), query, fields)
+
+
+class AsyncBartTorvik(BaseBartTorvik):
+    """Non-blocking client for the API, sharing one pooled httpx.AsyncClient across requests"""
+    
+    def __init__(self, cache_ttl: Optional[float] = None, snapshot_dir: Optional[str] = None, client: Optional["httpx.AsyncClient"] = None, parse_processes: Optional[int] = None):
+        super().__init__(cache_ttl, snapshot_dir, parse_processes)
+        self.client = client
+        self._flight = AsyncSingleFlight()
+        self._background = set()
+        
+    async def startup(self) -> None:
+        """Open the pooled upstream client; called from the app lifespan"""
+        if self.client is None:
+            import httpx
+            self.client = httpx.AsyncClient(
+                timeout=30,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+            
+    async def aclose(self) -> None:
+        """Cancel background refreshes and close the upstream client"""
+        for task in list(self._background):
+            task.cancel()
+        self.shutdown_parser()
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+            
+    async def get_team_results(self, year: Optional[int] = None) -> "pd.DataFrame":
+        """Fetch team results from BartTorvik for a given year"""
+        import pandas as pd
+        entry = await self._query_season(year)
+        return entry.data if entry is not None else pd.DataFrame()
+    
+    async def _query_season(self, year: Optional[int]) -> Optional[SeasonEntry]:
+        """The season a query runs against, or None if it could not be fetched"""
+        import httpx
+        if year is None:
+            year = self.current_year
+            
+        try:
+            return await self.get_season(year)
+        except (httpx.HTTPError, TimeoutError) as e:
+            print(f"Error fetching data from BartTorvik: {e}")
+            return None
+    
+    async def get_seasons(self, years: List[int]) -> Dict[int, SeasonEntry]:
+        """Load several seasons concurrently; seasons that could not be fetched are left out"""
+        entries = await asyncio.gather(*(self._query_season(year) for year in years))
+        return {year: entry for year, entry in zip(years, entries) if entry is not None}
+    
+    async def get_season(self, year: int) -> SeasonEntry:
+        """Return the cached season, loading it on a miss and refreshing it in the background when stale"""
+        await self._sync_from_store_async(year)
+        entry, state = self.cache.lookup(year)
+        
+        if state == FRESH:
+            return entry
+        if state == STALE:
+            self._refresh_in_background(year)
+            return entry
+            
+        entry = await self._flight.do(year, lambda: self._load_cold(year))
+        if not self.cache.is_fresh(entry):
+            # Served from an old snapshot; revalidate it against the upstream
+            self._refresh_in_background(year)
+        return entry
+    
+    async def _sync_from_store_async(self, year: int, force: bool = False) -> None:
+        """_sync_from_store with the reload and _prepare of a replaced version run on a worker thread, once per version"""
+        if self._store_replaced(year, force):
+            loop = asyncio.get_running_loop()
+            await self._flight.do(("store", year), lambda: loop.run_in_executor(None, self._reload_from_store, year))
+    
+    async def refresh_season(self, year: int) -> Optional[SeasonEntry]:
+        """Revalidate a season against the upstream now; None if another worker is already refreshing it"""
+        if self.cache.peek(year) is None:
+            # Seed validators from the store so the refresh can be a cheap 304
+            await asyncio.get_running_loop().run_in_executor(None, self._load_snapshot, year)
+            
+        async def refresh():
+            with self.snapshots.lock(year, blocking=False) as acquired:
+                # The worker holding the lock writes the store; the rest adopt its version from there
+                if not acquired:
+                    return None
+                return await self._load_season(year)
+                
+        # Never join the season's cold load while holding its lock: that load waits for the lock
+        return await self._flight.do(("refresh", year), refresh)
+    
+    async def _load_cold(self, year: int) -> SeasonEntry:
+        """Load a season missing from memory, preferring its snapshot over the upstream"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SEASON_LOCK_TIMEOUT
+        while True:
+            entry = await loop.run_in_executor(None, self._load_snapshot, year)
+            if entry is not None:
+                return entry
+                
+            # If another worker is already downloading this season, wait for its file instead
+            with self.snapshots.lock(year, blocking=False) as acquired:
+                if acquired:
+                    entry = await loop.run_in_executor(None, self._load_snapshot, year)
+                    return entry if entry is not None else await self._load_season(year)
+            if loop.time() >= deadline:
+                raise TimeoutError(f"Gave up waiting for another worker to load the {year} season")
+            await asyncio.sleep(0.05)
+    
+    async def _load_season(self, year: int) -> SeasonEntry:
+        """Download a season without blocking the event loop; parse and snapshot it on a worker thread"""
+        if self.client is None:
+            await self.startup()
+            
+        previous = self.cache.peek(year)
+        response = await self.client.get(self._season_url(year), headers=self._conditional_headers(previous))
+        if response.status_code != 304:
+            response.raise_for_status()
+            
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._season_from_response, year, previous, response.status_code, response.headers, response.content
+        )
+    
+    def _refresh_in_background(self, year: int) -> None:
+        if self._flight.in_flight(year) or self._flight.in_flight(("refresh", year)):
+            return
+            
+        async def refresh():
+            with self.snapshots.lock(year, blocking=False) as acquired:
+                # Only one worker per host refreshes; the rest pick the result up from the store
+                if not acquired:
+                    return
+                await self._sync_from_store_async(year, force=True)
+                entry = self.cache.peek(year)
+                if entry is not None and self.cache.is_fresh(entry):
+                    return
+                try:
+                    # Already holding the lock, so load directly rather than join a flight that may wait for it
+                    await self._load_season(year)
+                except Exception as e:
+                    print(f"Background refresh of {year} season failed: {e}")
+                
+        task = asyncio.ensure_future(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+    
+    async def get_team_by_name(self, team_name: str, year: Optional[int] = None) -> Optional[Dict]:
+        """Get specific team data by name"""
+        return self._team_by_name(await self._query_season(year), team_name)
+    
+    async def get_team_percentiles(self, team_name: str, year: Optional[int] = None) -> Optional[Dict]:
+        """Get a team's percentile in every metric, plus the season's quantile cut points"""
+        return self._team_percentiles(await self._query_season(year), team_name)
+    
+    async def get_opponent_comparison(self, team1: str, team2: str, year: Optional[int] = None) -> Dict:
+        """Compare two teams' statistics"""
+        return self._comparison(await self._query_season(year), team1, team2)
+    
+    async def get_comparison_matrix(self, teams: List[str], conference: Optional[str] = None, metrics: Optional[List[str]] = None, year: Optional[int] = None) -> Optional[Dict]:
+        """Compare every pair among a set of teams in one pass"""
+        return self._comparison_matrix(await self._query_season(year), teams, conference, metrics)
+    
+    async def get_prediction(self, team1: str, team2: Optional[str] = None, venue: str = "neutral", year: Optional[int] = None) -> Optional[Dict]:
+        """Win probability and expected score for team1 against team2, or against every team"""
+        return self._prediction(await self._query_season(year), team1, team2, venue)
+    
+    async def get_team_history(self, team_name: str, start: Optional[int] = None, end: Optional[int] = None) -> Optional[Dict]:
+        """A team's rank, efficiencies, barthag and WAB in each season from start to end"""
+        return self._team_history(await self.get_seasons(self._season_range(start, end)), team_name)
+    
+    async def export_seasons(self, start: Optional[int] = None, end: Optional[int] = None, fmt: str = "ndjson", fields: Optional[List[str]] = None) -> Optional[Tuple[List[int], Iterator[bytes]]]:
+        """The seasons from start to end and every team row of them as NDJSON or CSV chunks, generated lazily"""
+        fields = self._fields(fields)
+        years = self._season_range(start, end)
+        chunks = self._export(await self.get_seasons(years), fmt, fields)
+        return (years, chunks) if chunks is not None else None
+    
+    async def get_teams_json(self, teams: List[str], year: Optional[int] = None, fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        """``{"teams", "resolved", "missing", "ambiguous"}`` for many names, ids or aliases at once, gathered from the version's column arrays"""
+        return self._batch_json(await self._query_season(year), teams, fields)
+    
+    async def query_teams_json(self, filters: Dict[str, str], sort: Optional[str] = None, limit: Optional[int] = None, offset: Optional[int] = None, year: Optional[int] = None, fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        """``{"total", "offset", "limit", "teams"}`` for teams passing ``filters`` in ``sort`` order, serialized once per season version and query"""
+        return self._query_json(await self._query_season(year), filters, sort, limit, offset, fields)
+    
+    async def get_conferences_json(self, year: Optional[int] = None) -> Optional[CachedJSON]:
+        """``{"conferences": [...]}`` with every conference's aggregates, strongest first, serialized once per season version"""
+        return self._conferences_json(await self._query_season(year))
+    
+    async def get_conference_json(self, conf: str, year: Optional[int] = None) -> Optional[CachedJSON]:
+        """``{"conference": ...}`` aggregates for one conference code, serialized once per season version"""
+        return self._conference_json(await self._query_season(year), conf)
+    
+    async def get_scouting_json(self, our_team: str, opponent: str, venue: str = "neutral", year: Optional[int] = None) -> Optional[CachedJSON]:
+        """Opponent profile, percentiles, comparison, prediction and scouting notes in one body, serialized once per season version"""
+        return self._scouting_json(await self._query_season(year), our_team, opponent, venue)
+    
+    async def get_season_file(self, year: Optional[int] = None, fmt: str = "arrow") -> Optional[CachedBody]:
+        """The whole season as an Arrow IPC or Parquet file, encoded once per season version"""
+        return self._season_file(await self._query_season(year), fmt)
+    
+    async def get_available_teams(self, year: Optional[int] = None) -> List[str]:
+        """Get list of all available teams"""
+        return self._available_teams(await self._query_season(year))
+    
+    async def search_teams(self, query: str, year: Optional[int] = None) -> List[Dict]:
+        """Search for teams by partial name match"""
+        return self._search(await self._query_season(year), query)
+    
+    async def get_team_json(self, team_name: str, year: Optional[int] = None, fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        """``{"team": ..., "tags": [...]}`` for one team, optionally only ``fields``, serialized once per season version"""
+        return self._team_json(await self._query_season(year), team_name, fields)
+    
+    async def get_available_teams_json(self, year: Optional[int] = None) -> Optional[CachedJSON]:
+        """``{"teams": [...]}`` with every team name, serialized once per season version"""
+        return self._available_teams_json(await self._query_season(year))
+    
+    async def search_teams_json(self, query: str, year: Optional[int] = None, fields: Optional[List[str]] = None) -> Optional[CachedJSON]:
+        """``{"teams": [...]}`` search results, optionally only ``fields``, serialized once per season version and query"""
+        return self._search_json(await self._query_season(year), query, fields)
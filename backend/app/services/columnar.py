@@ -0,0 +1,54 @@
+"""
+Arrow IPC and Parquet encodings of a whole season, for analytics clients.
+
+The parsed season already uses Arrow-compatible dtypes (and its numeric
+columns are views of the memory-mapped snapshot when a worker started warm),
+so building the table references those buffers rather than converting rows.
+The only copy is the encoded file, made once per season version and cached
+with an ETag like the JSON responses. The pandas metadata travels with the
+schema, so a client gets back the same dtypes, categoricals included.
+"""
+from typing import TYPE_CHECKING, Optional, Sequence
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+COLUMNAR_FORMATS = {
+    "arrow": "application/vnd.apache.arrow.file",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Parquet pages are compressed in the file; Arrow IPC is left uncompressed so
+# readers can map it without decoding, and HTTP gzip/brotli covers the transfer
+PARQUET_COMPRESSION = "zstd"
+
+_META_PREFIX = b"barttorvik."
+
+
+def season_table(data: "pd.DataFrame", team_ids: Sequence[str], year: int, version: Optional[str]) -> "pa.Table":
+    """The season as an Arrow table with ``team_id`` first and the season and version in its metadata"""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    table = table.add_column(0, "team_id", pa.array(list(team_ids), pa.string()))
+    metadata = dict(table.schema.metadata or {})
+    metadata[_META_PREFIX + b"season"] = str(year).encode()
+    if version:
+        metadata[_META_PREFIX + b"version"] = version.encode()
+    return table.replace_schema_metadata(metadata)
+
+
+def encode_table(table: "pa.Table", fmt: str) -> bytes:
+    """The table as an Arrow IPC file or a Parquet file"""
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink, compression=PARQUET_COMPRESSION)
+    else:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
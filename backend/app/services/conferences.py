@@ -0,0 +1,110 @@
+"""
+Per-conference aggregates for a season.
+
+Every conference's means, medians, spread and extremes, win totals and
+strongest and weakest teams come out of one groupby over the season, run once
+per season version. Serving a conference, or all of them, is then a
+dictionary lookup instead of filtering and re-aggregating the frame.
+"""
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .metrics import higher_is_better
+
+CONFERENCE_METRICS = ["barthag", "adjoe", "adjde", "adjt", "sos", "ncsos", "WAB"]
+
+STATISTICS = ["mean", "median", "std", "min", "max"]
+
+# Strongest and weakest teams listed per conference, by barthag
+CONFERENCE_TOP_TEAMS = 3
+
+
+class ConferenceTable:
+    """Aggregates for every conference in a season, strongest first"""
+
+    __slots__ = ("_conferences", "_by_name")
+
+    def __init__(self, df: pd.DataFrame, team_ids: Sequence[str]):
+        self._conferences: List[Dict] = []
+        self._by_name: Dict[str, Dict] = {}
+        if df.empty or "conf" not in df or "barthag" not in df:
+            return
+
+        metrics = [metric for metric in CONFERENCE_METRICS if metric in df]
+        conf = df["conf"].astype("category")
+        frame = pd.DataFrame({metric: df[metric].to_numpy("float64") for metric in metrics})
+        frame["conf"] = conf.to_numpy()
+        frame["wins"] = df["wins"].to_numpy("int64") if "wins" in df else 0
+        frame["losses"] = df["losses"].to_numpy("int64") if "losses" in df else 0
+
+        grouped = frame.groupby("conf", observed=True, sort=True)
+        names = [str(name) for name in grouped.size().index]
+        sizes = grouped.size().to_numpy()
+        totals = grouped[["wins", "losses"]].sum().to_numpy().tolist()
+        # One (conferences x metrics) array per statistic; ddof=0 so a one-team conference has no NaN spread
+        values = grouped[metrics]
+        statistics = {
+            "mean": values.mean(),
+            "median": values.median(),
+            "std": values.std(ddof=0),
+            "min": values.min(),
+            "max": values.max(),
+        }
+        # A conference with no known value for a metric reports null, not NaN
+        statistics = {
+            name: [[None if value != value else value for value in row] for row in table.to_numpy("float64").round(4).tolist()]
+            for name, table in statistics.items()
+        }
+        means = np.array([row[metrics.index("barthag")] for row in statistics["mean"]])
+        strength = (-means).argsort(kind="stable")
+
+        # Rows grouped by conference, each group strongest first
+        codes = conf.cat.codes.to_numpy()
+        barthag = frame["barthag"].to_numpy()
+        order = np.lexsort((-barthag, codes))
+        bounds = np.searchsorted(codes[order], np.arange(len(conf.cat.categories) + 1))
+        members = {str(name): order[bounds[code]:bounds[code + 1]] for code, name in enumerate(conf.cat.categories)}
+
+        teams = df["team"].to_numpy(object, na_value="")
+        ranks = df["rank"].to_numpy() if "rank" in df else None
+
+        def team(row: int) -> Dict:
+            return {
+                "team_id": team_ids[row],
+                "team": str(teams[row]),
+                "rank": int(ranks[row]) if ranks is not None else None,
+                "barthag": round(float(barthag[row]), 4),
+            }
+
+        for index in strength.tolist():
+            name, rows = names[index], members[names[index]]
+            wins, losses = totals[index]
+            summary = {
+                "conf": name,
+                "teams": int(sizes[index]),
+                # Conferences level on mean barthag share a rank
+                "strength_rank": int((means > means[index]).sum()) + 1,
+                "wins": wins,
+                "losses": losses,
+                "win_pct": round(wins / (wins + losses), 4) if wins + losses else None,
+                "metrics": {
+                    metric: {
+                        "higher_is_better": higher_is_better(metric),
+                        **{statistic: statistics[statistic][index][k] for statistic in STATISTICS},
+                    }
+                    for k, metric in enumerate(metrics)
+                },
+                "top_teams": [team(row) for row in rows[:CONFERENCE_TOP_TEAMS].tolist()],
+                "bottom_teams": [team(row) for row in rows[::-1][:CONFERENCE_TOP_TEAMS].tolist()],
+            }
+            self._conferences.append(summary)
+            self._by_name[name.casefold()] = summary
+
+    def all(self) -> List[Dict]:
+        return self._conferences
+
+    def get(self, conf: str) -> Optional[Dict]:
+        """One conference by code, case-insensitively"""
+        return self._by_name.get(conf.strip().casefold())
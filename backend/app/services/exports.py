@@ -0,0 +1,41 @@
+"""
+Streaming exports of whole seasons.
+
+Rows are gathered from the cached season's columns a chunk at a time and
+encoded straight to bytes, so an export holds one chunk in memory however many
+teams or seasons it covers. The same generator serves one season or a range;
+every row carries its season so a multi-season file stays self-describing.
+"""
+import csv
+import io
+from typing import Iterator, Sequence, Tuple
+
+from .response_cache import dumps
+from .team_rows import SeasonColumns
+
+# Rows encoded per chunk written to the response
+EXPORT_CHUNK_ROWS = 256
+
+# (season, columns, team ids by row)
+ExportSeason = Tuple[int, SeasonColumns, Sequence[str]]
+
+
+def export_chunks(seasons: Sequence[ExportSeason], fields: Sequence[str], fmt: str) -> Iterator[bytes]:
+    """Encoded rows of every season in order, ``EXPORT_CHUNK_ROWS`` at a time"""
+    if fmt == "csv":
+        yield _csv_lines([["season", *fields]])
+
+    for year, columns, team_ids in seasons:
+        for start in range(0, len(columns), EXPORT_CHUNK_ROWS):
+            positions = range(start, min(start + EXPORT_CHUNK_ROWS, len(columns)))
+            rows = columns.project(positions, fields, team_ids)
+            if fmt == "csv":
+                yield _csv_lines([year, *row.values()] for row in rows)
+            else:
+                yield b"".join(dumps({"season": year, **row}) + b"\n" for row in rows)
+
+
+def _csv_lines(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode()
@@ -0,0 +1,81 @@
+"""
+All-pairs metric comparisons for a set of teams.
+
+A season's comparable metrics are stacked into one float64 matrix per version.
+Comparing N teams is then a single broadcast ``values[:, None] - values[None, :]``
+per metric rather than N*(N-1)/2 pairwise calls.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .metrics import COMPARISON_METRICS, UnknownMetricError, higher_is_better
+
+# Matrices kept per season version, keyed by (teams, metrics)
+MATRIX_CACHE_SIZE = 32
+
+
+class MetricMatrix:
+    """A season's comparable metrics as one (teams x metrics) float64 array"""
+
+    __slots__ = ("metrics", "values", "_results", "_lock")
+
+    def __init__(self, df: pd.DataFrame):
+        self.metrics: List[str] = [metric for metric in COMPARISON_METRICS if metric in df]
+        # Upstream values have at most 4 decimals; rounding drops float32 widening noise
+        self.values = np.column_stack(
+            [df[metric].to_numpy("float64").round(4) for metric in self.metrics]
+        ) if self.metrics and not df.empty else np.empty((len(df), 0))
+        self._results: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compare(self, rows: Sequence[int], metrics: Optional[Sequence[str]] = None) -> Dict[str, Dict]:
+        """Pairwise differences and advantages between ``rows`` for each metric, cached per team set
+
+        Raises UnknownMetricError if any of ``metrics`` is not a comparable metric.
+        """
+        metrics = list(metrics or self.metrics)
+        unknown = [m for m in metrics if m not in self.metrics]
+        if unknown:
+            raise UnknownMetricError(unknown, self.metrics)
+        key = (tuple(rows), tuple(metrics))
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached
+
+        columns = [self.metrics.index(m) for m in metrics]
+        selected = self.values[np.asarray(rows, dtype=np.intp)][:, columns]
+        # difference[i, j, k] = metric k of team i minus the same metric of team j
+        difference = (selected[:, None, :] - selected[None, :, :]).round(4)
+        # +1 where the row team is better, -1 where the column team is, 0 when level
+        direction = np.array([1 if higher_is_better(m) else -1 for m in metrics])
+        advantage = np.sign(difference) * direction
+
+        result = {
+            metric: {
+                "higher_is_better": higher_is_better(metric),
+                "values": _nullable(selected[:, k]),
+                "difference": _nullable(difference[:, :, k]),
+                "advantage": _nullable(advantage[:, :, k], int),
+            }
+            for k, metric in enumerate(metrics)
+        }
+
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > MATRIX_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return result
+
+
+def _nullable(values: np.ndarray, kind=float) -> List:
+    """``values.tolist()`` with unknown (NaN) entries as None, converted with ``kind`` otherwise"""
+    known = ~np.isnan(values)
+    if known.all():
+        return values.astype(kind).tolist()
+    return np.where(known, np.nan_to_num(values).astype(kind), None).tolist()
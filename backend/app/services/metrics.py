@@ -0,0 +1,57 @@
+"""
+Which way is better for each team metric.
+
+Efficiency margins, ratings and wins are better high; defensive efficiency,
+ranks, losses and the "allowed" four factors are better low. Comparisons,
+percentiles and matchup matrices all read the direction from here.
+"""
+from typing import Dict, Iterable, List
+
+HIGHER_IS_BETTER: Dict[str, bool] = {
+    "barthag": True,
+    "adjoe": True,
+    "adjde": False,
+    "sos": True,
+    "ncsos": True,
+    "WAB": True,
+    "wins": True,
+    "losses": False,
+    "rank": False,
+    "oe_rank": False,
+    "de_rank": False,
+    # Four factors, for sources that provide them
+    "efg_o": True,
+    "efg_d": False,
+    "tov_o": False,
+    "tov_d": True,
+    "or_o": True,
+    "or_d": False,
+    "ftr_o": True,
+    "ftr_d": False,
+}
+
+# Metrics the comparison endpoints report, in display order
+COMPARISON_METRICS = ["barthag", "adjoe", "adjde", "sos", "ncsos", "WAB", "wins", "losses"]
+
+
+class UnknownMetricError(ValueError):
+    """One or more requested metrics cannot be compared"""
+
+    def __init__(self, names: List[str], available: Iterable[str]):
+        self.names = names
+        self.available = list(available)
+        super().__init__(
+            f"Unknown metrics: {', '.join(names)}; choose from {', '.join(self.available)}"
+        )
+
+
+def higher_is_better(metric: str) -> bool:
+    """Direction for ``metric``; unknown metrics are assumed better high"""
+    return HIGHER_IS_BETTER.get(metric, True)
+
+
+def advantage(metric: str, value1: float, value2: float) -> str:
+    """Which side ("team1", "team2" or "even") has the edge in one metric"""
+    if value1 == value2:
+        return "even"
+    return "team1" if (value1 > value2) == higher_is_better(metric) else "team2"
@@ -0,0 +1,78 @@
+"""
+Per-season percentile tables.
+
+Each metric is sorted once per season version; a team's percentile is then a
+binary search into that array instead of a ``(df[col] < x).mean()`` scan, and
+the common cut points (quartiles, deciles) are read from a precomputed table.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .metrics import COMPARISON_METRICS, higher_is_better
+from .team_rows import native
+
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+
+class PercentileTable:
+    """Sorted values and quantile cut points for every metric in a season"""
+
+    __slots__ = ("teams", "_sorted", "_quantiles")
+
+    def __init__(self, df: pd.DataFrame):
+        self.teams = len(df)
+        self._sorted: Dict[str, np.ndarray] = {}
+        self._quantiles: Dict[str, Dict[str, float]] = {}
+        for metric in COMPARISON_METRICS:
+            if metric not in df or df.empty:
+                continue
+            values = np.sort(df[metric].to_numpy())
+            # Blank upstream cells (NaN) sort last; teams are ranked among the known values
+            values = values[:len(values) - int(np.isnan(values).sum())] if values.dtype.kind == "f" else values
+            if not len(values):
+                continue
+            self._sorted[metric] = values
+            # Upstream publishes at most 4 decimals; more would only be float32 noise
+            cuts = np.quantile(values.astype("float64"), QUANTILES).round(4)
+            self._quantiles[metric] = {f"p{round(q * 100)}": float(cut) for q, cut in zip(QUANTILES, cuts)}
+
+    def metrics(self):
+        return list(self._sorted)
+
+    def percentile(self, metric: str, value) -> Optional[Dict]:
+        """Where ``value`` falls among the season's teams, adjusted so higher is always better"""
+        values = self._sorted.get(metric)
+        if values is None or value is None or value != value:
+            return None
+
+        value = values.dtype.type(value)
+        below = int(np.searchsorted(values, value, side="left"))
+        above = len(values) - int(np.searchsorted(values, value, side="right"))
+        higher = higher_is_better(metric)
+        better_than, worse_than = (below, above) if higher else (above, below)
+        return {
+            "value": native(value),
+            "percentile": round(better_than / len(values) * 100, 1),
+            "rank": worse_than + 1,
+            "higher_is_better": higher,
+        }
+
+    def percentiles(self, metric: str, values: np.ndarray) -> Optional[np.ndarray]:
+        """``percentile()`` for a whole array of values at once"""
+        sorted_values = self._sorted.get(metric)
+        if sorted_values is None:
+            return None
+
+        values = np.asarray(values, dtype=sorted_values.dtype)
+        if higher_is_better(metric):
+            better_than = np.searchsorted(sorted_values, values, side="left")
+        else:
+            better_than = len(sorted_values) - np.searchsorted(sorted_values, values, side="right")
+        percentiles = np.round(better_than / len(sorted_values) * 100, 1)
+        # Unknown values have no percentile, so no percentile condition holds for them
+        return np.where(np.isnan(values), np.nan, percentiles) if values.dtype.kind == "f" else percentiles
+
+    def quantiles(self, metric: str) -> Optional[Dict[str, float]]:
+        return self._quantiles.get(metric)
@@ -0,0 +1,83 @@
+"""
+Game predictions for every pair of teams in a season.
+
+Win probability is log5 on ``barthag``; expected points multiply one side's
+adjusted offense by the other's adjusted defense relative to the season
+average, over a possession count from both teams' adjusted tempo. All of it is
+computed as (teams x teams) matrices once per season version, so a prediction
+is an index into arrays rather than a calculation per request.
+"""
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Venues relative to the first team
+VENUES = {"home": 1, "neutral": 0, "away": -1}
+
+# Share of efficiency the home side gains on offense and defense (1.4%, as BartTorvik adjusts)
+HOME_COURT_EDGE = 0.014
+
+# Exponent BartTorvik uses to turn adjusted efficiencies into barthag
+PYTHAG_EXPONENT = 11.5
+
+# Possessions per 40 minutes when a season has no tempo column
+DEFAULT_TEMPO = 68.0
+
+
+def _column(df: pd.DataFrame, name: str) -> np.ndarray:
+    return df[name].to_numpy("float64") if name in df else np.zeros(len(df))
+
+
+class MatchupPredictor:
+    """Neutral-court win probabilities, expected points and tempo for every pair of teams"""
+
+    __slots__ = ("teams", "win_probability", "points", "tempo")
+
+    def __init__(self, df: pd.DataFrame):
+        self.teams = len(df)
+        offense = _column(df, "adjoe")
+        defense = _column(df, "adjde")
+        tempo = _column(df, "adjt")
+
+        # Seasons without tempo data read it as NaN; fall back to the season's pace
+        known = ~np.isnan(tempo)
+        average_tempo = tempo[known].mean() if known.any() else DEFAULT_TEMPO
+        tempo = np.where(known, tempo, average_tempo)
+        average_efficiency = np.concatenate([offense, defense]).mean() if self.teams else 100.0
+
+        # tempo[i, j]: possessions when i plays j; points[i, j]: what i scores against j
+        self.tempo = (np.outer(tempo, tempo) / average_tempo).astype(np.float32)
+        efficiency = np.outer(offense, defense) / average_efficiency
+        self.points = (self.tempo * efficiency / 100).astype(np.float32)
+
+        # log5: P(i beats j) = odds_i / (odds_i + odds_j) with odds = barthag / (1 - barthag)
+        barthag = np.clip(_column(df, "barthag"), 1e-6, 1 - 1e-6)
+        odds = barthag / (1 - barthag)
+        self.win_probability = (odds[:, None] / (odds[:, None] + odds[None, :])).astype(np.float32)
+
+    def predict(self, row: int, opponents: Optional[Sequence[int]] = None, venue: str = "neutral") -> Dict[str, np.ndarray]:
+        """Predictions for ``row`` against ``opponents`` (default: every team) at ``venue``"""
+        columns = np.arange(self.teams) if opponents is None else np.asarray(opponents, dtype=np.intp)
+        side = VENUES[venue]
+        probability = self.win_probability[row, columns].astype("float64")
+        points_for = self.points[row, columns].astype("float64")
+        points_against = self.points[columns, row].astype("float64")
+
+        if side:
+            # The home side's offense rises and its opponent's falls, both by the edge on each end
+            edge = (1 + HOME_COURT_EDGE) / (1 - HOME_COURT_EDGE)
+            points_for *= ((1 + side * HOME_COURT_EDGE) ** 2)
+            points_against *= ((1 - side * HOME_COURT_EDGE) ** 2)
+            # Each side's barthag odds move by edge ** exponent, so the pair's odds ratio by its square
+            ratio = edge ** (2 * PYTHAG_EXPONENT * side)
+            probability = probability * ratio / (probability * ratio + (1 - probability))
+
+        return {
+            "opponents": columns,
+            "win_probability": probability.round(4),
+            "points_for": points_for.round(1),
+            "points_against": points_against.round(1),
+            "margin": (points_for - points_against).round(1),
+            "tempo": self.tempo[row, columns].astype("float64").round(1),
+        }
@@ -0,0 +1,133 @@
+"""
+Background warmup and refresh of BartTorvik seasons.
+
+At startup the current and recent seasons are loaded before the instance
+reports ready, so no user request pays for a cold upstream fetch. After that
+the current season is revalidated on a schedule that follows the basketball
+calendar: every few minutes on game nights, less often on other in-season
+days, and about once a day in the offseason. A refreshed season is parsed and
+indexed before it replaces the cached one, so requests see either the old
+version or the new one, never a partial build.
+"""
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+# Seconds between refreshes of the current season on game nights, other in-season days, and the offseason
+GAME_NIGHT_REFRESH_SECONDS = float(os.getenv("BARTTORVIK_REFRESH_GAME_NIGHT_SECONDS", "300"))
+IN_SEASON_REFRESH_SECONDS = float(os.getenv("BARTTORVIK_REFRESH_SECONDS", "1800"))
+OFFSEASON_REFRESH_SECONDS = float(os.getenv("BARTTORVIK_REFRESH_OFFSEASON_SECONDS", "86400"))
+
+# Seasons loaded at startup: the current one and this many before it
+WARM_PREVIOUS_SEASONS = int(os.getenv("BARTTORVIK_WARM_PREVIOUS_SEASONS", "2"))
+
+# Seconds between warmup attempts while the upstream is unreachable
+WARMUP_RETRY_SECONDS = 30
+
+# Games are scheduled in US Eastern time; November through the April Final Four
+SCHEDULE_TIMEZONE = ZoneInfo("America/New_York")
+SEASON_MONTHS = {11, 12, 1, 2, 3, 4}
+
+
+def refresh_interval(now: Optional[datetime] = None) -> float:
+    """Seconds until the next refresh of the current season, given the time of day and year"""
+    now = (now or datetime.now(SCHEDULE_TIMEZONE)).astimezone(SCHEDULE_TIMEZONE)
+    if now.month not in SEASON_MONTHS:
+        return OFFSEASON_REFRESH_SECONDS
+
+    # Results land in the evening, and from midday on weekends; late games finish after midnight
+    first_tip = 12 if now.weekday() >= 5 else 17
+    if now.hour >= first_tip or now.hour < 1:
+        return GAME_NIGHT_REFRESH_SECONDS
+    return IN_SEASON_REFRESH_SECONDS
+
+
+class RefreshScheduler:
+    """Warms seasons at startup, then keeps the current season fresh from a background task"""
+
+    def __init__(self, service, years: Optional[List[int]] = None):
+        self.service = service
+        current = service.current_year
+        self.years = years or list(range(current - WARM_PREVIOUS_SEASONS, current + 1))
+        self.ready = False
+        self.warmed_at: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.last_refresh: Optional[float] = None
+        self.last_refresh_seconds: Optional[float] = None
+        self.last_outcome: Optional[str] = None
+        self.next_refresh: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start warming and refreshing in the background; call from the app lifespan"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="barttorvik-refresh-scheduler")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def warm(self) -> bool:
+        """Load every configured season; the instance is ready once the current one is in memory"""
+        started = time.perf_counter()
+        seasons = await self.service.get_seasons(self.years)
+        missing = [year for year in self.years if year not in seasons or seasons[year].data.empty]
+        if missing:
+            print(f"Warmup could not load seasons: {missing}")
+
+        if self.service.current_year in seasons:
+            self.ready = True
+            self.warmed_at = time.time()
+            self.warmup_seconds = round(time.perf_counter() - started, 3)
+            print(f"Warmed {len(seasons)} seasons in {self.warmup_seconds:.2f}s")
+        return self.ready
+
+    async def refresh(self) -> None:
+        """Revalidate the current season against the upstream now"""
+        year = self.service.current_year
+        started = time.perf_counter()
+        try:
+            entry = await self.service.refresh_season(year)
+            self.last_outcome = "ok" if entry is not None else "refreshed_elsewhere"
+        except Exception as e:
+            self.last_outcome = f"failed: {e}"
+            print(f"Scheduled refresh of {year} season failed: {e}")
+        self.last_refresh = time.time()
+        self.last_refresh_seconds = round(time.perf_counter() - started, 3)
+
+    async def _run(self) -> None:
+        # The first import of pandas and friends takes a while; keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.service.load_modules)
+        while not await self.warm():
+            await asyncio.sleep(WARMUP_RETRY_SECONDS)
+
+        while True:
+            interval = refresh_interval()
+            self.next_refresh = time.time() + interval
+            await asyncio.sleep(interval)
+            await self.refresh()
+
+    def status(self) -> Dict:
+        """Readiness and refresh timing for the health endpoint"""
+        return {
+            "ready": self.ready,
+            "seasons": self.years,
+            "warmed_at": _timestamp(self.warmed_at),
+            "warmup_seconds": self.warmup_seconds,
+            "last_refresh": _timestamp(self.last_refresh),
+            "last_refresh_seconds": self.last_refresh_seconds,
+            "last_refresh_outcome": self.last_outcome,
+            "next_refresh": _timestamp(self.next_refresh),
+        }
+
+
+def _timestamp(seconds: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(seconds).astimezone().isoformat(timespec="seconds") if seconds else None
@@ -0,0 +1,150 @@
+"""
+Serialized JSON responses, cached per season version.
+
+Team lists, team detail and search results only change when a season does, so
+each is encoded once per version (with orjson when it is installed) and kept
+as bytes together with a strong ETag derived from those bytes. Serving a repeat
+request is then a dictionary lookup; a client that already holds the ETag gets
+a 304 without any body at all. Gzip and brotli encodings of a body are
+compressed on first request and kept alongside it. Bodies that are not JSON
+(the Arrow and Parquet season files) are cached the same way.
+"""
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback, several times slower on large payloads
+    orjson = None
+    import json
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Serialized responses kept per season version (team detail for every team, the list, recent searches)
+RESPONSE_CACHE_SIZE = 2048
+
+# Bodies smaller than this are sent uncompressed; below ~1 KB the headers cost more than compression saves
+COMPRESSION_MIN_BYTES = 1024
+
+# Content codings we can produce, best first
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=9)
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+class CachedBody:
+    """A response body encoded once, with the validators to serve it"""
+
+    __slots__ = ("body", "digest", "cache_control", "media_type", "compressible", "_encoded")
+
+    def __init__(self, body: bytes, cache_control: str, media_type: str = "application/json", compressible: bool = True):
+        self.body = body
+        self.digest = hashlib.blake2b(self.body, digest_size=12).hexdigest()
+        self.cache_control = cache_control
+        self.media_type = media_type
+        # False for formats that compress their own contents, where gzip on top only costs CPU
+        self.compressible = compressible
+        self._encoded: Dict[str, bytes] = {}
+
+    @property
+    def etag(self) -> str:
+        return self.etag_for(None)
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """Strong ETag of the body as sent with ``encoding``; each coding is a different byte sequence"""
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    def encoding_for(self, accepted: Iterable[str]) -> Optional[str]:
+        """The best coding the client accepts, or None to send the body as is"""
+        if not self.compressible or len(self.body) < COMPRESSION_MIN_BYTES:
+            return None
+        return next((encoding for encoding in ENCODINGS if encoding in accepted or "*" in accepted), None)
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        """The body in ``encoding``, compressed on first use and kept for the life of the version"""
+        if encoding is None:
+            return self.body
+        data = self._encoded.get(encoding)
+        if data is None:
+            data = self._encoded[encoding] = compress(self.body, encoding)
+        return data
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Whether an ``If-None-Match`` header already names this body, in any coding"""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        # If-None-Match uses weak comparison, so W/"x" matches "x"
+        digests = {tag.removeprefix("W/").strip('"').split("-", 1)[0] for tag in tags}
+        return "*" in tags or self.digest in digests
+
+
+class CachedJSON(CachedBody):
+    """A JSON payload serialized once"""
+
+    __slots__ = ()
+
+    def __init__(self, payload: Any, cache_control: str):
+        super().__init__(dumps(payload), cache_control)
+
+
+class ResponseCache:
+    """LRU of serialized responses for one season version"""
+
+    __slots__ = ("cache_control", "_responses", "_lock")
+
+    def __init__(self, cache_control: str):
+        self.cache_control = cache_control
+        self._responses: "OrderedDict[Hashable, CachedBody]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Optional[CachedJSON]:
+        """The cached response for ``key``, serializing ``build()`` on a miss; None if it builds nothing"""
+        def encode() -> Optional[CachedJSON]:
+            payload = build()
+            return None if payload is None else CachedJSON(payload, self.cache_control)
+
+        return self.body(key, encode)
+
+    def encode(self, build: Callable[[], Any]) -> Optional[CachedJSON]:
+        """Serialize ``build()`` with this version's cache headers without keeping it, for responses
+        keyed by arbitrary client input that would otherwise crowd out the shared entries"""
+        payload = build()
+        return None if payload is None else CachedJSON(payload, self.cache_control)
+
+    def body(self, key: Hashable, build: Callable[[], Optional[CachedBody]]) -> Optional[CachedBody]:
+        """The cached response for ``key`` when ``build()`` already produces the encoded body"""
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+                return cached
+
+        cached = build()
+        if cached is None:
+            return None
+
+        with self._lock:
+            self._responses[key] = cached
+            if len(self._responses) > RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return cached
@@ -0,0 +1,93 @@
+"""
+Rule-based scouting tags for every team in a season.
+
+The offense, defense, tempo and rating reads the dashboard pages used to make
+with if/else chains live here as data, so every client labels a team the same
+way. A condition compares a column with a threshold (``adjoe > 120``) or a
+team's percentile in a metric with a cut-off (top 10% in barthag), and is
+evaluated as one boolean mask over the whole season. Each rule belongs to a
+group; the first rule of a group whose conditions all hold tags the team, so a
+team gets at most one tag per group. Every comparison with an unknown (NaN)
+value is false, so teams in seasons without tempo data get no tempo tag. The tags are computed once per season version, which makes
+tagging all ~360 teams a few dozen array operations.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .percentiles import PercentileTable
+from .team_query import COMPARISONS
+from .team_rows import SeasonColumns
+
+STRENGTH = "strength"
+WEAKNESS = "weakness"
+NEUTRAL = "neutral"
+
+# Condition comparisons on a team's percentile (0-100, higher always better) rather than the raw value
+PERCENTILE_COMPARISONS = {f"pct_{op}": compare for op, compare in COMPARISONS.items()}
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A tag given when every ``(column, comparison, threshold)`` condition holds"""
+    tag: str
+    group: str
+    kind: str
+    label: str
+    conditions: Tuple[Tuple[str, str, float], ...] = ()
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"tag": self.tag, "group": self.group, "kind": self.kind, "label": self.label}
+
+
+RULES = [
+    Rule("elite_offense", "offense", STRENGTH, "Elite offensive efficiency", (("adjoe", "gt", 120), ("oe_rank", "lt", 50))),
+    Rule("good_offense", "offense", NEUTRAL, "Above-average offense", (("adjoe", "gt", 110),)),
+    Rule("weak_offense", "offense", WEAKNESS, "Below-average scoring"),
+    Rule("elite_defense", "defense", STRENGTH, "Elite defense", (("adjde", "lt", 95), ("de_rank", "lt", 50))),
+    Rule("solid_defense", "defense", NEUTRAL, "Average defense", (("adjde", "lt", 105),)),
+    Rule("weak_defense", "defense", WEAKNESS, "Porous defense"),
+    Rule("fast_tempo", "tempo", NEUTRAL, "Fast-paced, expect a high-possession game", (("adjt", "gte", 70),)),
+    Rule("slow_tempo", "tempo", NEUTRAL, "Slow pace, expect a half-court game", (("adjt", "lte", 65),)),
+    Rule("balanced_tempo", "tempo", NEUTRAL, "Balanced tempo", (("adjt", "gt", 65), ("adjt", "lt", 70))),
+    Rule("top_rated", "rating", STRENGTH, "Top-10% overall rating", (("barthag", "pct_gte", 90),)),
+    Rule("bottom_rated", "rating", WEAKNESS, "Bottom-quartile overall rating", (("barthag", "pct_lt", 25),)),
+    Rule("tested_schedule", "schedule", NEUTRAL, "Battle-tested by a top-quartile schedule", (("sos", "pct_gte", 75),)),
+    Rule("soft_schedule", "schedule", NEUTRAL, "Record built on a bottom-quartile schedule", (("sos", "pct_lt", 25),)),
+]
+
+
+class ScoutingTags:
+    """The tag every rule group gives each team in one season version"""
+
+    __slots__ = ("rules", "assigned", "_tags")
+
+    def __init__(self, columns: SeasonColumns, percentiles: PercentileTable, rules: List[Rule] = RULES):
+        self.rules = rules
+        groups = list(dict.fromkeys(rule.group for rule in rules))
+        # assigned[g, row] is the index of the rule that tagged ``row`` in group g, or -1
+        self.assigned = np.full((len(groups), len(columns)), -1, dtype=np.int16)
+        for index, rule in enumerate(rules):
+            group = self.assigned[groups.index(rule.group)]
+            group[(group == -1) & self._mask(rule, columns, percentiles)] = index
+        self._tags = [rule.to_dict() for rule in rules]
+
+    @staticmethod
+    def _mask(rule: Rule, columns: SeasonColumns, percentiles: PercentileTable) -> np.ndarray:
+        mask = np.ones(len(columns), dtype=bool)
+        for column, op, threshold in rule.conditions:
+            values = columns.arrays.get(column)
+            if op in PERCENTILE_COMPARISONS:
+                values = percentiles.percentiles(column, values) if values is not None else None
+                compare = PERCENTILE_COMPARISONS[op]
+            else:
+                compare = COMPARISONS[op]
+            if values is None:
+                return np.zeros(len(columns), dtype=bool)
+            mask &= compare(values, threshold)
+        return mask
+
+    def tags(self, row: int) -> List[Dict[str, str]]:
+        """One team's tags, one per group that tagged it, in group order"""
+        return [self._tags[index] for index in self.assigned[:, row].tolist() if index >= 0]
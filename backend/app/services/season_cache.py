@@ -0,0 +1,143 @@
+"""
+In-process cache of parsed BartTorvik seasons.
+
+Finished seasons never change upstream, so they are cached for the life of the
+process. The current season is cached for a configurable TTL; once that expires
+the stale copy keeps being served while a refresh runs in the background.
+"""
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Seconds the current season stays fresh before a background refresh is started
+DEFAULT_TTL_SECONDS = float(os.getenv("BARTTORVIK_CACHE_TTL", "900"))
+
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+# First month of a new season; BartTorvik names a season by the year it ends in
+SEASON_START_MONTH = 11
+
+
+def season_year(now: Optional[datetime] = None) -> int:
+    """The season in progress (or most recently finished) at ``now``: 2026 from November 2025 on"""
+    now = now or datetime.now()
+    return now.year + 1 if now.month >= SEASON_START_MONTH else now.year
+
+
+@dataclass
+class SeasonEntry:
+    """A parsed season plus the bookkeeping needed to decide when to refresh it"""
+    year: int
+    data: Any  # pandas.DataFrame
+    fetched_at: float
+    # Validators from the upstream response and a digest of its body, used to
+    # skip re-downloading and re-parsing a season that has not changed
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    # Identity of the shared store file this entry was read from or written to
+    store_id: Optional[Tuple[int, int, int]] = None
+    # Structures computed from ``data`` (search index, ...); a new version starts empty
+    derived: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def version(self) -> Optional[str]:
+        """Short identifier of the upstream content this entry was parsed from"""
+        return self.content_hash[:16] if self.content_hash else None
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def memo(self, key: str, build: Callable[[Any], Any]) -> Any:
+        """Return ``build(data)``, computing it only once for this version of the season"""
+        value = self.derived.get(key)
+        if value is None:
+            value = self.derived[key] = build(self.data)
+        return value
+
+
+class SeasonCache:
+    def __init__(self, current_year: Optional[int] = None, ttl: Optional[float] = None):
+        # Fixed for tests and scripts; otherwise follows the calendar, so a long-running process rolls over in November
+        self._current_year = current_year
+        self.ttl = DEFAULT_TTL_SECONDS if ttl is None else ttl
+        self._entries: Dict[int, SeasonEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        # Outcome of each upstream refresh: "updated", "not_modified" (304) or "unchanged" (same hash)
+        self.refreshes = Counter()
+
+    @property
+    def current_year(self) -> int:
+        return self._current_year if self._current_year is not None else season_year()
+
+    def is_pinned(self, year: int) -> bool:
+        """Past seasons are final and never expire"""
+        return year < self.current_year
+
+    def is_fresh(self, entry: SeasonEntry) -> bool:
+        return self.is_pinned(entry.year) or entry.age() < self.ttl
+
+    def lookup(self, year: int):
+        """Return ``(entry, state)`` where state is FRESH, STALE or MISS"""
+        with self._lock:
+            entry = self._entries.get(year)
+            if entry is None:
+                self.misses += 1
+                return None, MISS
+            if self.is_fresh(entry):
+                self.hits += 1
+                return entry, FRESH
+            self.stale_hits += 1
+            return entry, STALE
+
+    def peek(self, year: int) -> Optional[SeasonEntry]:
+        """Return the cached entry without touching the counters"""
+        return self._entries.get(year)
+
+    def put(self, entry: SeasonEntry) -> None:
+        with self._lock:
+            self._entries[entry.year] = entry
+
+    def record_refresh(self, outcome: str) -> None:
+        with self._lock:
+            self.refreshes[outcome] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Counters and per-season ages for the health endpoint"""
+        with self._lock:
+            entries = list(self._entries.values())
+            lookups = self.hits + self.stale_hits + self.misses
+            stats = {
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else None,
+                "refreshes": dict(self.refreshes),
+            }
+
+        stats["seasons"] = {
+            str(entry.year): {
+                "rows": len(entry.data),
+                "version": entry.version,
+                "age_seconds": round(entry.age(), 1),
+                "pinned": self.is_pinned(entry.year),
+                "fresh": self.is_fresh(entry),
+                "responses": len(entry.derived.get("responses") or ()),
+            }
+            for entry in sorted(entries, key=lambda e: e.year)
+        }
+        return stats
@@ -0,0 +1,69 @@
+"""
+Coalescing of concurrent calls for the same key.
+
+When several callers ask for the same season at once, only the first one does
+the work; everyone else waits on its result, or its exception.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call for ``key`` is already in flight, then share its outcome"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if leader:
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    del self._calls[key]
+
+        return future.result()
+
+    def in_flight(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._calls
+
+
+class AsyncSingleFlight:
+    """Event-loop counterpart of SingleFlight; callers await one shared task"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Future"] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+
+        # A caller giving up (client disconnect) must not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Future") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled
+            task.exception()
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
@@ -0,0 +1,186 @@
+"""
+On-disk Arrow IPC snapshots of parsed seasons.
+
+A fresh process loads seasons from here instead of waiting on barttorvik.com,
+then revalidates the current season in the background. Each file carries a
+format version and the upstream content hash in its schema metadata, so a
+snapshot written by an older parser is ignored rather than misread.
+
+The directory doubles as the season store shared by every worker process on a
+host. Files are memory-mapped read-only, so numeric columns are served from the
+page cache instead of being copied into each worker. A per-season file lock
+elects one refresher at a time; a new version is published by atomically
+replacing the file, and a revalidation that found nothing new just bumps its
+mtime. Workers notice either change with a single ``stat``.
+"""
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: locking degrades to per-process
+    fcntl = None
+
+from .season_cache import SeasonEntry
+
+# Bump whenever the parsed schema changes so stale snapshots are rebuilt
+FORMAT_VERSION = "5"
+
+DEFAULT_SNAPSHOT_DIR = os.getenv("BARTTORVIK_SNAPSHOT_DIR") or os.path.join(
+    os.path.dirname(__file__), "..", "..", "data", "snapshots"
+)
+
+_META_PREFIX = "barttorvik."
+
+
+class SnapshotStore:
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = os.path.abspath(directory or DEFAULT_SNAPSHOT_DIR)
+        self._enabled: Optional[bool] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether pyarrow is installed; checked on the first snapshot read or write, not at startup"""
+        if self._enabled is None:
+            self._enabled = _pyarrow_available()
+            if not self._enabled:
+                print("pyarrow is not installed; season snapshots are disabled")
+        return self._enabled
+
+    def path(self, year: int) -> str:
+        return os.path.join(self.directory, f"{year}_team_results.arrow")
+
+    def years(self) -> List[int]:
+        """Seasons that have a snapshot on disk"""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            int(name.split("_", 1)[0])
+            for name in os.listdir(self.directory)
+            if name.endswith("_team_results.arrow") and name.split("_", 1)[0].isdigit()
+        )
+
+    def stat(self, year: int) -> Optional[Tuple[Tuple[int, int, int], float]]:
+        """``(file identity, last validated time)`` of a season's file, or None"""
+        try:
+            st = os.stat(self.path(year))
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino, st.st_size), st.st_mtime
+
+    def touch(self, year: int) -> None:
+        """Record that the upstream was checked and the stored version is still current"""
+        try:
+            os.utime(self.path(year))
+        except OSError:
+            pass
+
+    @contextmanager
+    def lock(self, year: int, blocking: bool = True) -> Iterator[bool]:
+        """Hold the season's refresh lock; yields False if ``blocking`` is off and another process has it"""
+        if fcntl is None or not self.enabled:
+            yield True
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, f"{year}.lock"), "a") as handle:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            try:
+                fcntl.flock(handle, flags)
+                acquired = True
+            except BlockingIOError:
+                acquired = False
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def save(self, entry: SeasonEntry) -> Optional[str]:
+        """Write a season atomically so readers never see a half-written file"""
+        if not self.enabled or entry.data.empty:
+            return None
+
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(entry.data, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata.update({
+            (_META_PREFIX + key).encode(): str(value).encode()
+            for key, value in self._header(entry).items()
+            if value is not None
+        })
+        table = table.replace_schema_metadata(metadata)
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(entry.year)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+
+        stat = self.stat(entry.year)
+        entry.store_id = stat[0] if stat else None
+        return path
+
+    def load(self, year: int) -> Optional[SeasonEntry]:
+        """Read a season's snapshot, or None if it is missing, unreadable or from another format"""
+        path = self.path(year)
+        if not self.enabled or not os.path.exists(path):
+            return None
+
+        import pyarrow as pa
+
+        stat = self.stat(year)
+        try:
+            # The mapping stays open for as long as the DataFrame's buffers reference it
+            table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        except (OSError, pa.ArrowInvalid) as e:
+            print(f"Ignoring unreadable snapshot {path}: {e}")
+            return None
+
+        header = self.read_header(table.schema)
+        if header.get("format_version") != FORMAT_VERSION:
+            return None
+
+        return SeasonEntry(
+            year=year,
+            # split_blocks keeps null-free numeric columns as zero-copy views of the map
+            data=table.to_pandas(split_blocks=True),
+            fetched_at=max(float(header.get("fetched_at") or 0), stat[1] if stat else 0),
+            etag=header.get("etag"),
+            last_modified=header.get("last_modified"),
+            content_hash=header.get("content_hash"),
+            store_id=stat[0] if stat else None,
+        )
+
+    @staticmethod
+    def read_header(schema) -> Dict[str, str]:
+        return {
+            key.decode()[len(_META_PREFIX):]: value.decode()
+            for key, value in (schema.metadata or {}).items()
+            if key.decode().startswith(_META_PREFIX)
+        }
+
+    @staticmethod
+    def _header(entry: SeasonEntry) -> Dict:
+        return {
+            "format_version": FORMAT_VERSION,
+            "year": entry.year,
+            "content_hash": entry.content_hash,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "fetched_at": entry.fetched_at,
+            "written_at": time.time(),
+        }
+
+
+def _pyarrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
@@ -0,0 +1,83 @@
+"""
+Cross-season team history.
+
+A range of seasons is folded into one (teams x seasons) array per metric, with
+rows keyed by canonical team id. A team's trajectory is then one dictionary
+lookup and a row slice, not a name search in every season's DataFrame.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# First season BartTorvik publishes team results for
+FIRST_SEASON = 2008
+
+# Longest range one history request may span
+MAX_HISTORY_SEASONS = 20
+
+# Metrics a history reports, in display order
+HISTORY_METRICS = ["rank", "adjoe", "adjde", "barthag", "WAB"]
+
+# Metrics reported as whole numbers
+_INTEGER_METRICS = {"rank"}
+
+
+class TeamHistory:
+    """Every team's metrics across a range of seasons, indexed by team id"""
+
+    __slots__ = ("years", "ids", "names", "played", "conferences", "values", "_index")
+
+    def __init__(self, seasons: Sequence[Tuple[int, Sequence[str], pd.DataFrame]]):
+        """``seasons`` holds ``(year, team ids by row, season DataFrame)``, in any order"""
+        seasons = sorted(seasons, key=lambda season: season[0])
+        self.years: List[int] = [year for year, _, _ in seasons]
+
+        # Newest seasons first, so a team's current name wins
+        self._index: Dict[str, int] = {}
+        self.names: List[str] = []
+        for _, ids, df in reversed(seasons):
+            for team_id, name in zip(ids, df["team"].tolist()):
+                if team_id not in self._index:
+                    self._index[team_id] = len(self.names)
+                    self.names.append(name)
+        self.ids = list(self._index)
+
+        shape = (len(self.ids), len(self.years))
+        self.values: Dict[str, np.ndarray] = {metric: np.full(shape, np.nan) for metric in HISTORY_METRICS}
+        self.played = np.zeros(shape, dtype=bool)
+        self.conferences = np.full(shape, "", dtype=object)
+        for column, (_, ids, df) in enumerate(seasons):
+            rows = np.fromiter((self._index[team_id] for team_id in ids), dtype=np.intp, count=len(ids))
+            self.played[rows, column] = True
+            for metric, values in self.values.items():
+                if metric in df:
+                    values[rows, column] = df[metric].to_numpy("float64").round(4)
+            if "conf" in df:
+                self.conferences[rows, column] = df["conf"].astype(str).to_numpy(object)
+
+    def __contains__(self, team_id: str) -> bool:
+        return team_id in self._index
+
+    def trajectory(self, team_id: str) -> Optional[Dict]:
+        """The team's metrics in each season of the range it played, oldest first"""
+        row = self._index.get(team_id)
+        if row is None:
+            return None
+
+        played = self.played[row]
+        trajectories = {}
+        for metric, values in self.values.items():
+            series = values[row, played]
+            if metric in _INTEGER_METRICS:
+                trajectories[metric] = [None if np.isnan(v) else int(v) for v in series]
+            else:
+                trajectories[metric] = [None if np.isnan(v) else float(v) for v in series]
+
+        return {
+            "team_id": team_id,
+            "team": self.names[row],
+            "years": [year for year, present in zip(self.years, played) if present],
+            "conferences": self.conferences[row, played].tolist(),
+            "trajectories": trajectories,
+        }
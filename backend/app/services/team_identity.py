@@ -0,0 +1,142 @@
+"""
+Canonical team identity for a season.
+
+Every team gets a stable id derived from its BartTorvik name ("North Carolina
+St." -> ``north-carolina-st``). A single dictionary maps ids, normalized names
+and known aliases (abbreviations, and the spellings other sources use) to the
+team's row, so resolving a name is one hash lookup. A name that is none of
+those falls back to the search index; if that yields more than one team, the
+caller gets the candidates instead of a guess.
+"""
+import re
+from typing import Dict, Iterable, List, Optional
+
+from .team_index import TeamNameIndex, normalize_name
+
+# BartTorvik name -> other names people and sources use for the team
+ALIASES: Dict[str, List[str]] = {
+    "Illinois": ["UIUC", "Illini", "Fighting Illini"],
+    "Illinois Chicago": ["UIC", "Illinois-Chicago"],
+    "Connecticut": ["UConn"],
+    "North Carolina": ["UNC"],
+    "North Carolina St.": ["NC State", "N.C. State", "NCSU"],
+    "Mississippi": ["Ole Miss"],
+    "Mississippi St.": ["Miss State", "Miss St."],
+    "Miami FL": ["Miami (FL)", "Miami Florida"],
+    "Miami OH": ["Miami (OH)", "Miami Ohio"],
+    "Pittsburgh": ["Pitt"],
+    "Massachusetts": ["UMass"],
+    "St. John's": ["St. John's (NY)", "Saint John's"],
+    "Saint Mary's": ["St. Mary's", "Saint Mary's (CA)", "St. Mary's (CA)"],
+    "Saint Joseph's": ["St. Joseph's"],
+    "Saint Louis": ["St. Louis", "SLU"],
+    "Loyola Chicago": ["Loyola (IL)", "Loyola-Chicago"],
+    "Texas A&M": ["TAMU"],
+    "LSU": ["Louisiana State"],
+    "USC": ["Southern California", "Southern Cal"],
+    "UCF": ["Central Florida"],
+    "SMU": ["Southern Methodist"],
+    "BYU": ["Brigham Young"],
+    "VCU": ["Virginia Commonwealth"],
+    "UNLV": ["Nevada-Las Vegas", "Nevada Las Vegas"],
+    "UTEP": ["Texas-El Paso", "Texas El Paso"],
+    "UTSA": ["Texas-San Antonio", "Texas San Antonio"],
+    "Michigan St.": ["Michigan State"],
+    "Ohio St.": ["Ohio State"],
+    "Penn St.": ["Penn State"],
+    "Iowa St.": ["Iowa State"],
+    "Kansas St.": ["Kansas State", "K-State"],
+    "Oklahoma St.": ["Oklahoma State"],
+    "Oregon St.": ["Oregon State"],
+    "Washington St.": ["Washington State", "Wazzu"],
+    "Arizona St.": ["Arizona State"],
+    "Florida St.": ["Florida State"],
+    "San Diego St.": ["San Diego State", "SDSU"],
+    "Boise St.": ["Boise State"],
+    "Colorado St.": ["Colorado State"],
+    "Utah St.": ["Utah State"],
+    "Illinois St.": ["Illinois State"],
+    "Penn": ["Pennsylvania", "UPenn"],
+    "California": ["Cal"],
+    "Purdue Fort Wayne": ["PFW", "Fort Wayne"],
+    "Nebraska Omaha": ["Omaha"],
+    "LIU": ["Long Island", "LIU Brooklyn"],
+}
+
+# Candidates returned with an ambiguous name, best match first
+MAX_CANDIDATES = 10
+
+_SLUG_SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+
+def team_id(name: str) -> str:
+    """Stable identifier for a team ("St. John's" -> "st-johns")"""
+    return _SLUG_SEPARATORS.sub("-", normalize_name(name)).strip("-")
+
+
+class AmbiguousTeamError(LookupError):
+    """A team name matched more than one team"""
+
+    def __init__(self, name: str, candidates: List[str]):
+        super().__init__(f"'{name}' matches several teams: {', '.join(candidates)}")
+        self.name = name
+        self.candidates = candidates
+
+
+class UnknownTeamError(LookupError):
+    """One or more team names matched no team"""
+
+    def __init__(self, names: List[str]):
+        super().__init__(f"Teams not found: {', '.join(names)}")
+        self.names = names
+
+
+class TeamDirectory:
+    """A season's teams by canonical id, with O(1) name and alias resolution"""
+
+    __slots__ = ("names", "ids", "index", "_rows")
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = [str(name) for name in names]
+        self.ids: List[str] = [team_id(name) for name in self.names]
+        self.index = TeamNameIndex(self.names)
+        self._rows: Dict[str, int] = {}
+
+        # Real names win over aliases, so an alias can never hide a team
+        for row, name in enumerate(self.names):
+            self._rows.setdefault(self.ids[row], row)
+            self._rows.setdefault(self.index.names[row], row)
+        rows_by_name = {name: row for row, name in enumerate(self.names)}
+        for canonical, aliases in ALIASES.items():
+            row = rows_by_name.get(canonical)
+            if row is None:
+                continue
+            for alias in aliases:
+                self._rows.setdefault(normalize_name(alias), row)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Row of the team with this id, name or alias; no fuzzy matching"""
+        row = self._rows.get(normalize_name(name))
+        return self._rows.get(name.strip().lower()) if row is None else row
+
+    def resolve(self, name: str) -> Optional[int]:
+        """Row of the team ``name`` refers to, or None; raises AmbiguousTeamError if it could be several"""
+        row = self.lookup(name)
+        if row is not None:
+            return row
+
+        matches = self.index.search(name)
+        if len(matches) > 1:
+            raise AmbiguousTeamError(name, [self.names[match] for match in matches[:MAX_CANDIDATES]])
+        return matches[0] if matches else None
+
+    def search(self, query: str) -> List[int]:
+        """Ranked rows for a search box; an alias hit ("UConn") comes first"""
+        rows = self.index.search(query)
+        aliased = self.lookup(query)
+        if aliased is not None and (not rows or rows[0] != aliased):
+            rows = [aliased] + [row for row in rows if row != aliased]
+        return rows
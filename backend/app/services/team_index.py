@@ -0,0 +1,130 @@
+"""
+Prebuilt team-name index for a season.
+
+Built once per season version and reused by every search and name lookup,
+instead of a regex ``str.contains`` scan over the team column per request.
+Names and queries are normalized the same way (case, accents, punctuation), so
+"st johns", "St. John's" and "ST JOHN'S" all land on the same team, and regex
+metacharacters in a query have no special meaning.
+
+Matches are ranked:
+
+    EXACT        the whole name        "illinois"    -> Illinois
+    PREFIX       start of the name     "illinois c"  -> Illinois Chicago
+    WORD_PREFIX  start of a later word "carolina"    -> North Carolina
+    SUBSTRING    anywhere              "linoi"       -> Illinois, Illinois Chicago, ...
+
+Prefix tiers come from a trie over every word-start suffix of each name;
+substrings from n-gram postings intersected, then verified.
+"""
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+EXACT = 0
+PREFIX = 1
+WORD_PREFIX = 2
+SUBSTRING = 3
+
+# Longest n-gram with its own postings list; shorter queries are looked up directly
+NGRAM = 3
+
+_NON_ALNUM = re.compile(r"[^0-9a-z&]+")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents and collapse punctuation ("St. John's" -> "st johns")"""
+    text = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode().lower()
+    text = text.replace("'", "")
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+class TeamNameIndex:
+    """Ranked lookups of a season's team names, returning row positions"""
+
+    __slots__ = ("names", "_exact", "_trie", "_postings")
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = [normalize_name(name) for name in names]
+        self._exact: Dict[str, List[int]] = {}
+        # Nested dicts keyed by character; "" holds (row, starts_name) for everything below the node
+        self._trie: Dict = {"": []}
+        self._postings: Dict[str, Set[int]] = {}
+
+        for row, name in enumerate(self.names):
+            if not name:
+                continue
+            self._exact.setdefault(name, []).append(row)
+            for start in _word_starts(name):
+                self._insert(name[start:], (row, start == 0))
+            for gram in _grams(name):
+                self._postings.setdefault(gram, set()).add(row)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """Row positions matching ``query``, best match first"""
+        return [row for row, _ in self.ranked(query, limit)]
+
+    def best(self, query: str) -> Optional[int]:
+        """Row position of the best match for ``query``, or None"""
+        matches = self.search(query, limit=1)
+        return matches[0] if matches else None
+
+    def ranked(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, int]]:
+        """``(row, tier)`` pairs ordered by tier, then by row (upstream rank order)"""
+        q = normalize_name(query)
+        if not q:
+            if query.strip():
+                # Nothing but punctuation, e.g. "(": nothing can match
+                return []
+            rows = range(len(self.names)) if limit is None else range(min(limit, len(self.names)))
+            return [(row, SUBSTRING) for row in rows]
+
+        tiers = {row: EXACT for row in self._exact.get(q, ())}
+        for row, starts_name in self._prefixed(q):
+            tier = PREFIX if starts_name else WORD_PREFIX
+            if tier < tiers.get(row, SUBSTRING + 1):
+                tiers[row] = tier
+        for row in self._containing(q):
+            tiers.setdefault(row, SUBSTRING)
+
+        ranked = sorted(tiers.items(), key=lambda item: (item[1], item[0]))
+        return ranked if limit is None else ranked[:limit]
+
+    def _insert(self, suffix: str, posting: Tuple[int, bool]) -> None:
+        node = self._trie
+        node[""].append(posting)
+        for char in suffix:
+            node = node.setdefault(char, {"": []})
+            node[""].append(posting)
+
+    def _prefixed(self, q: str) -> List[Tuple[int, bool]]:
+        node = self._trie
+        for char in q:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node[""]
+
+    def _containing(self, q: str) -> Set[int]:
+        if len(q) <= NGRAM:
+            return self._postings.get(q, set())
+
+        # Every NGRAM-window of the query must occur in the name; verify the survivors
+        grams = sorted((q[i:i + NGRAM] for i in range(len(q) - NGRAM + 1)), key=lambda g: len(self._postings.get(g, ())))
+        candidates = set(self._postings.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self._postings.get(gram, set())
+        return {row for row in candidates if q in self.names[row]}
+
+
+def _word_starts(name: str) -> List[int]:
+    return [0] + [i + 1 for i, char in enumerate(name) if char == " " and i + 1 < len(name)]
+
+
+def _grams(name: str) -> Set[str]:
+    return {name[i:i + n] for n in range(1, NGRAM + 1) for i in range(len(name) - n + 1)}
@@ -0,0 +1,169 @@
+"""
+Filtered, sorted and paged team queries over a season.
+
+Every sortable column gets its ascending and descending orders computed once
+per season version. A query turns its filters into one boolean mask over the
+season's column arrays, keeps the positions of the requested order that pass
+it and slices out the page, so a top-k or range query gathers a few hundred
+integers and never copies or re-sorts the DataFrame. Sorting on several keys
+falls back to a ``lexsort`` of the cached sort keys.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .team_results_parser import COLUMN_ORDER
+from .team_rows import SeasonColumns
+
+# Columns compared against numbers; conf and team are matched as text
+NUMERIC_COLUMNS = [name for name in COLUMN_ORDER if name not in ("team", "conf", "record")]
+
+SORTABLE_COLUMNS = ["team", "conf", *NUMERIC_COLUMNS]
+
+# Text columns filtered by equality against a comma-separated list
+TEXT_FILTERS = ("conf",)
+
+COMPARISONS = {
+    "gt": np.greater,
+    "gte": np.greater_equal,
+    "lt": np.less,
+    "lte": np.less_equal,
+}
+
+DEFAULT_SORT = (("rank", False),)
+
+DEFAULT_QUERY_LIMIT = 50
+MAX_QUERY_LIMIT = 500
+
+
+@dataclass(frozen=True)
+class TeamQuery:
+    """A parsed, validated query"""
+    filters: Tuple[Tuple[str, str, Tuple], ...]
+    sort: Tuple[Tuple[str, bool], ...] = DEFAULT_SORT
+    limit: int = DEFAULT_QUERY_LIMIT
+    offset: int = 0
+
+
+def parse_query(
+    filters: Mapping[str, str],
+    sort: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+) -> TeamQuery:
+    """Build a query from ``conf=B10``, ``adjoe_gt=115``, ``barthag_between=0.8,0.95`` style
+    parameters and ``sort=conf,-barthag``; raises ValueError for anything it does not understand"""
+    parsed = []
+    for key, raw in sorted(filters.items()):
+        if key in TEXT_FILTERS:
+            values = tuple(sorted({value.strip().lower() for value in raw.split(",") if value.strip()}))
+            if not values:
+                raise ValueError(f"'{key}' needs at least one value")
+            parsed.append((key, "in", values))
+            continue
+
+        column, _, op = key.rpartition("_")
+        if column not in NUMERIC_COLUMNS or (op not in COMPARISONS and op != "between"):
+            raise ValueError(
+                f"Unknown filter '{key}'. Use {', '.join(TEXT_FILTERS)}=a,b or "
+                f"<column>_gt|gte|lt|lte|between with a column in {', '.join(NUMERIC_COLUMNS)}"
+            )
+        try:
+            bounds = tuple(float(value) for value in raw.split(","))
+        except ValueError:
+            raise ValueError(f"'{key}' needs numbers, got '{raw}'")
+        if len(bounds) != (2 if op == "between" else 1):
+            raise ValueError(f"'{key}' needs {'two comma-separated numbers' if op == 'between' else 'one number'}")
+        parsed.append((column, op, bounds))
+
+    keys = []
+    for key in (sort or "").split(","):
+        key = key.strip()
+        if not key:
+            continue
+        column = key.lstrip("-+")
+        if column not in SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort by '{column}'. Sortable: {', '.join(SORTABLE_COLUMNS)}")
+        keys.append((column, key.startswith("-")))
+
+    limit = DEFAULT_QUERY_LIMIT if limit is None else limit
+    offset = offset or 0
+    if not 1 <= limit <= MAX_QUERY_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_QUERY_LIMIT}")
+    if offset < 0:
+        raise ValueError("offset cannot be negative")
+
+    return TeamQuery(tuple(parsed), tuple(keys) or DEFAULT_SORT, limit, offset)
+
+
+class SortOrders:
+    """Per-column sort keys and orders for one season version"""
+
+    __slots__ = ("columns", "_keys", "_ascending", "_descending")
+
+    def __init__(self, columns: SeasonColumns):
+        self.columns = columns
+        self._keys: Dict[str, np.ndarray] = {}
+        self._ascending: Dict[str, np.ndarray] = {}
+        self._descending: Dict[str, np.ndarray] = {}
+        for name in SORTABLE_COLUMNS:
+            if name not in columns.arrays:
+                continue
+            values = columns.arrays[name]
+            if name in columns.labels:
+                values = columns.labels[name][values]
+            if values.dtype == object:
+                # Text sorts by its position among the distinct values
+                values = np.unique(values, return_inverse=True)[1]
+            keys = values.astype(np.float64)
+            self._keys[name] = keys
+            # Stable, so ties keep the season's rank order; NaN sorts last both ways
+            self._ascending[name] = np.argsort(keys, kind="stable")
+            self._descending[name] = np.argsort(-keys, kind="stable")
+
+    def order(self, sort: Tuple[Tuple[str, bool], ...]) -> np.ndarray:
+        """Row positions in ``sort`` order"""
+        if len(sort) == 1:
+            name, descending = sort[0]
+            return (self._descending if descending else self._ascending)[name]
+        # lexsort's last key is the primary one
+        return np.lexsort([-self._keys[name] if descending else self._keys[name] for name, descending in reversed(sort)])
+
+    def mask(self, filters: Tuple[Tuple[str, str, Tuple], ...]) -> Optional[np.ndarray]:
+        """Rows passing every filter, or None when there are no filters"""
+        mask = None
+        for name, op, values in filters:
+            if name not in self.columns.arrays:
+                passed = np.zeros(len(self.columns), dtype=bool)
+            elif op == "in":
+                labels = self.columns.labels[name]
+                wanted = [code for code, label in enumerate(labels[:-1]) if label.lower() in values]
+                passed = np.isin(self.columns.arrays[name], wanted)
+            else:
+                column = self.columns.arrays[name]
+                # Compare floats in the column's own dtype so 0.95 means the float32 0.95 stored there
+                bounds = [column.dtype.type(bound) if column.dtype.kind == "f" else bound for bound in values]
+                if op == "between":
+                    passed = (column >= min(bounds)) & (column <= max(bounds))
+                else:
+                    passed = COMPARISONS[op](column, bounds[0])
+            mask = passed if mask is None else mask & passed
+        return mask
+
+    def select(self, query: TeamQuery) -> Tuple[int, np.ndarray]:
+        """``(teams matching, positions of the requested page)``"""
+        order = self.order(query.sort)
+        mask = self.mask(query.filters)
+        if mask is not None:
+            order = order[mask[order]]
+        return len(order), order[query.offset:query.offset + query.limit]
+
+    def run(self, query: TeamQuery, fields: List[str], team_ids) -> Dict:
+        total, positions = self.select(query)
+        return {
+            "total": total,
+            "offset": query.offset,
+            "limit": query.limit,
+            "teams": self.columns.project(positions, fields, team_ids),
+        }
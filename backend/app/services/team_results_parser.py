@@ -0,0 +1,160 @@
+"""
+Column-wise parser for BartTorvik's ``{year}_team_results.csv``.
+
+The upstream header row does not line up with the data rows, so columns are
+selected by position rather than by name. Every selected column is converted in
+one typed pass by the pandas C (or pyarrow) reader instead of cell by cell.
+"""
+import importlib.util
+import io
+import os
+from typing import Dict, List, Union
+
+import numpy as np
+import pandas as pd
+
+# "pyarrow" or "c"; pyarrow falls back to the pandas C reader when it is not installed
+CSV_ENGINE = os.getenv("BARTTORVIK_CSV_ENGINE", "pyarrow")
+
+# Position in the upstream row -> output column name
+STRING_COLUMNS = {1: "team", 2: "conf", 3: "record"}
+INT_COLUMNS = {0: "rank", 5: "oe_rank", 7: "de_rank"}
+FLOAT_COLUMNS = {4: "adjoe", 6: "adjde", 8: "barthag", 15: "sos", 16: "ncsos", 41: "WAB", 44: "adjt"}
+
+# Rank used when an upstream cell is blank or not a number; blank ratings stay NaN
+# (null in responses) so a season without tempo data never reads as a tempo of 0
+MISSING_RANK = 999
+
+# "21-10" -> wins, losses
+RECORD_PATTERN = r"^\s*(?P<wins>\d+)-(?P<losses>\d+)\s*$"
+
+COLUMN_ORDER = [
+    "rank", "team", "conf", "record", "adjoe", "oe_rank", "adjde", "de_rank",
+    "barthag", "sos", "ncsos", "WAB", "wins", "losses", "adjt",
+]
+
+# Compact storage: ranks and counts fit int16, ratings keep float32's ~7 significant
+# digits (upstream publishes at most 4 decimals), conferences repeat ~360 times
+RANK_DTYPE = "int16"
+RATING_DTYPE = "float32"
+CONF_DTYPE = "category"
+# Team names and records as Arrow-backed strings (one contiguous buffer) whatever the pandas
+# version's default string type is; plain object columns only when pyarrow is not installed
+STRING_DTYPE = "string[pyarrow]" if importlib.util.find_spec("pyarrow") else object
+
+_NAMES = {**STRING_COLUMNS, **INT_COLUMNS, **FLOAT_COLUMNS}
+_POSITIONS = sorted(_NAMES)
+
+
+def parse_team_results(text: Union[str, bytes], engine: str = CSV_ENGINE) -> pd.DataFrame:
+    """Parse the raw team results CSV into a DataFrame with the service's schema"""
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    if not text.strip():
+        return empty_team_results()
+
+    raw = _read(text, engine)
+    keep = pd.notna(raw[1])
+
+    columns = {}
+    for pos, name in _NAMES.items():
+        values = raw[pos][keep]
+        if pos in STRING_COLUMNS:
+            values = np.where(pd.isna(values), "", values).astype(object)
+            columns[name] = pd.Categorical(values) if name == "conf" else pd.array(values, dtype=STRING_DTYPE)
+        elif pos in INT_COLUMNS:
+            columns[name] = np.where(np.isnan(values), MISSING_RANK, values).astype(RANK_DTYPE)
+        else:
+            columns[name] = values.astype(RATING_DTYPE)
+
+    # "21-10" -> wins/losses; anything else counts as 0-0
+    wins, losses = raw["wins"][keep], raw["losses"][keep]
+    valid = ~(np.isnan(wins) | np.isnan(losses))
+    columns["wins"] = np.where(valid, wins, 0).astype(RANK_DTYPE)
+    columns["losses"] = np.where(valid, losses, 0).astype(RANK_DTYPE)
+
+    return pd.DataFrame(columns, columns=COLUMN_ORDER)
+
+
+def empty_team_results() -> pd.DataFrame:
+    """A season with no teams, in the same compact schema as a parsed one"""
+    dtypes = {name: RANK_DTYPE for name in (*INT_COLUMNS.values(), "wins", "losses")}
+    dtypes.update({name: RATING_DTYPE for name in FLOAT_COLUMNS.values()})
+    dtypes.update({"team": STRING_DTYPE, "record": STRING_DTYPE, "conf": CONF_DTYPE})
+    return pd.DataFrame({name: pd.Series(dtype=dtypes[name]) for name in COLUMN_ORDER})
+
+
+def _read(text: bytes, engine: str) -> Dict:
+    """Read the selected columns by position (numeric ones as float64) plus the split record"""
+    if engine == "pyarrow":
+        try:
+            return _read_arrow(text)
+        except (ImportError, ValueError):
+            # pyarrow missing, ragged rows or a non-numeric token: the C reader copes
+            pass
+
+    # Older files stop before the trailing columns (tempo); those read as blank
+    positions = [pos for pos in _POSITIONS if pos < _row_width(text)]
+    dtype = {pos: object for pos in STRING_COLUMNS}
+    dtype.update({pos: "float64" for pos in (*INT_COLUMNS, *FLOAT_COLUMNS) if pos in positions})
+    try:
+        raw = _read_csv(text, positions, dtype)
+    except ValueError:
+        # A stray non-numeric token in a numeric column; read everything as text and coerce
+        raw = _read_csv(text, positions, {pos: object for pos in positions})
+
+    columns = {}
+    for pos in _POSITIONS:
+        if pos not in positions:
+            columns[pos] = np.full(len(raw), np.nan)
+            continue
+        values = raw[pos].to_numpy()
+        if pos not in STRING_COLUMNS and values.dtype == object:
+            values = pd.to_numeric(pd.Series(values).str.strip(), errors="coerce").to_numpy("float64")
+        columns[pos] = values
+
+    record = pd.Series(columns[3], dtype=object).str.extract(RECORD_PATTERN)
+    columns["wins"] = record["wins"].to_numpy("float64", na_value=np.nan)
+    columns["losses"] = record["losses"].to_numpy("float64", na_value=np.nan)
+    return columns
+
+
+def _row_width(text: bytes) -> int:
+    """Number of fields in the first data row"""
+    lines = text.lstrip().split(b"\n", 2)
+    return lines[1].count(b",") + 1 if len(lines) > 1 else 0
+
+
+def _read_csv(text: bytes, positions: List[int], dtype: dict) -> pd.DataFrame:
+    return pd.read_csv(
+        io.BytesIO(text),
+        engine="c",
+        header=None,
+        skiprows=1,
+        usecols=positions,
+        dtype=dtype,
+        skip_blank_lines=True,
+    )
+
+
+def _read_arrow(text: bytes) -> Dict:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv
+
+    names = {pos: f"f{pos}" for pos in _POSITIONS}
+    types = {names[pos]: pa.string() if pos in STRING_COLUMNS else pa.float64() for pos in _POSITIONS}
+    table = csv.read_csv(
+        io.BytesIO(text),
+        read_options=csv.ReadOptions(skip_rows=1, autogenerate_column_names=True),
+        convert_options=csv.ConvertOptions(
+            include_columns=list(types), include_missing_columns=True, column_types=types
+        ),
+    )
+    columns = {pos: table.column(names[pos]).to_numpy(zero_copy_only=False) for pos in _POSITIONS}
+
+    record = pc.extract_regex(table.column(names[3]), RECORD_PATTERN)
+    for field in ("wins", "losses"):
+        values = pc.cast(pc.struct_field(record, field), pa.float64())
+        columns[field] = values.to_numpy(zero_copy_only=False)
+    return columns
@@ -0,0 +1,128 @@
+"""
+Lightweight row views over a season's compact columns.
+
+Single-team responses used to box a whole pandas Series per request with
+``df.iloc[i].to_dict()``. A TeamRow instead reads one position straight out of
+the season's columns, set up once per season version, and turns the compact
+storage types (float32, int16, categorical codes) back into plain Python
+values for JSON.
+"""
+import sys
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .team_results_parser import COLUMN_ORDER
+
+# Columns a response can be projected to with ``fields=``
+FIELDS = ["team_id", *COLUMN_ORDER]
+
+
+class SeasonColumns:
+    """Per-row access to a season's columns without copying the DataFrame"""
+
+    __slots__ = ("arrays", "labels", "strings", "length")
+
+    def __init__(self, df: pd.DataFrame):
+        self.length = len(df)
+        self.arrays: Dict[str, np.ndarray] = {}
+        self.labels: Dict[str, np.ndarray] = {}
+        self.strings: Dict[str, Any] = {}
+        # Numbers and categorical codes are views of the frame's buffers; team names are
+        # interned so every season shares one str per team; other text stays in the frame
+        for name in df.columns:
+            series = df[name]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # Trailing "" is what code -1 (missing) indexes
+                self.arrays[name] = series.cat.codes.to_numpy()
+                self.labels[name] = np.array([sys.intern(str(c)) for c in series.cat.categories] + [""], dtype=object)
+            elif series.dtype.kind in "fiub":
+                self.arrays[name] = series.to_numpy()
+            elif name == "team":
+                self.arrays[name] = np.array([sys.intern(str(v)) for v in series.to_numpy(object, na_value="")], dtype=object)
+            else:
+                self.strings[name] = series.array
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.arrays or name in self.strings
+
+    def value(self, name: str, row: int) -> Any:
+        if name in self.strings:
+            value = self.strings[name][row]
+            return value if isinstance(value, str) else ""
+        value = self.arrays[name][row]
+        if name in self.labels:
+            return self.labels[name][value]
+        return native(value)
+
+    def rows(self, positions: Sequence[int], team_ids: Sequence[str]) -> List["TeamRow"]:
+        return [TeamRow.at(self, row, team_ids[row]) for row in positions]
+
+    def column(self, name: str, positions: np.ndarray) -> List[Any]:
+        """One column's values at ``positions`` as Python values, gathered in one indexing step"""
+        if name in self.strings:
+            return [v if isinstance(v, str) else "" for v in self.strings[name].take(positions)]
+        values = self.arrays[name][positions]
+        if name in self.labels:
+            return self.labels[name][values].tolist()
+        if values.dtype.kind == "f":
+            # Upstream values have at most 4 decimals; rounding drops float32 widening noise
+            values = values.astype(np.float64).round(4)
+            if np.isnan(values).any():
+                # Blank upstream cells are unknown: null in JSON, empty in CSV
+                return [None if value != value else value for value in values.tolist()]
+        return values.tolist()
+
+    def project(self, positions: Sequence[int], fields: Sequence[str], team_ids: Sequence[str]) -> List[Dict[str, Any]]:
+        """Rows at ``positions`` restricted to ``fields``, gathered column by column"""
+        positions = np.asarray(positions, dtype=np.intp)
+        columns = []
+        for name in fields:
+            if name == "team_id":
+                columns.append([team_ids[row] for row in positions.tolist()])
+            elif name in self:
+                columns.append(self.column(name, positions))
+            else:
+                columns.append([None] * len(positions))
+        return [dict(zip(fields, values)) for values in zip(*columns)]
+
+
+class TeamRow:
+    """One team's season line; attributes mirror the parsed columns plus ``team_id``"""
+
+    __slots__ = ("team_id", *COLUMN_ORDER)
+
+    @classmethod
+    def at(cls, columns: SeasonColumns, row: int, team_id: str) -> "TeamRow":
+        view = cls.__new__(cls)
+        view.team_id = team_id
+        for name in COLUMN_ORDER:
+            setattr(view, name, columns.value(name, row) if name in columns else None)
+        return view
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return getattr(self, name, default) if name in self.__slots__ else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"TeamRow({self.team_id!r}, rank={self.rank})"
+
+
+def native(value: Any) -> Any:
+    """NumPy scalar -> Python value; float32 goes through its shortest repr so 0.9733 stays 0.9733
+    and NaN (a blank upstream cell) becomes None"""
+    if isinstance(value, np.floating):
+        if np.isnan(value):
+            return None
+        return float(str(value)) if value.dtype == np.float32 else float(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    return value
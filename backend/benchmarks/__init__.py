@@ -0,0 +1,5 @@
+"""
+Benchmarks and load checks for the backend, run from the backend directory:
+
+    python -m benchmarks.<name>
+"""
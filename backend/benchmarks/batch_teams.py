@@ -0,0 +1,45 @@
+"""
+Batch team lookup: a schedule's worth of teams fetched with one /teams/batch
+body against one /teams/{name} body per team, server side only. Every
+separate call also pays a network round trip that this does not measure.
+
+    python -m benchmarks.batch_teams [--teams 35] [--number 200]
+"""
+import argparse
+import timeit
+
+from app.services.barttorvik_service import BartTorvik
+from app.services.season_cache import SeasonEntry
+from app.services.team_results_parser import parse_team_results
+
+from .upstream import season_csv
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--teams", type=int, default=35, help="teams on the schedule")
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    service = BartTorvik()
+    entry = SeasonEntry(year=2025, data=parse_team_results(season_csv(2025)), fetched_at=0, content_hash="0" * 64)
+    service._prepare(entry)
+    names = service._teams(entry).names[::7][:args.teams]
+
+    def one_at_a_time():
+        # Distinct versions so each call builds its body, as the first visit to a page does
+        entry.derived.pop("responses", None)
+        return [service._team_json(entry, name).body for name in names]
+
+    def batch():
+        entry.derived.pop("responses", None)
+        return service._batch_json(entry, names).body
+
+    print(f"{len(names)} teams, uncached bodies")
+    for label, run in (("one /teams/{name} per team", one_at_a_time), ("one /teams/batch", batch)):
+        seconds = min(timeit.repeat(run, number=args.number, repeat=5)) / args.number
+        print(f"  {label:<28} {seconds * 1e6:8.1f}us  {len(names) if run is one_at_a_time else 1:3} requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Multi-season load and history benchmark.
+
+Cold-loads a range of seasons from a slow local stand-in upstream one at a
+time, concurrently with in-process parsing, and concurrently with the parse
+pool; then times a team's history from the cross-season index against
+filtering each season's DataFrame by name.
+
+    python -m benchmarks.bulk_load [--seasons 15] [--delay 0.1]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+import timeit
+
+from app.services import barttorvik_service
+from app.services.barttorvik_service import AsyncBartTorvik, BartTorvik
+from app.services.team_history import HISTORY_METRICS
+
+from .upstream import StandInUpstream
+
+TEAM = "Team 005"
+
+
+def sequential(upstream: StandInUpstream, years) -> float:
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        service = BartTorvik(snapshot_dir=snapshot_dir)
+        service.base_url = upstream.base_url
+        started = time.perf_counter()
+        for year in years:
+            service.get_season(year)
+        elapsed = time.perf_counter() - started
+        service.shutdown_parser()
+    return elapsed
+
+
+async def concurrent(upstream: StandInUpstream, years, processes: int) -> float:
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        service = AsyncBartTorvik(snapshot_dir=snapshot_dir, parse_processes=processes)
+        service.base_url = upstream.base_url
+        await service.startup()
+        pool = service._parser_pool()
+        if pool is not None:
+            # Start the worker processes up front; a backfill pays this once
+            list(pool.map(abs, range(processes)))
+        started = time.perf_counter()
+        seasons = await service.get_seasons(years)
+        elapsed = time.perf_counter() - started
+        assert len(seasons) == len(years)
+        await service.aclose()
+    return elapsed
+
+
+def scan_history(service: BartTorvik, years, name: str):
+    """What a history costs without the index: a name filter on every season"""
+    seasons = []
+    for year in years:
+        df = service.get_team_results(year)
+        match = df[df["team"] == name]
+        if not match.empty:
+            seasons.append({"year": year, **{m: match.iloc[0][m] for m in HISTORY_METRICS}})
+    return seasons
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seasons", type=int, default=15)
+    parser.add_argument("--delay", type=float, default=0.1, help="upstream latency per request, seconds")
+    args = parser.parse_args()
+
+    with StandInUpstream(delay=args.delay) as upstream:
+        years = list(range(2026 - args.seasons + 1, 2027))
+        processes = barttorvik_service.BULK_PARSE_PROCESSES
+        print(f"{len(years)} seasons, {args.delay * 1000:.0f} ms upstream latency, parse pool of {processes}")
+        print(f"  one at a time            {sequential(upstream, years):7.2f} s")
+        print(f"  concurrent, threads      {asyncio.run(concurrent(upstream, years, 0)):7.2f} s")
+        print(f"  concurrent, parse pool   {asyncio.run(concurrent(upstream, years, processes)):7.2f} s")
+
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            service = BartTorvik(snapshot_dir=snapshot_dir)
+            service.base_url = upstream.base_url
+            service.get_seasons(years)
+            service.get_team_history(TEAM, years[0], years[-1])
+            scan = min(timeit.repeat(lambda: scan_history(service, years, TEAM), number=20, repeat=5)) / 20
+            indexed = min(timeit.repeat(lambda: service.get_team_history(TEAM, years[0], years[-1]), number=20, repeat=5)) / 20
+            service.shutdown_parser()
+        print(f"  history, scan seasons    {scan * 1000:7.2f} ms")
+        print(f"  history, team index      {indexed * 1000:7.2f} ms   ({scan / indexed:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
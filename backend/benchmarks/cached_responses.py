@@ -0,0 +1,62 @@
+"""
+Response serialization benchmark: FastAPI's default path (jsonable_encoder and
+JSONResponse) for /teams/list, a team and a search, versus serving the bytes
+cached per season version, plus the size of a 304 against a full body.
+
+    python -m benchmarks.cached_responses [--number 500]
+"""
+import argparse
+import json
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.services.barttorvik_service import BartTorvik
+from app.services.season_cache import SeasonEntry
+from app.services.team_results_parser import parse_team_results
+
+from .upstream import season_csv
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args()
+
+    service = BartTorvik()
+    entry = SeasonEntry(year=2025, data=parse_team_results(season_csv(2025)), fetched_at=0, content_hash="0" * 64)
+    service._prepare(entry)
+
+    resources = {
+        "/teams/list": (
+            lambda: {"teams": service._available_teams(entry)},
+            lambda: service._available_teams_json(entry),
+        ),
+        "/teams/Illinois": (
+            lambda: {"team": service._team_by_name(entry, "Illinois")},
+            lambda: service._team_json(entry, "Illinois"),
+        ),
+        "/teams/search?query=st": (
+            lambda: {"teams": service._search(entry, "st")},
+            lambda: service._search_json(entry, "st"),
+        ),
+    }
+
+    print(f"{'resource':<24} {'default':>10} {'cached':>10} {'speedup':>8} {'body':>8}")
+    for name, (build, cached) in resources.items():
+        cached_body = cached().body
+        # Same document either way, only the encoding path differs
+        assert json.loads(cached_body) == json.loads(JSONResponse(jsonable_encoder(build())).body)
+
+        default = min(timeit.repeat(lambda: JSONResponse(jsonable_encoder(build())).body, number=args.number, repeat=5))
+        fast = min(timeit.repeat(lambda: cached().body, number=args.number, repeat=5))
+        print(
+            f"{name:<24} {default / args.number * 1e6:8.1f}us {fast / args.number * 1e6:8.1f}us "
+            f"{default / fast:7.0f}x {len(cached_body):7,}B"
+        )
+    print("a 304 for any of them carries no body, only the ETag and Cache-Control headers")
+
+
+if __name__ == "__main__":
+    main()
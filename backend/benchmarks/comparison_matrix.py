@@ -0,0 +1,52 @@
+"""
+Matchup matrix benchmark: one broadcast pass versus comparing every pair with
+the per-pair comparison the /teams/compare/{team1}/{team2} route uses.
+
+    python -m benchmarks.comparison_matrix [--teams 68] [--repeat 5]
+"""
+import argparse
+import itertools
+import timeit
+
+from app.services.barttorvik_service import BartTorvik
+from app.services.matchups import MetricMatrix
+from app.services.season_cache import SeasonEntry
+from app.services.team_results_parser import parse_team_results
+
+from .upstream import season_csv
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--teams", type=int, default=68, help="teams in the matrix (68 = a bracket)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    service = BartTorvik()
+    entry = SeasonEntry(year=2025, data=parse_team_results(season_csv(2025)), fetched_at=0)
+    rows = list(range(min(args.teams, len(entry.data))))
+    pairs = list(itertools.combinations(rows, 2))
+
+    def pairwise():
+        for i, j in pairs:
+            service._generate_comparison(service._team_row(entry, i), service._team_row(entry, j))
+
+    def broadcast():
+        # A fresh matrix each time so the per-version result cache is not what gets timed
+        MetricMatrix(entry.data).compare(rows)
+
+    matrix = service._matrix(entry)
+    matrix.compare(rows)
+
+    loop = min(timeit.repeat(pairwise, number=1, repeat=args.repeat))
+    vectorized = min(timeit.repeat(broadcast, number=1, repeat=args.repeat))
+    cached = min(timeit.repeat(lambda: matrix.compare(rows), number=100, repeat=args.repeat)) / 100
+
+    print(f"{len(rows)} teams, {len(pairs):,} pairs, {len(matrix.metrics)} metrics")
+    print(f"  pairwise loop  {loop * 1000:9.2f} ms")
+    print(f"  broadcast      {vectorized * 1000:9.2f} ms   ({loop / vectorized:.0f}x)")
+    print(f"  cached         {cached * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
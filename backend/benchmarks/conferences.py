@@ -0,0 +1,52 @@
+"""
+Conference aggregates: the per-request pandas filter and reductions the demo
+dashboard ran for one conference, against building every conference's
+aggregates once per season version and serving the cached body.
+
+    python -m benchmarks.conferences [--conf B10] [--number 200]
+"""
+import argparse
+import timeit
+
+from app.services.barttorvik_service import BartTorvik
+from app.services.conferences import ConferenceTable
+from app.services.season_cache import SeasonEntry
+from app.services.team_results_parser import parse_team_results
+
+from .upstream import season_csv
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--conf", default="B10")
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    service = BartTorvik()
+    entry = SeasonEntry(year=2025, data=parse_team_results(season_csv(2025)), fetched_at=0, content_hash="0" * 64)
+    service._prepare(entry)
+    df, ids = entry.data, service._teams(entry).ids
+
+    def per_request():
+        conf_df = df[df["conf"] == args.conf]
+        return {
+            "barthag": conf_df["barthag"].mean(),
+            "adjoe": conf_df["adjoe"].mean(),
+            "adjde": conf_df["adjde"].mean(),
+            "wins": conf_df["wins"].sum(),
+            "top": conf_df.nlargest(10, "barthag")[["rank", "team", "barthag", "adjoe", "adjde", "record"]].to_dict("records"),
+        }
+
+    cases = {
+        "pandas, one conference": per_request,
+        "ConferenceTable, every conference": lambda: ConferenceTable(df, ids),
+        "cached /conferences/{conf} body": lambda: service._conference_json(entry, args.conf).body,
+    }
+    for name, run in cases.items():
+        number = args.number if "cached" not in name else args.number * 100
+        seconds = min(timeit.repeat(run, number=number, repeat=5)) / number
+        print(f"{name:<36} {seconds * 1e6:10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
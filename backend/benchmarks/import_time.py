@@ -0,0 +1,99 @@
+"""
+Cold-start budget for the API process.
+
+Imports ``app.main`` and runs the lifespan up to the point the server starts
+answering requests, in fresh interpreters under ``python -X importtime``. Fails
+if the fastest run exceeds the budget, and fails if any data-path module
+(pandas, numpy, pyarrow, the HTTP clients) has been imported by then: those
+belong to the first data request or the background warmup, not to startup.
+``tests/test_import_time.py`` runs the same checks under pytest.
+
+    python -m benchmarks.import_time [--budget-ms 750] [--runs 5] [--top 10]
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+MODULE = "app.main"
+
+BUDGET_MS = 750
+
+# Top-level packages that must not load before the app can answer /health
+DEFERRED = ("pandas", "numpy", "pyarrow", "httpx", "requests")
+
+# Import the app and enter its lifespan. The scheduler's task is not started: it
+# imports the data path on a worker thread by design, after startup
+STARTUP = f"""
+import asyncio, json, sys, time
+started = time.perf_counter()
+import {MODULE} as main
+from app.services.refresh_scheduler import RefreshScheduler
+RefreshScheduler.start = lambda self: None
+
+async def serve():
+    async with main.lifespan(main.app):
+        return (time.perf_counter() - started) * 1000
+
+startup_ms = asyncio.run(serve())
+print(json.dumps({{"startup_ms": startup_ms, "modules": sorted(sys.modules)}}))
+"""
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def startup_profile() -> Tuple[float, List[str], Dict[str, int]]:
+    """``(startup ms, modules loaded, cumulative import us per module)`` for one cold start"""
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP],
+        cwd=backend,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2))
+    return report["startup_ms"], report["modules"], cumulative
+
+
+def deferred_loaded(modules: List[str]) -> List[str]:
+    """Data-path packages among ``modules``"""
+    return sorted({module.split(".")[0] for module in modules} & set(DEFERRED))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters; the fastest counts")
+    parser.add_argument("--top", type=int, default=10, help="slowest top-level imports to list")
+    args = parser.parse_args()
+
+    startup_ms, modules, cumulative = min((startup_profile() for _ in range(args.runs)), key=lambda run: run[0])
+
+    print(f"{MODULE} import and lifespan: {startup_ms:.0f} ms (fastest of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    packages = {module: total for module, total in cumulative.items() if "." not in module}
+    for module, total in sorted(packages.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {total / 1000:8.1f} ms  {module}")
+
+    failures = []
+    if startup_ms > args.budget_ms:
+        failures.append(f"startup took {startup_ms:.0f} ms, over the {args.budget_ms:.0f} ms budget")
+    loaded = deferred_loaded(modules)
+    if loaded:
+        failures.append(f"imported at startup but should load on first use: {', '.join(loaded)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
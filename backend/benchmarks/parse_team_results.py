@@ -0,0 +1,109 @@
+"""
+Parser benchmark: the previous per-cell loop versus the column-wise parser.
+
+Pass a recorded season file to benchmark real data; without one a synthetic
+season in the upstream layout is used (``--teams`` scales it up to see how
+both parsers grow with row count).
+
+    python -m benchmarks.parse_team_results [--csv 2025_team_results.csv] [--teams 364] [--repeat 50]
+"""
+import argparse
+import timeit
+
+import pandas as pd
+
+from app.services.team_results_parser import parse_team_results
+
+from .upstream import season_csv
+
+
+def legacy_parse_team_results(text: str) -> pd.DataFrame:
+    """The string-splitting parser that BartTorvik.get_team_results used before"""
+    # Parse CSV manually to handle column alignment issues
+    lines = text.strip().split('\n')
+    data_rows = []
+
+    for line in lines[1:]:  # Skip header
+        if line.strip():
+            cols = line.split(',')
+            if len(cols) >= 44:  # Ensure we have enough columns
+                # Map the correct columns based on our analysis
+                row = {
+                    'rank': int(cols[0]) if cols[0].isdigit() else 999,
+                    'team': cols[1],
+                    'conf': cols[2], 
+                    'record': cols[3],
+                    'adjoe': float(cols[4]) if cols[4].replace('.','').replace('-','').isdigit() else 0.0,
+                    'oe_rank': int(cols[5]) if cols[5].replace('.','').isdigit() else 999,
+                    'adjde': float(cols[6]) if cols[6].replace('.','').replace('-','').isdigit() else 0.0,
+                    'de_rank': int(cols[7]) if cols[7].replace('.','').isdigit() else 999,
+                    'barthag': float(cols[8]) if cols[8].replace('.','').replace('-','').isdigit() else 0.0,
+                    'sos': float(cols[15]) if len(cols) > 15 and cols[15].replace('.','').replace('-','').isdigit() else 0.0,
+                    'ncsos': float(cols[16]) if len(cols) > 16 and cols[16].replace('.','').replace('-','').isdigit() else 0.0,
+                    'WAB': float(cols[41]) if len(cols) > 41 and cols[41].replace('.','').replace('-','').isdigit() else 0.0,
+                }
+
+                # Parse wins and losses from record
+                if '-' in row['record']:
+                    try:
+                        wins, losses = row['record'].split('-')
+                        row['wins'] = int(wins)
+                        row['losses'] = int(losses)
+                    except:
+                        row['wins'] = 0
+                        row['losses'] = 0
+                else:
+                    row['wins'] = 0
+                    row['losses'] = 0
+
+                data_rows.append(row)
+
+    df = pd.DataFrame(data_rows)
+    return df
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--csv", help="recorded {year}_team_results.csv")
+    parser.add_argument("--teams", type=int, default=364, help="rows in the synthetic season")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.csv:
+        with open(args.csv, encoding="utf-8") as f:
+            text = f.read()
+        source = args.csv
+    else:
+        text = season_csv(2025, teams=args.teams)
+        source = "synthetic 2025 season"
+
+    legacy = legacy_parse_team_results(text)
+    vectorized = parse_team_results(text)
+    print(f"{source}: {len(vectorized)} teams, {len(text):,} bytes")
+
+    # Same columns (plus any the old parser did not read), and the same values wherever
+    # it understood the cell; the new parser stores them compactly (categorical conf, float32, int16)
+    assert list(vectorized.columns[:len(legacy.columns)]) == list(legacy.columns), (legacy.columns, vectorized.columns)
+    pd.testing.assert_frame_equal(
+        legacy.reset_index(drop=True),
+        vectorized[legacy.columns].astype({"conf": str}).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+    timings = {}
+    for name, fn in (("legacy loop", legacy_parse_team_results), ("column-wise", parse_team_results)):
+        best = min(timeit.repeat(lambda: fn(text), number=1, repeat=args.repeat))
+        timings[name] = best
+        print(f"  {name:<12} {best * 1000:8.2f} ms")
+    print(f"  speedup      {timings['legacy loop'] / timings['column-wise']:8.1f}x")
+
+    tricky = text.splitlines()[0] + "\n" + ",".join(
+        ["1", "Test", "B10", "20-5", "1.2e2", "1", "-98.5", "1", "9.5e-01"] + ["0"] * 36
+    )
+    print("  negative / scientific cells:")
+    print("    legacy     ", legacy_parse_team_results(tricky)[["adjoe", "adjde", "barthag"]].iloc[0].tolist())
+    print("    column-wise", [float(str(v)) for v in parse_team_results(tricky)[["adjoe", "adjde", "barthag"]].to_numpy()[0]])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Prediction engine benchmark: building every pair's win probability, score and
+tempo as matrices versus predicting each pair with scalar arithmetic, plus what
+a served prediction costs once the matrices exist.
+
+    python -m benchmarks.predictions [--repeat 5]
+"""
+import argparse
+import timeit
+
+from app.services.predictions import DEFAULT_TEMPO, MatchupPredictor
+from app.services.team_results_parser import parse_team_results
+
+from .upstream import season_csv
+
+
+def scalar_predictions(df) -> dict:
+    """Every ordered pair predicted one at a time, as a per-request implementation would"""
+    records = df[["adjoe", "adjde", "barthag", "adjt"]].astype("float64").to_dict("records")
+    average_tempo = df["adjt"].mean() if len(df) else DEFAULT_TEMPO
+    average_efficiency = (df["adjoe"].mean() + df["adjde"].mean()) / 2
+    results = {}
+    for i, team in enumerate(records):
+        for j, opponent in enumerate(records):
+            tempo = team["adjt"] * opponent["adjt"] / average_tempo
+            a, b = team["barthag"], opponent["barthag"]
+            results[i, j] = (
+                a * (1 - b) / (a * (1 - b) + b * (1 - a)),
+                tempo * team["adjoe"] * opponent["adjde"] / average_efficiency / 100,
+                tempo,
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = parse_team_results(season_csv(2025))
+    predictor = MatchupPredictor(df)
+
+    loop = min(timeit.repeat(lambda: scalar_predictions(df), number=1, repeat=args.repeat))
+    matrices = min(timeit.repeat(lambda: MatchupPredictor(df), number=1, repeat=args.repeat))
+    one_team = min(timeit.repeat(lambda: predictor.predict(0), number=100, repeat=args.repeat)) / 100
+    one_game = min(timeit.repeat(lambda: predictor.predict(0, [1], "home"), number=100, repeat=args.repeat)) / 100
+
+    print(f"{len(df)} teams, {len(df) ** 2:,} ordered pairs")
+    print(f"  scalar loop      {loop * 1000:9.2f} ms")
+    print(f"  matrices         {matrices * 1000:9.2f} ms   ({loop / matrices:.0f}x)")
+    print(f"  one team vs all  {one_team * 1e6:9.1f} us")
+    print(f"  one game (home)  {one_game * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Bytes on the wire and build time for team responses: every column versus a
+``fields=`` projection, uncompressed versus gzip and brotli, and projecting on
+the columns versus filtering full row dicts afterwards.
+
+    python -m benchmarks.response_size [--fields team_id,team,conf,record,barthag] [--query st]
+"""
+import argparse
+import timeit
+
+from app.services.barttorvik_service import BartTorvik
+from app.services.response_cache import brotli, compress, dumps
+from app.services.season_cache import SeasonEntry
+from app.services.team_results_parser import parse_team_results
+from app.services.team_rows import TeamRow
+
+from .upstream import season_csv
+
+
+def wire_sizes(body: bytes) -> str:
+    sizes = [f"{len(body):8,}", f"{len(compress(body, 'gzip')):8,}"]
+    sizes.append(f"{len(compress(body, 'br')):8,}" if brotli is not None else f"{'-':>8}")
+    return " ".join(sizes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fields", default="team_id,team,conf,record,barthag")
+    parser.add_argument("--query", default="st", help="search whose results are measured")
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+    fields = args.fields.split(",")
+
+    service = BartTorvik()
+    entry = SeasonEntry(year=2025, data=parse_team_results(season_csv(2025)), fetched_at=0, content_hash="0" * 64)
+    service._prepare(entry)
+    columns, teams = service._columns(entry), service._teams(entry)
+
+    cases = {
+        f"search '{args.query}'": teams.search(args.query),
+        "all teams": list(range(len(entry.data))),
+    }
+    print(f"{'':<34} {'raw':>8} {'gzip':>8} {'br':>8}  {'build':>9}")
+    for name, rows in cases.items():
+        def full():
+            return dumps([TeamRow.at(columns, row, teams.ids[row]).to_dict() for row in rows])
+
+        def filtered():
+            return dumps([{f: d[f] for f in fields} for d in (TeamRow.at(columns, row, teams.ids[row]).to_dict() for row in rows)])
+
+        def projected():
+            return dumps(columns.project(rows, fields, teams.ids))
+
+        assert filtered() == projected()
+        print(f"{name} ({len(rows)} teams)")
+        for label, build in (("every column", full), ("fields, filtered dicts", filtered), ("fields, column projection", projected)):
+            seconds = min(timeit.repeat(build, number=args.number, repeat=5)) / args.number
+            print(f"  {label:<32} {wire_sizes(build())}  {seconds * 1e6:7.1f}us")
+
+
+if __name__ == "__main__":
+    main()
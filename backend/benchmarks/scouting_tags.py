@@ -0,0 +1,51 @@
+"""
+Scouting tags: the dashboard's per-team if/else chains run over every team in
+a season, against evaluating the rule table as vectorized masks once per
+season version and reading one team's tags.
+
+    python -m benchmarks.scouting_tags [--number 200]
+"""
+import argparse
+import timeit
+
+from app.services.barttorvik_service import BartTorvik
+from app.services.scouting import ScoutingTags
+from app.services.season_cache import SeasonEntry
+from app.services.team_results_parser import parse_team_results
+
+from .upstream import season_csv
+
+
+def chains(team):
+    adjoe, adjde = team["adjoe"], team["adjde"]
+    offense = "strong" if adjoe > 120 else "average" if adjoe > 110 else "weak"
+    defense = "elite" if adjde < 95 else "solid" if adjde < 105 else "weak"
+    tempo = "high" if adjoe > 120 and adjde > 105 else "slow" if adjoe < 110 and adjde < 95 else "balanced"
+    return offense, defense, tempo
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    service = BartTorvik()
+    entry = SeasonEntry(year=2025, data=parse_team_results(season_csv(2025)), fetched_at=0, content_hash="0" * 64)
+    service._prepare(entry)
+    df = entry.data
+    columns, percentiles = service._columns(entry), service._percentiles(entry)
+    tags = service._tags(entry)
+
+    cases = {
+        "if/else chains, every team": lambda: [chains(team) for team in df.to_dict("records")],
+        "ScoutingTags, every team": lambda: ScoutingTags(columns, percentiles),
+        "cached tags, one team": lambda: tags.tags(0),
+    }
+    for name, run in cases.items():
+        number = args.number if "cached" not in name else args.number * 100
+        seconds = min(timeit.repeat(run, number=number, repeat=5)) / number
+        print(f"{name:<36} {seconds * 1e6:10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Season export benchmark: streaming a season in ``EXPORT_CHUNK_ROWS`` chunks
+versus building one JSON body from every row first, by time and by the
+largest single buffer each path holds.
+
+    python -m benchmarks.season_export [--seasons 5] [--format csv]
+"""
+import argparse
+import time
+
+from app.services.barttorvik_service import BartTorvik
+from app.services.exports import export_chunks
+from app.services.response_cache import dumps
+from app.services.season_cache import SeasonEntry
+from app.services.team_results_parser import parse_team_results
+from app.services.team_rows import FIELDS
+
+from .upstream import season_csv
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seasons", type=int, default=5)
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson", help="streamed format")
+    args = parser.parse_args()
+
+    service = BartTorvik()
+    seasons = []
+    for year in range(2025 - args.seasons + 1, 2026):
+        entry = SeasonEntry(year=year, data=parse_team_results(season_csv(year)), fetched_at=0, content_hash="0" * 64)
+        service._prepare(entry)
+        seasons.append((year, service._columns(entry), service._teams(entry).ids))
+
+    started = time.perf_counter()
+    chunks = [len(chunk) for chunk in export_chunks(seasons, FIELDS, args.format)]
+    streamed = time.perf_counter() - started
+
+    # One body built from every row at once, the way a JSONResponse would
+    started = time.perf_counter()
+    whole = dumps([
+        {"season": year, **row}
+        for year, columns, team_ids in seasons
+        for row in columns.project(range(len(columns)), FIELDS, team_ids)
+    ])
+    buffered = time.perf_counter() - started
+
+    rows = sum(len(columns) for _, columns, _ in seasons)
+    print(f"{args.seasons} seasons, {rows:,} rows, {args.format}, {sum(chunks):,} bytes")
+    print(f"  streamed  {streamed * 1e3:7.1f} ms  largest buffer {max(chunks):10,} B ({len(chunks)} chunks)")
+    print(f"  one body  {buffered * 1e3:7.1f} ms  largest buffer {len(whole):10,} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Loading seasons into pandas: one Arrow IPC or Parquet file per season versus
+one JSON team response per team rebuilt into a DataFrame, as the analysts'
+notebooks did. Measures the client side only (no network) plus the one-off
+encode the server does per season version.
+
+    python -m benchmarks.season_files [--seasons 10]
+"""
+import argparse
+import json
+import time
+
+import pandas as pd
+
+from app.client import read_season_file
+from app.services.barttorvik_service import BartTorvik
+from app.services.season_cache import SeasonEntry
+from app.services.team_results_parser import parse_team_results
+
+from .upstream import season_csv
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seasons", type=int, default=10)
+    args = parser.parse_args()
+
+    service = BartTorvik()
+    entries = []
+    for year in range(2025 - args.seasons + 1, 2026):
+        entry = SeasonEntry(year=year, data=parse_team_results(season_csv(year)), fetched_at=0, content_hash="0" * 64)
+        service._prepare(entry)
+        entries.append(entry)
+    teams = sum(len(entry.data) for entry in entries)
+
+    json_bodies = [
+        [service._team_json(entry, team_id).body for team_id in service._teams(entry).ids]
+        for entry in entries
+    ]
+    started = time.perf_counter()
+    frames = [pd.DataFrame([json.loads(body)["team"] for body in bodies]) for bodies in json_bodies]
+    json_seconds = time.perf_counter() - started
+    print(f"{args.seasons} seasons, {teams:,} teams")
+    print(f"  {'json, one call per team':<28} {json_seconds * 1e3:8.1f} ms  {teams:6,} bodies {sum(map(len, sum(json_bodies, []))):10,} B")
+
+    for fmt in ("arrow", "parquet"):
+        started = time.perf_counter()
+        bodies = [service._season_file(entry, fmt).body for entry in entries]
+        encode_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        frames = [read_season_file(body, fmt) for body in bodies]
+        read_seconds = time.perf_counter() - started
+        assert sum(map(len, frames)) == teams
+        print(
+            f"  {fmt + ', one file per season':<28} {read_seconds * 1e3:8.1f} ms  {len(bodies):6,} bodies "
+            f"{sum(map(len, bodies)):10,} B  (server encode {encode_seconds / len(bodies) * 1e3:.1f} ms/season, once per version)"
+        )
+
+
+if __name__ == "__main__":
+    main()
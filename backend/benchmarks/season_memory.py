@@ -0,0 +1,92 @@
+"""
+Bytes per resident season: the previous object/64-bit layout versus the
+compact one (categorical conf, float32 ratings, int16 ranks), plus what
+a single-team response costs to materialize from each.
+
+Pass a recorded season file to measure real data; without one a synthetic
+season in the upstream layout is used.
+
+    python -m benchmarks.season_memory [--csv 2025_team_results.csv] [--seasons 10]
+"""
+import argparse
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from app.services.team_results_parser import STRING_DTYPE, parse_team_results
+from app.services.team_rows import SeasonColumns, TeamRow
+
+from .parse_team_results import legacy_parse_team_results
+from .upstream import season_csv
+
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True, index=False).sum())
+
+
+def row_view_bytes(columns: SeasonColumns, df: pd.DataFrame):
+    """``(per season, shared)``: buffers the row views add beyond the frame's, and the interned strings"""
+    shared = [df[name].to_numpy() for name in df.columns if df[name].dtype.kind in "fiub"]
+    own, strings = 0, {}
+    for values in (*columns.arrays.values(), *columns.labels.values()):
+        if not any(np.shares_memory(values, buffer) for buffer in shared):
+            own += values.nbytes
+        if values.dtype == object:
+            strings.update((id(v), sys.getsizeof(v)) for v in values)
+    return own, sum(strings.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--csv", help="recorded {year}_team_results.csv")
+    parser.add_argument("--seasons", type=int, default=10, help="seasons kept resident")
+    args = parser.parse_args()
+
+    if args.csv:
+        with open(args.csv, encoding="utf-8") as f:
+            text = f.read()
+        source = args.csv
+    else:
+        text = season_csv(2025)
+        source = "synthetic 2025 season"
+
+    legacy = legacy_parse_team_results(text)
+    # What the original parser held: Python str objects and 64-bit numbers
+    text_columns = ("team", "conf", "record")
+    legacy_object = legacy.astype(dict.fromkeys(text_columns, object))
+    legacy_arrow = legacy.astype(dict.fromkeys(text_columns, STRING_DTYPE))
+    compact = parse_team_results(text)
+    columns = SeasonColumns(compact)
+
+    layouts = {
+        "object strings, 64-bit": legacy_object,
+        "arrow strings, 64-bit": legacy_arrow,
+        "compact": compact,
+    }
+    print(f"{source}: {len(compact)} teams")
+    print(f"  {'layout':<24} {'bytes/season':>13} {f'x{args.seasons} seasons':>14}")
+    for name, df in layouts.items():
+        size = frame_bytes(df)
+        print(f"  {name:<24} {size:13,} {size * args.seasons:14,}")
+    own, shared = row_view_bytes(columns, compact)
+    print(f"  {'+ row views':<24} {own:13,} {own * args.seasons:14,}")
+    print(f"  {'+ interned names':<24} {shared:13,} {shared:14,}   (one copy for all seasons)")
+
+    print("  per column (object -> compact):")
+    before = legacy_object.memory_usage(deep=True, index=False)
+    after = compact.memory_usage(deep=True, index=False)
+    # The legacy parser predates the adjt column
+    for name in [name for name in compact.columns if name in legacy_object]:
+        print(f"    {name:<8} {str(legacy_object[name].dtype):>8} {before[name]:7,} -> {str(compact[name].dtype):>8} {after[name]:7,}")
+
+    row = 0
+    number = 2000
+    iloc = min(timeit.repeat(lambda: compact.iloc[row].to_dict(), number=number, repeat=5)) / number
+    view = min(timeit.repeat(lambda: TeamRow.at(columns, row, "x").to_dict(), number=number, repeat=5)) / number
+    print(f"  one team as a dict: iloc().to_dict() {iloc * 1e6:.1f} us, TeamRow {view * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
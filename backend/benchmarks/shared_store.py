@@ -0,0 +1,87 @@
+"""
+Multi-worker check for the shared season store.
+
+Starts several worker processes against one snapshot directory, as uvicorn or
+gunicorn would with ``--workers``, and verifies that a cold start downloads the
+season once for all of them, and that a refresh written by a separate refresher
+process reaches every worker without any of them going upstream.
+
+    python -m benchmarks.shared_store [--workers 4]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import sys
+import tempfile
+
+from .upstream import StandInUpstream
+
+YEAR = 2026
+
+
+def worker(base_url: str, snapshot_dir: str, start, refreshed, results) -> None:
+    from app.services.barttorvik_service import AsyncBartTorvik
+
+    async def run():
+        service = AsyncBartTorvik(snapshot_dir=snapshot_dir)
+        service.base_url = base_url
+        await service.startup()
+        try:
+            start.wait()
+            cold = await service.get_season(YEAR)
+            results.put(("cold", cold.version))
+
+            refreshed.wait()
+            await service._sync_from_store_async(YEAR, force=True)
+            results.put(("refreshed", (await service.get_season(YEAR)).version))
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    from app.services.barttorvik_service import BartTorvik
+
+    path = f"/{YEAR}_team_results.csv"
+    ctx = multiprocessing.get_context("spawn")
+    start, refreshed, results = ctx.Event(), ctx.Event(), ctx.Queue()
+
+    with StandInUpstream(delay=0.5) as upstream, tempfile.TemporaryDirectory() as snapshot_dir:
+        workers = [
+            ctx.Process(target=worker, args=(upstream.base_url, snapshot_dir, start, refreshed, results))
+            for _ in range(args.workers)
+        ]
+        for process in workers:
+            process.start()
+
+        start.set()
+        cold = [results.get(timeout=60)[1] for _ in workers]
+        cold_hits = upstream.hits[path]
+
+        # The ratings move upstream; one refresher process picks them up for everyone
+        upstream.revisions[YEAR] += 1
+        refresher = BartTorvik(snapshot_dir=snapshot_dir)
+        refresher.base_url = upstream.base_url
+        latest = refresher.refresh_season(YEAR).version
+        refresh_hits = upstream.hits[path] - cold_hits
+
+        refreshed.set()
+        after = [results.get(timeout=60)[1] for _ in workers]
+        for process in workers:
+            process.join()
+
+    print(f"cold start: {args.workers} workers, {cold_hits} upstream hit(s), versions {sorted(set(cold))}")
+    print(f"refresh:    {refresh_hits} upstream hit(s), workers now on {sorted(set(after))} (latest {latest})")
+
+    ok = cold_hits == 1 and len(set(cold)) == 1 and refresh_hits == 1 and set(after) == {latest}
+    print("OK" if ok else "FAILED: workers did not share the season store")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Filtered and sorted team queries: pandas (boolean indexing, sort_values, head,
+to_dict) against the cached per-column sort orders and a boolean mask over
+the season's arrays, for a top-k, a range query and a two-key sort.
+
+    python -m benchmarks.team_query [--number 2000]
+"""
+import argparse
+import timeit
+
+from app.services.barttorvik_service import BartTorvik
+from app.services.season_cache import SeasonEntry
+from app.services.team_query import parse_query
+from app.services.team_results_parser import parse_team_results
+
+from .upstream import season_csv
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    service = BartTorvik()
+    entry = SeasonEntry(year=2025, data=parse_team_results(season_csv(2025)), fetched_at=0, content_hash="0" * 64)
+    service._prepare(entry)
+    df, orders, ids = entry.data, service._orders(entry), service._teams(entry).ids
+    fields = ["team", "conf", "adjoe", "barthag"]
+
+    cases = {
+        "top 10 by barthag": (
+            lambda: df.sort_values("barthag", ascending=False, kind="stable").head(10)[fields].to_dict("records"),
+            parse_query({}, "-barthag", 10),
+        ),
+        "B10, adjoe > 110": (
+            lambda: df[(df["conf"] == "B10") & (df["adjoe"] > 110)].sort_values("rank").head(50)[fields].to_dict("records"),
+            parse_query({"conf": "B10", "adjoe_gt": "110"}),
+        ),
+        "conf, then -barthag": (
+            lambda: df.sort_values(["conf", "barthag"], ascending=[True, False], kind="stable").head(50)[fields].to_dict("records"),
+            parse_query({}, "conf,-barthag"),
+        ),
+    }
+
+    print(f"{'query':<22} {'pandas':>10} {'orders':>10} {'speedup':>8}")
+    for name, (frame, query) in cases.items():
+        def cached():
+            return orders.run(query, fields, ids)["teams"]
+
+        assert [row["team"] for row in cached()] == [row["team"] for row in frame()]
+        slow = min(timeit.repeat(frame, number=args.number // 10, repeat=5)) / (args.number // 10)
+        fast = min(timeit.repeat(cached, number=args.number, repeat=5)) / args.number
+        print(f"{name:<22} {slow * 1e6:8.1f}us {fast * 1e6:8.1f}us {slow / fast:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
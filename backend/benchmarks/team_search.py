@@ -0,0 +1,76 @@
+"""
+Team-name lookup benchmark: the previous ``str.contains`` scan versus the
+prebuilt TeamNameIndex.
+
+Times one lookup per query shape (exact, prefix, word prefix, substring, miss)
+on a synthetic season, plus the one-off cost of building the index. ``--teams``
+scales the season up to show how each approach grows with row count.
+
+    python -m benchmarks.team_search [--teams 364] [--repeat 2000]
+"""
+import argparse
+import timeit
+
+from app.services.team_index import TeamNameIndex
+from app.services.team_results_parser import parse_team_results
+
+from .upstream import season_csv
+
+QUERIES = {
+    "exact": "Illinois",
+    "prefix": "Michigan St",
+    "word prefix": "Carolina",
+    "substring": "ansa",
+    "miss": "Gonzaga Tech",
+    "punctuation": "St. John's",
+}
+
+
+def _per_call(fn, repeat: int) -> float:
+    number = max(1, repeat // 10)
+    return min(timeit.repeat(fn, number=number, repeat=10)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--teams", type=int, default=364, help="rows in the synthetic season")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    df = parse_team_results(season_csv(2025, teams=args.teams))
+    teams = df["team"]
+
+    build = min(timeit.repeat(lambda: TeamNameIndex(teams), number=1, repeat=20))
+    index = TeamNameIndex(teams)
+    print(f"synthetic 2025 season: {len(df)} teams, index built in {build * 1000:.2f} ms")
+    print(f"  {'query':<26} {'str.contains':>13} {'index':>10} {'+ rows':>10} {'speedup':>8}   best match (old -> new)")
+
+    for shape, query in QUERIES.items():
+        def scan():
+            return df[teams.str.contains(query, case=False, na=False)]
+
+        def lookup():
+            return df.iloc[index.search(query)]
+
+        old = _per_call(scan, args.repeat)
+        search = _per_call(lambda: index.search(query), args.repeat)
+        new = _per_call(lookup, args.repeat)
+        old_best = scan()["team"].head(1).tolist()
+        new_best = lookup()["team"].head(1).tolist()
+        label = f"{shape} ({query!r})"
+        print(
+            f"  {label:<26} {old * 1e6:10.1f} us {search * 1e6:7.1f} us {new * 1e6:7.1f} us {old / new:7.1f}x"
+            f"   {old_best or '-'} -> {new_best or '-'}"
+        )
+
+    # A regex metacharacter in a query made the old scan raise
+    try:
+        teams.str.contains("Texas A&M (", case=False, na=False)
+        verdict = "no error"
+    except Exception as e:
+        verdict = f"{type(e).__name__}: {e}"
+    print(f"  'Texas A&M (' -> str.contains: {verdict}; index: {df['team'].iloc[index.search('Texas A&M (')].tolist()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Local stand-in for barttorvik.com used by the benchmarks.
+
+Serves ``/{year}_team_results.csv`` in the upstream column layout, answers
+conditional requests with 304 like a static file server, and counts how many
+times each season is downloaded.
+"""
+import hashlib
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+HEADER = (
+    "rank,team,conf,record,adjoe,oe Rank,adjde,de Rank,barthag,rank,proj. W,Proj. L,"
+    "Pro Con W,Pro Con L,Con Rec.,sos,ncsos,consos,Proj. SOS,Proj. Noncon SOS,"
+    "Proj. Con SOS,elite SOS,elite noncon SOS,Opp OE,Opp DE,Opp Proj. OE,Opp Proj DE,"
+    "Con Adj OE,Con Adj DE,Qual O,Qual D,Qual Barthag,Qual Games,FUN,ConPF,ConPA,"
+    "ConPoss,ConOE,ConDE,ConSOSRemain,Conf Win%,WAB,WAB Rk,Fun Rk,adjt"
+)
+
+CONFERENCES = ["B10", "B12", "SEC", "ACC", "BE", "MWC", "WCC", "A10", "Amer", "MVC", "CUSA", "Ivy"]
+
+KNOWN_TEAMS = [
+    "Illinois", "Illinois Chicago", "Illinois St.", "Duke", "Houston", "Purdue",
+    "Purdue Fort Wayne", "Michigan", "Michigan St.", "Connecticut", "Miami FL", "Miami OH",
+    "Kentucky", "Kansas", "Kansas St.", "North Carolina", "North Carolina St.", "Gonzaga",
+    "St. John's", "Saint Mary's", "Texas A&M", "Loyola Chicago", "Northwestern", "Iowa",
+]
+
+
+def season_csv(year: int, teams: int = 364, seed: Optional[int] = None, tempo: bool = True) -> str:
+    """Synthesize a season file with the same shape as the real one; without ``tempo``
+    it stops before the adjt column, like the files of older seasons"""
+    rng = random.Random(year if seed is None else seed)
+    names = KNOWN_TEAMS + [f"Team {i:03d}" for i in range(teams - len(KNOWN_TEAMS))]
+    lines = [HEADER if tempo else HEADER.rsplit(",", 1)[0]]
+
+    for i, name in enumerate(names[:teams]):
+        wins, losses = rng.randint(4, 32), rng.randint(2, 25)
+        cols = [
+            str(i + 1), name, rng.choice(CONFERENCES), f"{wins}-{losses}",
+            f"{rng.uniform(92, 128):.1f}", str(rng.randint(1, teams)),
+            f"{rng.uniform(86, 118):.1f}", str(rng.randint(1, teams)),
+            f"{rng.random():.4f}",
+        ]
+        cols += [f"{rng.uniform(-12, 12):.3f}" for _ in range(44 - len(cols))]
+        if tempo:
+            cols.append(f"{rng.uniform(60, 75):.1f}")
+        lines.append(",".join(cols))
+
+    return "\n".join(lines) + "\n"
+
+
+class StandInUpstream:
+    """Threaded HTTP server that serves synthetic seasons and counts hits per path"""
+
+    def __init__(self, delay: float = 0.0, teams: int = 364, status: int = 200, tempo: bool = True):
+        self.delay = delay
+        self.teams = teams
+        self.status = status
+        # False serves seasons without the adjt column
+        self.tempo = tempo
+        self.hits = Counter()
+        self.not_modified = Counter()
+        # Bump a season's revision to simulate upstream ratings moving
+        self.revisions = Counter()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def body(self, year: int) -> bytes:
+        return season_csv(year, self.teams, seed=year * 1000 + self.revisions[year], tempo=self.tempo).encode()
+
+    def _handler(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with upstream._lock:
+                    upstream.hits[self.path] += 1
+                if upstream.delay:
+                    time.sleep(upstream.delay)
+
+                if upstream.status != 200:
+                    self.send_error(upstream.status)
+                    return
+
+                try:
+                    year = int(self.path.strip("/").split("_", 1)[0])
+                except ValueError:
+                    self.send_error(404)
+                    return
+
+                body = upstream.body(year)
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    with upstream._lock:
+                        upstream.not_modified[self.path] += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/csv")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "StandInUpstream":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,59 @@
+"""
+Shared fixtures: a local stand-in for barttorvik.com, clients pointed at it
+with an empty snapshot directory, and the app served against it.
+"""
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services import snapshots
+from app.services.barttorvik_service import AsyncBartTorvik, BartTorvik
+from benchmarks.upstream import StandInUpstream
+
+# Seconds the app may take to warm its seasons before a test gives up
+WARMUP_TIMEOUT = 30
+
+
+@pytest.fixture
+def upstream():
+    with StandInUpstream() as upstream:
+        yield upstream
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path):
+    return str(tmp_path / "snapshots")
+
+
+@pytest.fixture
+def service(upstream, snapshot_dir):
+    """A blocking client on the stand-in upstream"""
+    service = BartTorvik(snapshot_dir=snapshot_dir)
+    service.base_url = upstream.base_url
+    yield service
+    service.shutdown_parser()
+
+
+@pytest.fixture
+def async_service(upstream, snapshot_dir):
+    """A non-blocking client sharing the blocking one's snapshot directory, like a second worker;
+    it opens its upstream client on first use, so tests close it with ``aclose`` inside their loop"""
+    service = AsyncBartTorvik(snapshot_dir=snapshot_dir)
+    service.base_url = upstream.base_url
+    return service
+
+
+@pytest.fixture
+def client(upstream, tmp_path, monkeypatch):
+    """The app on the stand-in upstream, once its startup warmup has loaded the current season"""
+    monkeypatch.setenv("BARTTORVIK_BASE_URL", upstream.base_url)
+    monkeypatch.setattr(snapshots, "DEFAULT_SNAPSHOT_DIR", str(tmp_path / "app-snapshots"))
+    from app.main import app
+
+    with TestClient(app) as client:
+        deadline = time.monotonic() + WARMUP_TIMEOUT
+        while client.get("/health").status_code != 200:
+            assert time.monotonic() < deadline, "the app did not finish warming up"
+            time.sleep(0.05)
+        yield client
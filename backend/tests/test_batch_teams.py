@@ -0,0 +1,26 @@
+"""
+POST /teams/batch bodies are built per request and never enter the season's
+response cache, whose keys would otherwise be client-chosen name lists.
+"""
+import orjson
+
+
+def test_batch_bodies_are_not_cached(service):
+    names = service.get_available_teams(2025)
+
+    for start in range(0, 300, 3):
+        assert service.get_teams_json(names[start:start + 3] + ["No Such Team"], 2025).etag
+
+    assert service.cache_stats()["seasons"]["2025"]["responses"] == 0
+
+
+def test_batch_resolves_in_request_order(service):
+    batch = service.get_teams_json(["UIUC", "Duke", "Illinois", "Nowhere", "Miami"], 2025)
+    again = service.get_teams_json(["UIUC", "Duke", "Illinois", "Nowhere", "Miami"], 2025)
+    payload = orjson.loads(batch.body)
+
+    assert batch is not again and batch.etag == again.etag
+    assert [team["team"] for team in payload["teams"]] == ["Illinois", "Duke"]
+    assert payload["resolved"] == {"UIUC": "illinois", "Duke": "duke", "Illinois": "illinois"}
+    assert payload["missing"] == ["Nowhere"]
+    assert [entry["name"] for entry in payload["ambiguous"]] == ["Miami"]
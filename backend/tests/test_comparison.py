@@ -0,0 +1,31 @@
+"""
+Head-to-head and matrix comparisons report the same metrics, and asking for a
+metric that cannot be compared is a 400 listing the ones that can.
+"""
+from app.services.metrics import COMPARISON_METRICS
+
+
+def test_head_to_head_reports_comparison_metrics(client):
+    response = client.get("/teams/compare/Illinois/Duke")
+
+    assert response.status_code == 200
+    assert list(response.json()["comparison"]["comparison"]) == COMPARISON_METRICS
+
+
+def test_matrix_defaults_to_comparison_metrics(client):
+    response = client.post("/teams/compare/matrix", json={"teams": ["Illinois", "Duke", "Purdue"]})
+
+    assert response.status_code == 200
+    assert list(response.json()["matrix"]["metrics"]) == COMPARISON_METRICS
+
+
+def test_unknown_metric_is_400_listing_valid_metrics(client):
+    response = client.post(
+        "/teams/compare/matrix",
+        json={"teams": ["Illinois", "Duke"], "metrics": ["adjoe", "vibes"]},
+    )
+
+    assert response.status_code == 400
+    detail = response.json()["detail"]
+    assert detail["names"] == ["vibes"]
+    assert detail["metrics"] == COMPARISON_METRICS
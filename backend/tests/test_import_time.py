@@ -0,0 +1,18 @@
+"""
+Cold-start regression check: importing the app and running its lifespan stays
+within budget and leaves the data path (pandas, numpy, pyarrow, the HTTP
+clients) for the first request.
+"""
+from benchmarks.import_time import BUDGET_MS, deferred_loaded, startup_profile
+
+RUNS = 3
+
+
+def test_startup_within_budget_and_defers_data_path():
+    runs = [startup_profile() for _ in range(RUNS)]
+    startup_ms, modules, _ = min(runs, key=lambda run: run[0])
+
+    assert startup_ms <= BUDGET_MS, f"import and lifespan took {startup_ms:.0f} ms, budget {BUDGET_MS} ms"
+    # Checked on every run: a module imported at startup is imported every time
+    for _, modules, _ in runs:
+        assert deferred_loaded(modules) == []
@@ -0,0 +1,74 @@
+"""
+Seasons whose file has no tempo column (column 44) parse ``adjt`` as NaN, so
+every response reports it as unknown (null) rather than as a tempo of 0.
+"""
+import orjson
+import pytest
+
+from app.services.conferences import STATISTICS
+
+YEAR = 2012
+
+
+@pytest.fixture
+def upstream(upstream):
+    upstream.tempo = False
+    return upstream
+
+
+def test_team_tempo_is_null(service):
+    team = orjson.loads(service.get_team_json("Illinois", YEAR).body)["team"]
+    batch = orjson.loads(service.get_teams_json(["Illinois", "Duke"], YEAR, ["team", "adjt"]).body)
+
+    assert team["adjt"] is None
+    assert [row["adjt"] for row in batch["teams"]] == [None, None]
+
+
+def test_query_never_matches_or_ranks_unknown_tempo(service):
+    filtered = orjson.loads(service.query_teams_json({"adjt_gte": "0"}, year=YEAR).body)
+    by_tempo = orjson.loads(service.query_teams_json({}, sort="-adjt", limit=5, year=YEAR, fields=["adjt"]).body)
+
+    assert filtered["total"] == 0
+    assert by_tempo["total"] > 0
+    assert all(row["adjt"] is None for row in by_tempo["teams"])
+
+
+def test_export_leaves_tempo_blank(service):
+    years, chunks = service.export_seasons(YEAR, YEAR, "csv", ["team", "adjt"])
+    lines = b"".join(chunks).decode().splitlines()
+
+    assert lines[0] == "season,team,adjt"
+    assert lines[1:] and all(line.endswith(",") for line in lines[1:])
+
+
+def test_prediction_uses_a_real_pace(service):
+    prediction = service.get_prediction("Illinois", "Purdue", year=YEAR)["predictions"][0]
+
+    assert prediction["tempo"] > 50
+
+
+def test_conference_tempo_is_null(service):
+    conferences = orjson.loads(service.get_conferences_json(YEAR).body)["conferences"]
+
+    assert conferences
+    for conference in conferences:
+        assert all(conference["metrics"]["adjt"][statistic] is None for statistic in STATISTICS)
+        # Other metrics are unaffected
+        assert conference["metrics"]["adjoe"]["mean"] > 0
+
+
+def test_no_team_is_tagged_for_tempo(service):
+    for name in service.get_available_teams(YEAR):
+        groups = {tag["group"] for tag in orjson.loads(service.get_team_json(name, YEAR).body)["tags"]}
+        assert "tempo" not in groups
+        # The other groups still tag every team
+        assert {"offense", "defense"} <= groups
+
+
+def test_scouting_bundle_has_no_tempo_read(service):
+    payload = orjson.loads(service.get_scouting_json("Illinois", "Purdue", "home", YEAR).body)
+
+    assert payload["team"]["adjt"] is None
+    assert payload["opponent"]["adjt"] is None
+    assert payload["scouting"]
+    assert all(note["group"] != "tempo" for note in payload["scouting"])
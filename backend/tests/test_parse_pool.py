@@ -0,0 +1,43 @@
+"""
+Where seasons are parsed: in-process in web workers, in a process pool only
+for bulk backfills.
+"""
+import asyncio
+import multiprocessing
+import os
+
+from app import cli
+from app.services import barttorvik_service
+
+
+def test_web_worker_parses_in_process(async_service):
+    async def run():
+        try:
+            return await async_service.get_seasons([2024, 2025])
+        finally:
+            await async_service.aclose()
+
+    seasons = asyncio.run(run())
+
+    assert sorted(seasons) == [2024, 2025]
+    assert async_service.parse_processes == 0
+    assert multiprocessing.active_children() == []
+
+
+def test_build_snapshots_uses_and_stops_a_parse_pool(upstream, snapshot_dir, monkeypatch, capsys):
+    services = []
+
+    class Recorded(cli.BartTorvik):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            services.append(self)
+
+    monkeypatch.setattr(cli, "BartTorvik", Recorded)
+    monkeypatch.setenv("BARTTORVIK_BASE_URL", upstream.base_url)
+
+    assert cli.main(["build-snapshots", "--years", "2024-2025", "--snapshot-dir", snapshot_dir]) == 0
+
+    assert sorted(os.listdir(snapshot_dir)) == ["2024.lock", "2024_team_results.arrow", "2025.lock", "2025_team_results.arrow"]
+    assert [service.parse_processes for service in services] == [barttorvik_service.BULK_PARSE_PROCESSES]
+    # The backfill's processes do not outlive it
+    assert multiprocessing.active_children() == []
@@ -0,0 +1,75 @@
+"""
+A forced refresh racing a cold load of the same season: the refresh holds the
+season's lock, so it must never wait on a load that is itself waiting for that lock,
+and a cold load gives up rather than wait for that lock forever.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from app.services import barttorvik_service
+
+YEAR = 2027
+
+# Seconds either call may take before the race counts as a deadlock
+DEADLINE = 10
+
+
+def test_async_refresh_and_cold_load_both_finish(upstream, async_service):
+    upstream.delay = 0.2
+    # Imported up front so both calls reach the lock within the same few milliseconds
+    async_service.load_modules()
+
+    async def race():
+        try:
+            return await asyncio.wait_for(
+                asyncio.gather(async_service.get_season(YEAR), async_service.refresh_season(YEAR)),
+                DEADLINE,
+            )
+        finally:
+            await async_service.aclose()
+
+    entry, refreshed = asyncio.run(race())
+
+    assert entry.year == YEAR and not entry.data.empty
+    assert refreshed is None or refreshed.year == YEAR
+
+
+def test_refresh_and_cold_load_both_finish(upstream, service):
+    upstream.delay = 0.2
+    service.load_modules()
+    results = {}
+    start = threading.Barrier(2)
+
+    def call(name, fn):
+        start.wait()
+        results[name] = fn(YEAR)
+
+    threads = [
+        threading.Thread(target=call, args=("load", service.get_season), daemon=True),
+        threading.Thread(target=call, args=("refresh", service.refresh_season), daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(DEADLINE)
+
+    assert not any(thread.is_alive() for thread in threads), "refresh and cold load deadlocked"
+    assert results["load"].year == YEAR and results["refresh"].year == YEAR
+
+
+def test_cold_load_gives_up_on_a_held_lock(async_service, monkeypatch):
+    monkeypatch.setattr(barttorvik_service, "SEASON_LOCK_TIMEOUT", 0.2)
+
+    async def load():
+        try:
+            # As if another worker were stuck downloading the season
+            with async_service.snapshots.lock(YEAR):
+                with pytest.raises(TimeoutError):
+                    await asyncio.wait_for(async_service.get_season(YEAR), DEADLINE)
+                return await async_service.get_team_by_name("Illinois", YEAR)
+        finally:
+            await async_service.aclose()
+
+    assert asyncio.run(load()) is None
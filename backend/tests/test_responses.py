@@ -0,0 +1,53 @@
+"""
+Cached bodies revalidate with ETags: If-None-Match naming the body, in any
+coding and with or without the weak prefix, is an empty 304 carrying the same
+validators, and every response varies on Accept-Encoding.
+"""
+import pytest
+
+LIST = "/teams/list"
+
+
+@pytest.fixture
+def etag(client):
+    response = client.get(LIST, headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    return response.headers["ETag"]
+
+
+def test_matching_etag_is_304(client, etag):
+    response = client.get(LIST, headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert "Accept-Encoding" in response.headers["Vary"].split(", ")
+    assert "Cache-Control" in response.headers
+
+
+@pytest.mark.parametrize("header", ["W/{etag}", '"nope", {etag}', "*"])
+def test_weak_listed_and_wildcard_tags_match(client, etag, header):
+    response = client.get(LIST, headers={"If-None-Match": header.format(etag=etag)})
+
+    assert response.status_code == 304
+
+
+def test_tag_of_another_coding_matches(client, etag):
+    compressed = client.get(LIST, headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["ETag"] != etag
+
+    # A client that cached the gzip body still holds the same representation
+    response = client.get(LIST, headers={"Accept-Encoding": "identity", "If-None-Match": compressed.headers["ETag"]})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_stale_etag_gets_the_body(client, etag):
+    response = client.get(LIST, headers={"Accept-Encoding": "identity", "If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+    assert "Accept-Encoding" in response.headers["Vary"].split(", ")
+    assert response.json()
@@ -0,0 +1,29 @@
+"""
+Search bodies are cached per normalized query, so spellings of one name share
+a body, and a blank query is rejected rather than returning every team.
+"""
+import orjson
+import pytest
+
+
+def test_spellings_of_one_query_share_a_body(service):
+    first = service.search_teams_json("St. John's", 2025)
+
+    for spelling in ("st johns", "  ST. JOHNS ", "St.-John's"):
+        assert service.search_teams_json(spelling, 2025) is first
+    assert service.cache_stats()["seasons"]["2025"]["responses"] == 1
+    assert orjson.loads(first.body)["teams"][0]["team"] == "St. John's"
+
+
+@pytest.mark.parametrize("query", ["", "   "])
+def test_blank_query_is_400(client, query):
+    response = client.get("/teams/search", params={"query": query})
+
+    assert response.status_code == 400
+
+
+def test_punctuation_only_query_matches_nothing(client):
+    response = client.get("/teams/search", params={"query": "("})
+
+    assert response.status_code == 200
+    assert response.json() == {"teams": []}
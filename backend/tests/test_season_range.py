@@ -0,0 +1,45 @@
+"""
+Season ranges for exports: defaults are resolved once by the service and name
+the file, and seasons before the first one are a clear 400 rather than clamped.
+"""
+import pytest
+
+from app.services.team_history import FIRST_SEASON
+
+
+def filename(response) -> str:
+    return response.headers["Content-Disposition"].split('filename="')[1].rstrip('"')
+
+
+def test_default_start_is_clamped_to_first_season(client):
+    response = client.get("/seasons/export", params={"to": FIRST_SEASON + 2, "format": "csv"})
+
+    assert response.status_code == 200
+    assert filename(response) == f"barttorvik_{FIRST_SEASON}-{FIRST_SEASON + 2}.csv"
+    seasons = {line.split(",", 1)[0] for line in response.text.splitlines()[1:]}
+    assert seasons == {str(year) for year in range(FIRST_SEASON, FIRST_SEASON + 3)}
+
+
+def test_single_season_export_is_named_for_it(client):
+    response = client.get(f"/seasons/{FIRST_SEASON + 4}/export")
+
+    assert response.status_code == 200
+    assert filename(response) == f"barttorvik_{FIRST_SEASON + 4}.ndjson"
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"from": 2000, "to": 2005}, {"from": 0, "to": FIRST_SEASON + 2}, {"to": FIRST_SEASON - 1}],
+)
+def test_seasons_before_the_first_are_400(client, params):
+    response = client.get("/seasons/export", params=params)
+
+    assert response.status_code == 400
+    assert f"Seasons start in {FIRST_SEASON}" in response.json()["detail"]
+
+
+def test_reversed_range_is_400(client):
+    response = client.get("/seasons/export", params={"from": FIRST_SEASON + 3, "to": FIRST_SEASON + 2})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "'from' must not be after 'to'"
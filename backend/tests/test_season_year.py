@@ -0,0 +1,52 @@
+"""
+Season naming: BartTorvik files a season under the year it ends in, so from
+November on the live season is next calendar year's.
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.services import season_cache
+from app.services.refresh_scheduler import RefreshScheduler
+from app.services.season_cache import season_year
+
+
+class FrozenNovember(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 11, 20, 20, 0, tzinfo=tz)
+
+
+@pytest.mark.parametrize(
+    "now, expected",
+    [
+        (datetime(2025, 3, 30), 2025),
+        (datetime(2025, 10, 31, 23, 59), 2025),
+        (datetime(2025, 11, 1), 2026),
+        (datetime(2025, 12, 31), 2026),
+        (datetime(2026, 1, 1), 2026),
+    ],
+)
+def test_season_year(now, expected):
+    assert season_year(now) == expected
+
+
+def test_scheduler_follows_the_live_season_in_november(async_service, monkeypatch):
+    monkeypatch.setattr(season_cache, "datetime", FrozenNovember)
+    service = async_service
+    refreshed = []
+
+    async def refresh_season(year):
+        refreshed.append(year)
+
+    service.refresh_season = refresh_season
+    scheduler = RefreshScheduler(service)
+    asyncio.run(scheduler.refresh())
+
+    assert service.current_year == 2026
+    assert scheduler.years == [2024, 2025, 2026]
+    assert refreshed == [2026]
+    # The season that ended in April is final; the one under way is not
+    assert service.cache.is_pinned(2025)
+    assert not service.cache.is_pinned(2026)
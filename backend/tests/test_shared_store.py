@@ -0,0 +1,46 @@
+"""
+Workers sharing one season store: an async worker adopts a version another
+process wrote without reloading or preparing it on the event loop.
+"""
+import asyncio
+import threading
+
+from app.services import barttorvik_service
+
+YEAR = 2026
+
+
+def test_async_worker_adopts_new_version_off_the_event_loop(service, async_service, upstream, monkeypatch):
+    monkeypatch.setattr(barttorvik_service, "STORE_POLL_SECONDS", 0)
+    first = service.refresh_season(YEAR).version
+
+    loads = []
+    load = async_service.snapshots.load
+
+    def record(year):
+        loads.append(threading.current_thread())
+        return load(year)
+
+    monkeypatch.setattr(async_service.snapshots, "load", record)
+
+    async def run():
+        try:
+            cold = (await async_service.get_season(YEAR)).version
+            loads.clear()
+
+            upstream.revisions[YEAR] += 1
+            latest = service.refresh_season(YEAR).version
+            # Every concurrent request sees the new file; only one reload runs
+            entries = await asyncio.gather(*(async_service.get_season(YEAR) for _ in range(10)))
+            return cold, latest, threading.current_thread(), {entry.version for entry in entries}
+        finally:
+            await async_service.aclose()
+
+    cold, latest, loop_thread, versions = asyncio.run(run())
+
+    assert cold == first
+    assert latest != first
+    assert versions == {latest}
+    assert len(loads) == 1 and loads[0] is not loop_thread
+    # The worker never went upstream itself
+    assert upstream.hits[f"/{YEAR}_team_results.csv"] == 2
@@ -0,0 +1,150 @@
+"""
+Single-flight coalescing: N concurrent callers for one key run the work once
+and all see its outcome, result or exception.
+"""
+import asyncio
+import contextlib
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.barttorvik_service import BartTorvik
+from app.services.singleflight import AsyncSingleFlight, SingleFlight
+from benchmarks.upstream import StandInUpstream
+
+CALLERS = 50
+
+
+def run_threads(flight: SingleFlight, fn):
+    """Start CALLERS threads on ``flight.do("key", fn)``, released together; their outcomes in order"""
+    start = threading.Barrier(CALLERS)
+
+    def call(_):
+        start.wait()
+        try:
+            return flight.do("key", fn)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        return list(pool.map(call, range(CALLERS)))
+
+
+def test_single_flight_runs_once_and_shares_result():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    flight = SingleFlight()
+    results = run_threads(flight, fetch)
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert not flight.in_flight("key")
+
+
+def test_single_flight_shares_exception():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        raise RuntimeError("upstream down")
+
+    flight = SingleFlight()
+    results = run_threads(flight, fetch)
+
+    assert len(calls) == 1
+    assert isinstance(results[0], RuntimeError)
+    assert all(result is results[0] for result in results)
+    # The failure is not remembered; the next call tries again
+    assert flight.do("key", lambda: "retried") == "retried"
+
+
+def test_async_single_flight_runs_once_and_shares_result():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return object()
+
+    async def herd():
+        flight = AsyncSingleFlight()
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(CALLERS)))
+        return flight, results
+
+    flight, results = asyncio.run(herd())
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert not flight.in_flight("key")
+
+
+def test_async_single_flight_shares_exception():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        raise RuntimeError("upstream down")
+
+    async def retry():
+        return "retried"
+
+    async def herd():
+        flight = AsyncSingleFlight()
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(CALLERS)), return_exceptions=True)
+        # The failure is not remembered; the next call tries again
+        return results, await flight.do("key", retry)
+
+    results, retried = asyncio.run(herd())
+
+    assert len(calls) == 1
+    assert isinstance(results[0], RuntimeError)
+    assert all(result is results[0] for result in results)
+    assert retried == "retried"
+
+
+def test_async_single_flight_survives_a_cancelled_waiter():
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "season"
+
+    async def herd():
+        flight = AsyncSingleFlight()
+        quitter = asyncio.ensure_future(flight.do("key", fetch))
+        stayer = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        quitter.cancel()
+        return await stayer
+
+    assert asyncio.run(herd()) == "season"
+
+
+@pytest.mark.parametrize("status", [200, 503])
+def test_concurrent_season_lookups_fetch_upstream_once(status, tmp_path):
+    with StandInUpstream(delay=0.3, status=status) as upstream:
+        service = BartTorvik(snapshot_dir=str(tmp_path))
+        service.base_url = upstream.base_url
+
+        def call(i: int):
+            # Mix the entry points the /teams routes use
+            if i % 2:
+                return len(service.search_teams("Illinois", 2025))
+            return bool(service.get_opponent_comparison("Illinois", "Duke", 2025))
+
+        # The service prints one line per failed caller
+        with ThreadPoolExecutor(max_workers=CALLERS) as pool, contextlib.redirect_stdout(io.StringIO()):
+            results = list(pool.map(call, range(CALLERS)))
+
+        assert upstream.hits["/2025_team_results.csv"] == 1
+
+    succeeded = sum(1 for result in results if result)
+    assert succeeded == (CALLERS if status == 200 else 0)
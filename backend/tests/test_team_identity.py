@@ -0,0 +1,58 @@
+"""
+Team identity: ids, names and aliases resolve to one team; a name that could
+mean several teams is a 409 listing them rather than a guess.
+"""
+import pytest
+
+from app.services.team_identity import ALIASES, team_id
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("UIUC", "Illinois"),
+        ("Fighting Illini", "Illinois"),
+        ("illinois", "Illinois"),
+        ("UIC", "Illinois Chicago"),
+        ("UConn", "Connecticut"),
+        ("Miami (FL)", "Miami FL"),
+        ("miami ohio", "Miami OH"),
+        ("St. Mary's", "Saint Mary's"),
+        ("Loyola (IL)", "Loyola Chicago"),
+        ("K-State", "Kansas St."),
+        ("north-carolina-st", "North Carolina St."),
+    ],
+)
+def test_alias_resolves_to_team(client, name, expected):
+    response = client.get(f"/teams/{name}", params={"fields": "team_id,team"})
+
+    assert response.status_code == 200
+    assert response.json()["team"] == {"team_id": team_id(expected), "team": expected}
+
+
+def test_aliases_never_hide_a_real_team(service):
+    # "Illinois" is a team and also a prefix of others; the exact name wins
+    assert service.get_team_by_name("Illinois", 2025)["team"] == "Illinois"
+    assert service.get_team_by_name("Illinois St.", 2025)["team"] == "Illinois St."
+    for canonical, aliases in ALIASES.items():
+        assert canonical not in aliases
+
+
+def test_ambiguous_name_is_409_with_candidates(client):
+    response = client.get("/teams/Miami")
+
+    assert response.status_code == 409
+    detail = response.json()["detail"]
+    assert detail["name"] == "Miami"
+    assert sorted(detail["candidates"]) == ["Miami FL", "Miami OH"]
+
+
+def test_ambiguous_team_in_comparison_is_409(client):
+    response = client.get("/teams/compare/Miami/Duke")
+
+    assert response.status_code == 409
+    assert sorted(response.json()["detail"]["candidates"]) == ["Miami FL", "Miami OH"]
+
+
+def test_unknown_team_is_404(client):
+    assert client.get("/teams/Nowhere State Tech").status_code == 404
@@ -0,0 +1,81 @@
+"""
+GET /teams/query: anything it does not understand is a 400, pages are bounded
+and slice one stable order, and bodies never enter the season's response cache.
+"""
+import pytest
+
+from app.services.team_query import MAX_QUERY_LIMIT
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"vibes_gt": "1"},
+        {"adjoe_above": "110"},
+        {"adjoe_gt": "lots"},
+        {"barthag_between": "0.9"},
+        {"conf": " , "},
+        {"sort": "vibes"},
+        {"sort": "-adjoe,mascot"},
+        {"fields": "team,mascot"},
+        {"limit": 0},
+        {"limit": MAX_QUERY_LIMIT + 1},
+        {"offset": -1},
+    ],
+)
+def test_bad_parameters_are_400(client, params):
+    response = client.get("/teams/query", params=params)
+
+    assert response.status_code == 400
+    assert response.json()["detail"]
+
+
+def test_default_order_is_rank(client):
+    payload = client.get("/teams/query", params={"fields": "rank"}).json()
+
+    ranks = [row["rank"] for row in payload["teams"]]
+    assert payload["limit"] == 50 and len(ranks) == 50
+    assert ranks == sorted(ranks)
+
+
+def test_sorts_descending_and_on_several_keys(client):
+    by_barthag = client.get("/teams/query", params={"sort": "-barthag", "limit": MAX_QUERY_LIMIT, "fields": "barthag"}).json()
+    by_conf = client.get("/teams/query", params={"sort": "conf,-adjoe", "limit": MAX_QUERY_LIMIT, "fields": "conf,adjoe"}).json()
+
+    barthag = [row["barthag"] for row in by_barthag["teams"]]
+    assert barthag == sorted(barthag, reverse=True)
+    keys = [(row["conf"], -row["adjoe"]) for row in by_conf["teams"]]
+    assert keys == sorted(keys)
+
+
+def test_filters_combine(client):
+    payload = client.get(
+        "/teams/query",
+        params={"conf": "B10,sec", "adjoe_gte": "110", "barthag_between": "0.95,0.5", "fields": "conf,adjoe,barthag"},
+    ).json()
+
+    assert payload["total"] == len(payload["teams"]) > 0
+    for row in payload["teams"]:
+        assert row["conf"] in ("B10", "SEC")
+        assert row["adjoe"] >= 110 and 0.5 <= row["barthag"] <= 0.95
+
+
+def test_pages_slice_one_order(client):
+    params = {"sort": "-adjoe", "fields": "team_id"}
+    whole = client.get("/teams/query", params={**params, "limit": MAX_QUERY_LIMIT}).json()
+    pages = [
+        client.get("/teams/query", params={**params, "limit": 40, "offset": offset}).json()
+        for offset in range(0, whole["total"], 40)
+    ]
+
+    assert all(page["total"] == whole["total"] for page in pages)
+    assert [row for page in pages for row in page["teams"]] == whole["teams"]
+    past_end = client.get("/teams/query", params={**params, "offset": whole["total"]}).json()
+    assert past_end["teams"] == [] and past_end["total"] == whole["total"]
+
+
+def test_query_bodies_are_not_cached(service):
+    for offset in range(0, 200, 10):
+        assert service.query_teams_json({"adjoe_gt": str(100 + offset / 10)}, offset=offset, year=2025).etag
+
+    assert service.cache_stats()["seasons"]["2025"]["responses"] == 0
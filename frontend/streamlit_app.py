@@ -20,13 +20,40 @@ import os
 # Get API URL from environment variable or use default
 API_BASE_URL = os.getenv("API_BASE_URL", "https://illinois-project.onrender.com")
 
+# Responses the backend has sent with an ETag, kept across reruns so repeats are revalidated with a 304
+MAX_CACHED_RESPONSES = 256
+
+@st.cache_resource
+def _api_responses():
+    return {}
+
+def api_get(path, **kwargs):
+    """GET a backend path, letting the server answer 304 for a response we already have."""
+    url = f"{API_BASE_URL}{path}"
+    cache = _api_responses()
+    cached = cache.get(url)
+    headers = {"If-None-Match": cached.headers["ETag"]} if cached is not None else {}
+    response = requests.get(url, headers=headers, **kwargs)
+    if response.status_code == 304 and cached is not None:
+        return cached
+    if response.status_code == 200 and "ETag" in response.headers:
+        cache.pop(url, None)
+        cache[url] = response
+        if len(cache) > MAX_CACHED_RESPONSES:
+            cache.pop(next(iter(cache)))
+    return response
+
 def check_api_health():
-    """Check if the backend API is running."""
+    """Check if the backend API is running: "up", "starting" (still warming its cache) or "down"."""
     try:
         response = requests.get(f"{API_BASE_URL}/health", timeout=5)
-        return response.status_code == 200
-    except requests.exceptions.RequestException:
-        return False
+        if response.status_code == 200:
+            return "up"
+        if response.status_code == 503 and response.json().get("status") == "warming":
+            return "starting"
+        return "down"
+    except (requests.exceptions.RequestException, ValueError):
+        return "down"
 
 def main():
     """Main application function."""
@@ -46,8 +73,10 @@ def main():
         
         st.markdown("---")
         st.subheader("API Status")
-        if api_status:
+        if api_status == "up":
             st.success("✅ Backend API Connected")
+        elif api_status == "starting":
+            st.info("⏳ Backend API Starting - loading season data")
         else:
             st.error("❌ Backend API Disconnected")
             st.warning("Make sure the FastAPI backend is running on port 8000")
@@ -71,7 +100,7 @@ def show_dashboard():
     # Fetch data from backend
     try:
         # Get all teams
-        response = requests.get(f"{API_BASE_URL}/teams/list")
+        response = api_get("/teams/list")
         if response.status_code == 200:
             teams_data = response.json()
             total_teams = len(teams_data.get("teams", []))
@@ -79,7 +108,7 @@ def show_dashboard():
             total_teams = 0
             
         # Get some sample team data for recent activity
-        response = requests.get(f"{API_BASE_URL}/teams/search?query=Illinois")
+        response = api_get("/teams/search?query=Illinois")
         if response.status_code == 200:
             recent_teams = response.json().get("teams", [])
         else:
@@ -129,7 +158,7 @@ def show_team_analysis():
     
     if search_query:
         try:
-            response = requests.get(f"{API_BASE_URL}/teams/search?query={search_query}")
+            response = api_get(f"/teams/search?query={search_query}&fields=team_id,team,conf")
             if response.status_code == 200:
                 teams = response.json().get("teams", [])
                 
@@ -137,15 +166,15 @@ def show_team_analysis():
                     st.success(f"Found {len(teams)} teams matching '{search_query}'")
                     
                     # Let user select a team
-                    team_options = [f"{team['team']} ({team['conference']})" for team in teams]
-                    selected_team_display = st.selectbox("Select a team to analyze:", team_options)
+                    team_options = {f"{team['team']} ({team['conf']})": team for team in teams}
+                    selected_team_display = st.selectbox("Select a team to analyze:", list(team_options))
                     
                     if selected_team_display:
-                        # Extract team name from display string
-                        selected_team = selected_team_display.split(" (")[0]
+                        selected = team_options[selected_team_display]
+                        selected_team = selected['team']
                         
-                        # Get detailed team data
-                        team_response = requests.get(f"{API_BASE_URL}/teams/{selected_team}")
+                        # Get detailed team data by its canonical id
+                        team_response = api_get(f"/teams/{selected.get('team_id', selected_team)}")
                         if team_response.status_code == 200:
                             team_data = team_response.json().get("team", {})
                             
@@ -170,6 +199,19 @@ def show_team_analysis():
                                 st.metric("AdjDE", f"{team_data.get('adjde', 0):.1f}")
                                 st.metric("WAB", f"{team_data.get('WAB', 0):.1f}")
                             
+                            # Season-over-season trend
+                            history_response = requests.get(f"{API_BASE_URL}/teams/{selected.get('team_id', selected_team)}/history")
+                            if history_response.status_code == 200:
+                                history = history_response.json()
+                                trends = pd.DataFrame(history.get("trajectories", {}), index=history.get("years", []))
+                                if len(trends) > 1:
+                                    st.write("**Recent Seasons:**")
+                                    trend_col1, trend_col2 = st.columns(2)
+                                    with trend_col1:
+                                        st.line_chart(trends[["adjoe", "adjde"]])
+                                    with trend_col2:
+                                        st.line_chart(trends[["barthag"]])
+                            
                             st.markdown("---")
                             
                             # Team comparison
@@ -177,7 +219,7 @@ def show_team_analysis():
                             compare_team = st.text_input("Enter team to compare with:", placeholder="e.g., Duke")
                             
                             if compare_team:
-                                compare_response = requests.get(f"{API_BASE_URL}/teams/compare/{selected_team}/{compare_team}")
+                                compare_response = requests.get(f"{API_BASE_URL}/teams/compare/{selected.get('team_id', selected_team)}/{compare_team}")
                                 if compare_response.status_code == 200:
                                     comparison = compare_response.json().get("comparison", {})
                                     
@@ -196,6 +238,9 @@ def show_team_analysis():
                                                         st.write(f"  → **{selected_team}** has the advantage")
                                                     elif advantage == 'team2':
                                                         st.write(f"  → **{compare_team}** has the advantage")
+                                elif compare_response.status_code == 409:
+                                    candidates = compare_response.json().get("detail", {}).get("candidates", [])
+                                    st.warning(f"'{compare_team}' could mean: {', '.join(candidates)}")
                                 else:
                                     st.error(f"Could not compare with {compare_team}")
                         else:
@@ -218,27 +263,25 @@ def show_player_stats():
     # Team Selection for Roster Analysis
     st.subheader("🔍 Select Team for Roster Analysis")
     
-    # Get all teams for selection
+    # Search teams on the server rather than downloading the whole list
     try:
-        response = requests.get(f"{API_BASE_URL}/teams/list")
-        if response.status_code == 200:
-            all_teams = response.json().get("teams", [])
-            
-            # Create a search box for teams
-            team_search = st.text_input("Search for a team:", placeholder="e.g., Illinois, Duke, Houston")
-            
-            if team_search:
-                # Filter teams based on search
-                filtered_teams = [team for team in all_teams if team_search.lower() in team.lower()]
+        # Create a search box for teams
+        team_search = st.text_input("Search for a team:", placeholder="e.g., Illinois, Duke, Houston")
+        
+        if team_search:
+            response = api_get(f"/teams/search?query={team_search}&fields=team")
+            if response.status_code == 200:
+                filtered_teams = [team["team"] for team in response.json().get("teams", [])]
                 
                 if filtered_teams:
                     selected_team = st.selectbox("Select team:", filtered_teams[:20])  # Limit to first 20
                     
                     if selected_team:
                         # Get team data
-                        team_response = requests.get(f"{API_BASE_URL}/teams/{selected_team}")
+                        team_response = api_get(f"/teams/{selected_team}")
                         if team_response.status_code == 200:
                             team_data = team_response.json().get("team", {})
+                            team_tags = team_response.json().get("tags", [])
                             
                             st.success(f"📊 Analyzing {selected_team} roster and performance")
                             
@@ -269,44 +312,38 @@ def show_player_stats():
                             # Performance Insights
                             st.write("**Team Performance Insights:**")
                             
-                            # Offensive Analysis
-                            adjoe = team_data.get("adjoe", 0)
-                            if adjoe > 120:
-                                st.write("• 🟢 **Strong Offensive Team** - High scoring efficiency")
-                            elif adjoe > 110:
-                                st.write("• 🟡 **Average Offensive Team** - Moderate scoring")
-                            else:
-                                st.write("• 🔴 **Offensive Challenges** - Below average scoring")
-                            
-                            # Defensive Analysis
-                            adjde = team_data.get("adjde", 0)
-                            if adjde < 95:
-                                st.write("• 🟢 **Elite Defense** - Very low opponent scoring")
-                            elif adjde < 105:
-                                st.write("• 🟡 **Solid Defense** - Good defensive efficiency")
-                            else:
-                                st.write("• 🔴 **Defensive Concerns** - High opponent scoring")
+                            # Scouting tags computed by the backend for the whole season
+                            icons = {"strength": "🟢", "weakness": "🔴", "neutral": "🟡"}
+                            for tag in team_tags:
+                                if tag["group"] in ("offense", "defense", "rating"):
+                                    st.write(f"• {icons.get(tag['kind'], '•')} **{tag['label']}**")
                             
-                            # Tempo Analysis
                             st.write("**Playing Style Analysis:**")
-                            if adjoe > 120 and adjde > 105:
-                                st.write("• ⚡ **High-Tempo Team** - Fast-paced, high-scoring games")
-                            elif adjoe < 110 and adjde < 95:
-                                st.write("• 🐌 **Slow-Tempo Team** - Defensive, low-scoring games")
-                            else:
-                                st.write("• ⚖️ **Balanced Team** - Moderate tempo and scoring")
+                            for tag in team_tags:
+                                if tag["group"] in ("tempo", "schedule"):
+                                    st.write(f"• ⚖️ **{tag['label']}**")
                             
                             # Conference Context
                             st.write("**Conference Context:**")
                             conf = team_data.get("conf", "")
                             if conf:
-                                # Get conference teams for comparison
-                                conf_response = requests.get(f"{API_BASE_URL}/teams/search?query={conf}")
+                                # Get conference teams for comparison, strongest first
+                                conf_response = api_get(f"/teams/query?conf={conf}&sort=-barthag&fields=team_id&limit=500")
                                 if conf_response.status_code == 200:
                                     conf_teams = conf_response.json().get("teams", [])
                                     if conf_teams:
                                         st.write(f"• **Conference**: {conf} ({len(conf_teams)} teams in database)")
+                                        conf_ids = [team["team_id"] for team in conf_teams]
+                                        if team_data.get("team_id") in conf_ids:
+                                            st.write(f"• **Conference Standing**: {conf_ids.index(team_data['team_id']) + 1} of {len(conf_ids)} by Barthag")
                                         st.write(f"• **Conference Strength**: {team_data.get('sos', 0):.3f} SOS rating")
+                                
+                                summary_response = api_get(f"/conferences/{conf}")
+                                if summary_response.status_code == 200:
+                                    summary = summary_response.json().get("conference", {})
+                                    barthag = summary.get("metrics", {}).get("barthag", {})
+                                    st.write(f"• **Conference Rank**: #{summary.get('strength_rank', 'N/A')} by average Barthag ({barthag.get('mean', 0):.3f}, median {barthag.get('median', 0):.3f})")
+                                    st.write(f"• **Conference Record**: {summary.get('wins', 0)}-{summary.get('losses', 0)}")
                             
                             st.markdown("---")
                             
@@ -326,8 +363,8 @@ def show_player_stats():
                             st.error(f"Could not fetch data for {selected_team}")
                 else:
                     st.warning(f"No teams found matching '{team_search}'")
-        else:
-            st.error("Could not fetch team list")
+            else:
+                st.error("Could not search teams")
     except Exception as e:
         st.error(f"Error: {e}")
         st.info("Try searching for a specific team to analyze their roster and performance.")
@@ -347,7 +384,7 @@ def show_game_preparation():
     if opponent_search:
         try:
             # Search for opponent
-            response = requests.get(f"{API_BASE_URL}/teams/search?query={opponent_search}")
+            response = api_get(f"/teams/search?query={opponent_search}&fields=team_id,team,conf")
             if response.status_code == 200:
                 opponents = response.json().get("teams", [])
                 
@@ -355,16 +392,29 @@ def show_game_preparation():
                     st.success(f"Found {len(opponents)} teams matching '{opponent_search}'")
                     
                     # Select opponent
-                    opponent_options = [f"{team['team']} ({team['conference']})" for team in opponents]
-                    selected_opponent_display = st.selectbox("Select opponent:", opponent_options)
+                    opponent_options = {f"{team['team']} ({team['conf']})": team for team in opponents}
+                    selected_opponent_display = st.selectbox("Select opponent:", list(opponent_options))
                     
                     if selected_opponent_display:
-                        opponent_name = selected_opponent_display.split(" (")[0]
+                        opponent = opponent_options[selected_opponent_display]
+                        opponent_name = opponent['team']
+                        
+                        # Where the game is played decides the report's prediction
+                        your_team = "Illinois"
+                        opponent_id = opponent.get('team_id', opponent_name)
+                        venue = st.radio(
+                            f"Where does {your_team} play?",
+                            ["neutral", "home", "away"],
+                            format_func=str.capitalize,
+                            horizontal=True
+                        )
                         
-                        # Get opponent data
-                        opponent_response = requests.get(f"{API_BASE_URL}/teams/{opponent_name}")
-                        if opponent_response.status_code == 200:
-                            opponent_data = opponent_response.json().get("team", {})
+                        # Profile, percentiles, comparison, prediction and scouting notes in one round trip
+                        scouting_response = api_get(f"/scouting/{your_team}/{opponent_id}?venue={venue}")
+                        if scouting_response.status_code == 200:
+                            report = scouting_response.json()
+                            opponent_data = report.get("opponent", {})
+                            your_data = report.get("team", {})
                             
                             st.markdown("---")
                             
@@ -396,42 +446,17 @@ def show_game_preparation():
                             # Strengths & Weaknesses Analysis
                             st.subheader("🔍 Strengths & Weaknesses")
                             
-                            # Offensive Analysis
-                            adjoe = opponent_data.get("adjoe", 0)
-                            oe_rank = opponent_data.get("oe_rank", 999)
+                            # Rule-based notes from the backend, one each for offense, defense and tempo
+                            icons = {"strength": "🟢", "weakness": "🔴", "neutral": "🟡"}
+                            for note in report.get("scouting", []):
+                                st.write(f"• {icons.get(note['kind'], '•')} **{note['group'].capitalize()}**: {note['label']}")
                             
-                            st.write("**Offensive Analysis:**")
-                            if adjoe > 120 and oe_rank < 50:
-                                st.write("• 🟢 **STRENGTH**: Elite offensive efficiency")
-                                st.write("• ⚠️ **CONCERN**: High-scoring opponent")
-                            elif adjoe > 110:
-                                st.write("• 🟡 **MODERATE**: Above-average offense")
-                            else:
-                                st.write("• 🔴 **WEAKNESS**: Below-average scoring")
-                            
-                            # Defensive Analysis
-                            adjde = opponent_data.get("adjde", 0)
-                            de_rank = opponent_data.get("de_rank", 999)
-                            
-                            st.write("**Defensive Analysis:**")
-                            if adjde < 95 and de_rank < 50:
-                                st.write("• 🟢 **WEAKNESS**: Poor defensive efficiency")
-                                st.write("• ✅ **OPPORTUNITY**: Exploit defensive gaps")
-                            elif adjde < 105:
-                                st.write("• 🟡 **MODERATE**: Average defense")
-                            else:
-                                st.write("• 🔴 **STRENGTH**: Strong defensive team")
-                            
-                            # Tempo Analysis
-                            st.write("**Tempo & Style:**")
-                            if adjoe > 120 and adjde > 105:
-                                st.write("• ⚡ **Fast-paced team** - Prepare for high-scoring game")
-                                st.write("• 🏃‍♂️ **Strategy**: Control tempo, limit transition opportunities")
-                            elif adjoe < 110 and adjde < 95:
-                                st.write("• 🐌 **Slow-paced team** - Prepare for defensive battle")
-                                st.write("• 🛡️ **Strategy**: Be patient, execute half-court offense")
-                            else:
-                                st.write("• ⚖️ **Balanced team** - Adapt to game flow")
+                            barthag = report.get("percentiles", {}).get("barthag")
+                            if barthag:
+                                st.write(f"• 📊 **Overall**: Barthag better than {barthag['percentile']:.0f}% of teams (#{barthag['rank']})")
+                            
+                            # The opponent's tag in each group drives the game plan below
+                            scouting = {note["group"]: note for note in report.get("scouting", [])}
                             
                             st.markdown("---")
                             
@@ -440,7 +465,7 @@ def show_game_preparation():
                             
                             # Defensive Strategy
                             st.write("**Defensive Strategy:**")
-                            if adjoe > 120:
+                            if scouting.get("offense", {}).get("kind") == "strength":
                                 st.write("• 🛡️ **Focus on transition defense** - Limit fast breaks")
                                 st.write("• 🎯 **Contest every shot** - High-scoring team")
                                 st.write("• ⏱️ **Control pace** - Slow down their offense")
@@ -450,7 +475,7 @@ def show_game_preparation():
                             
                             # Offensive Strategy
                             st.write("**Offensive Strategy:**")
-                            if adjde > 105:
+                            if scouting.get("defense", {}).get("kind") == "strength":
                                 st.write("• 🎯 **Be patient** - Strong defensive opponent")
                                 st.write("• 🏀 **Attack the rim** - Draw fouls")
                                 st.write("• ⏱️ **Use shot clock** - Find good shots")
@@ -463,43 +488,59 @@ def show_game_preparation():
                             # Matchup Analysis
                             st.subheader("⚔️ Matchup Analysis")
                             
-                            # Get your team for comparison (assuming Illinois)
-                            your_team = "Illinois"
-                            comparison_response = requests.get(f"{API_BASE_URL}/teams/compare/{your_team}/{opponent_name}")
+                            # Compare with your team (assuming Illinois)
+                            if your_data:
+                                st.caption(f"{your_team}: #{your_data.get('rank', 'N/A')} overall, {your_data.get('record', 'N/A')}")
+                            comp_data = report.get("comparison", {})
                             
-                            if comparison_response.status_code == 200:
-                                comparison = comparison_response.json().get("comparison", {})
-                                comp_data = comparison.get("comparison", {})
+                            if comp_data:
+                                st.write(f"**{your_team} vs {opponent_name} Key Matchups:**")
                                 
-                                if comp_data:
-                                    st.write(f"**{your_team} vs {opponent_name} Key Matchups:**")
-                                    
-                                    for metric, data in comp_data.items():
-                                        if isinstance(data, dict):
-                                            your_value = data.get('team1_value', 0)
-                                            their_value = data.get('team2_value', 0)
-                                            advantage = data.get('advantage', '')
-                                            
-                                            if metric == 'barthag':
-                                                st.write(f"• **Overall Rating**: {your_team} ({your_value:.3f}) vs {opponent_name} ({their_value:.3f})")
-                                                if advantage == 'team1':
-                                                    st.write(f"  → **{your_team} advantage** - Higher overall rating")
-                                                else:
-                                                    st.write(f"  → **{opponent_name} advantage** - Higher overall rating")
-                                            
-                                            elif metric == 'adjoe':
-                                                st.write(f"• **Offensive Efficiency**: {your_team} ({your_value:.1f}) vs {opponent_name} ({their_value:.1f})")
-                                                if advantage == 'team1':
-                                                    st.write(f"  → **{your_team} offensive advantage**")
-                                                else:
-                                                    st.write(f"  → **{opponent_name} offensive advantage**")
-                                            
-                                            elif metric == 'adjde':
-                                                st.write(f"• **Defensive Efficiency**: {your_team} ({your_value:.1f}) vs {opponent_name} ({their_value:.1f})")
-                                                if advantage == 'team1':
-                                                    st.write(f"  → **{your_team} defensive advantage**")
-                                                else:
-                                                    st.write(f"  → **{opponent_name} defensive advantage**")
+                                for metric, data in comp_data.items():
+                                    if isinstance(data, dict):
+                                        your_value = data.get('team1_value', 0)
+                                        their_value = data.get('team2_value', 0)
+                                        advantage = data.get('advantage', '')
+                                        
+                                        if metric == 'barthag':
+                                            st.write(f"• **Overall Rating**: {your_team} ({your_value:.3f}) vs {opponent_name} ({their_value:.3f})")
+                                            if advantage == 'team1':
+                                                st.write(f"  → **{your_team} advantage** - Higher overall rating")
+                                            else:
+                                                st.write(f"  → **{opponent_name} advantage** - Higher overall rating")
+                                        
+                                        elif metric == 'adjoe':
+                                            st.write(f"• **Offensive Efficiency**: {your_team} ({your_value:.1f}) vs {opponent_name} ({their_value:.1f})")
+                                            if advantage == 'team1':
+                                                st.write(f"  → **{your_team} offensive advantage**")
+                                            else:
+                                                st.write(f"  → **{opponent_name} offensive advantage**")
+                                        
+                                        elif metric == 'adjde':
+                                            st.write(f"• **Defensive Efficiency**: {your_team} ({your_value:.1f}) vs {opponent_name} ({their_value:.1f})")
+                                            if advantage == 'team1':
+                                                st.write(f"  → **{your_team} defensive advantage**")
+                                            else:
+                                                st.write(f"  → **{opponent_name} defensive advantage**")
+                            
+                            st.markdown("---")
+                            
+                            # Game Prediction
+                            st.subheader("🎲 Game Prediction")
+                            game = report.get("prediction")
+                            
+                            if game:
+                                score = game.get("expected_score", {})
+                                col1, col2, col3 = st.columns(3)
+                                with col1:
+                                    st.metric(f"{your_team} Win Probability", f"{game.get('win_probability', 0):.1%}")
+                                with col2:
+                                    st.metric("Expected Score", f"{score.get('team', 0):.0f} - {score.get('opponent', 0):.0f}")
+                                with col3:
+                                    st.metric("Expected Margin", f"{game.get('margin', 0):+.1f}")
+                                st.caption(f"About {game.get('tempo', 0):.0f} possessions. Win probability is log5 on barthag; scores use adjusted efficiency and tempo.")
+                            else:
+                                st.warning("Could not compute a prediction for this matchup")
                             
                             st.markdown("---")
                             
@@ -535,7 +576,7 @@ def show_data_sources():
     
     # Test BartTorvik connection
     try:
-        response = requests.get(f"{API_BASE_URL}/teams/search?query=Illinois")
+        response = api_get("/teams/search?query=Illinois")
         barttorvik_status = "✅ Connected" if response.status_code == 200 else "❌ Disconnected"
         barttorvik_data = response.json().get("teams", []) if response.status_code == 200 else []
     except:
@@ -577,7 +618,16 @@ def show_data_sources():
         st.write("• `GET /teams/search?query={team_name}` - Search for teams")
         st.write("• `GET /teams/{team_name}` - Get team statistics")
         st.write("• `GET /teams/compare/{team1}/{team2}` - Compare two teams")
+        st.write("• `GET /teams/{team_name}/history?from={year}&to={year}` - Team trend across seasons")
+        st.write("• `GET /scouting/{our_team}/{opponent}?venue={home|away|neutral}` - Full game preparation report in one call")
+        st.write("• `GET /predict?team1={team}&team2={opponent}&venue={home|away|neutral}` - Predict a game")
         st.write("• `GET /teams/list` - List all available teams")
+        st.write("• `POST /teams/batch` - Many teams' statistics in one call")
+        st.write("• `GET /conferences` / `GET /conferences/{conf}` - Conference averages, spread, top teams and strength rank")
+        st.write("• `GET /teams/query?conf={conf}&adjoe_gt={n}&sort=-barthag&limit={n}` - Filter and sort teams")
+        st.write("• `GET /seasons/{year}/export?format={ndjson|csv}` - Download every team row of a season")
+        st.write("• `GET /seasons/export?from={year}&to={year}&format={ndjson|csv}` - Download several seasons")
+        st.write("• `GET /seasons/{year}.arrow` / `.parquet` - Whole season as a columnar file (see `app.client.load_seasons`)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file